@@ -10,6 +10,7 @@ Quick Start Guide:
 1. Install required packages:
    ```
    pip install requests pandas python-dotenv
+   pip install pyarrow  # optional, for as_arrow=True
    ```
 
 2. Create a .env file in your project root:
@@ -43,6 +44,25 @@ Available Methods:
 - get_copybot_follow_list(): Get Moon Dev's personal copy trading follow list (for reference only - DYOR!)
 - get_copybot_recent_transactions(): Get recent transactions from the followed wallets above
 
+Incremental Sync:
+----------------
+Calls without a limit keep a local copy of each CSV in api_data/ and only
+download what was appended since the last call. The next request asks for
+the bytes from just before the end of the local copy (HTTP Range, plus
+If-None-Match/If-Modified-Since). If the overlapping tail still matches,
+only the new rows are parsed and added to the cached DataFrame. A 304 means
+nothing changed. If the file was rewritten, or the server ignores Range,
+the whole file is downloaded as before. Instances in one process share the
+cache. Returned frames are shallow copies, so add columns freely, but
+don't edit values in place.
+
+Streaming Ingestion:
+-------------------
+Response bodies are parsed as they arrive, with the dtypes in CSV_DTYPES.
+A background thread writes the cache copy in api_data/ from the same
+chunks, so a download is neither saved and read back nor held in memory
+twice. Pass as_arrow=True to get a pyarrow Table instead of a DataFrame.
+Benchmark: python src/scripts/api_ingest_benchmark.py
 
 
 Data Details:
@@ -80,17 +100,233 @@ import numpy as np
 import traceback
 import json
 import io
+import queue
+import threading
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional, only needed for as_arrow=True
+    pa = pa_csv = None
+
 # Load environment variables
 load_dotenv()
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+SYNC_TAIL_BYTES = 512  # Bytes re-downloaded to check a cached file was only appended to
+STREAM_CHUNK_BYTES = 1 << 20  # Response body is parsed and cached in chunks of this size
+
+# Explicit dtypes skip type inference; columns an endpoint doesn't have are ignored
+CSV_DTYPES = {
+    "liq_data.csv": {
+        "symbol": "str", "side": "str", "quantity": "float64", "price": "float64",
+        "total_qty": "float64", "usd_value": "float64",
+    },
+    "funding.csv": {"symbol": "str", "funding_rate": "float64"},
+    "oi.csv": {"btc_oi": "float64", "eth_oi": "float64", "total_oi": "float64"},
+    "oi_total.csv": {"total_oi": "float64"},
+    "new_token_addresses.csv": {"token_address": "str", "symbol": "str"},
+}
+
+
+class _CacheWriter(threading.Thread):
+    """Writes downloaded chunks to the cache file off the parsing thread"""
+
+    def __init__(self, path):
+        super().__init__(daemon=True)
+        self.path = path
+        self.temp_path = path.with_name(path.name + ".part")
+        self.chunks = queue.Queue()
+        self.ok = False
+
+    def run(self):
+        with open(self.temp_path, 'wb') as f:
+            for chunk in iter(self.chunks.get, None):
+                f.write(chunk)
+        if self.ok:
+            self.temp_path.replace(self.path)
+        else:
+            self.temp_path.unlink(missing_ok=True)  # Never leave a half download as the cache
+
+    def close(self, ok):
+        self.ok = ok
+        self.chunks.put(None)
+
+
+class _ResponseStream(io.RawIOBase):
+    """File-like view of a streamed response body that also feeds the cache writer"""
+
+    def __init__(self, response, writer):
+        self.chunks = response.iter_content(chunk_size=STREAM_CHUNK_BYTES)
+        self.writer = writer
+        self.pending = b""
+        self.size = 0
+        self.header = b""
+        self.last_newline = 0  # Byte offset just past the last complete row
+
+    def readable(self):
+        return True
+
+    def _next_chunk(self):
+        for chunk in self.chunks:
+            if chunk:
+                self.writer.chunks.put(chunk)
+                if not self.header.endswith(b"\n"):
+                    self.header += chunk[:chunk.find(b"\n") + 1 or len(chunk)]
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    self.last_newline = self.size + newline + 1
+                self.size += len(chunk)
+                return chunk
+        return b""
+
+    def readinto(self, buffer):
+        if not self.pending:
+            self.pending = self._next_chunk()
+        count = min(len(buffer), len(self.pending))
+        buffer[:count] = self.pending[:count]
+        self.pending = self.pending[count:]
+        return count
+
+
+def _parse_csv(source, filename, as_arrow=False):
+    """CSV bytes or file-like to a DataFrame (or Arrow table) with the endpoint's dtypes"""
+    dtypes = CSV_DTYPES.get(filename, {})
+    if as_arrow:
+        if pa_csv is None:
+            raise ImportError("as_arrow=True needs pyarrow: pip install pyarrow")
+        column_types = {name: pa.string() if kind == "str" else pa.float64() for name, kind in dtypes.items()}
+        return pa_csv.read_csv(source, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    return pd.read_csv(source, dtype=dtypes)
+
+
+def _as_arrow(df):
+    if pa is None:
+        raise ImportError("as_arrow=True needs pyarrow: pip install pyarrow")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _stream_csv(response, cache_path, filename, as_arrow=False):
+    """Parse a streamed response body while a background thread writes the cache copy
+
+    Returns the parsed data and the stream (size, header, last_newline), whose
+    writer can be joined when the cache file has to be complete.
+    """
+    writer = _CacheWriter(cache_path)
+    writer.start()
+    stream = _ResponseStream(response, writer)
+    ok = False
+    try:
+        data = _parse_csv(io.BufferedReader(stream, STREAM_CHUNK_BYTES), filename, as_arrow)
+        ok = True
+    finally:
+        writer.close(ok)
+    return data, stream
+
+
+class _CsvMirror:
+    """Local append-only copy of one remote CSV and its parsed DataFrame"""
+
+    def __init__(self, path):
+        self.path = path
+        self.state_path = path.with_name(path.name + ".sync.json")
+        self.lock = threading.Lock()
+        self.size = 0  # Bytes of complete rows held locally
+        self.header = b""
+        self.etag = None
+        self.last_modified = None
+        self.frame = None
+
+    def load(self):
+        """Pick up the copy left by a previous run, if it's intact"""
+        try:
+            state = json.loads(self.state_path.read_text())
+            if not self.path.exists() or self.path.stat().st_size != state['size']:
+                return
+            self.frame = _parse_csv(self.path, self.path.name)
+            with open(self.path, 'rb') as f:
+                self.header = f.readline()
+            self.size = state['size']
+            self.etag = state.get('etag')
+            self.last_modified = state.get('last_modified')
+        except (OSError, ValueError, KeyError, pd.errors.ParserError):
+            self.size, self.frame = 0, None
+
+    def _save_state(self, response):
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.state_path.write_text(json.dumps({
+            'size': self.size,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+        }))
+
+    def request_headers(self):
+        """Range + conditional headers for a delta request"""
+        start = max(self.size - SYNC_TAIL_BYTES, 0)
+        headers = {'Range': f'bytes={start}-'}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return start, headers
+
+    def replace(self, response):
+        """Full download: stream it into a new frame and local copy"""
+        frame, stream = _stream_csv(response, self.path, self.path.name)
+        stream.writer.join()  # Sync state must describe the finished file
+        self.size = stream.size
+        self.header = stream.header
+        if (response.headers.get('Accept-Ranges') == 'bytes'
+                and len(self.header) < stream.last_newline < stream.size and len(frame)):
+            # A row still being written is picked up by the next delta
+            os.truncate(self.path, stream.last_newline)
+            frame = frame.iloc[:-1]
+            self.size = stream.last_newline
+        self.frame = frame
+        self._save_state(response)
+        return len(self.frame)
+
+    def extend(self, start, response):
+        """Delta download: append the new rows, or None if the file was rewritten"""
+        if not response.headers.get('Content-Range', '').startswith(f'bytes {start}-'):
+            return None
+        content = response.content
+        overlap = self.size - start
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            tail = f.read(overlap)
+        if content[:overlap] != tail:
+            return None
+
+        new = content[overlap:]
+        new = new[:new.rfind(b'\n') + 1]  # Complete rows only
+        added = 0
+        if new.strip():
+            with open(self.path, 'ab') as f:
+                f.write(new)
+            rows = _parse_csv(io.BytesIO(self.header + new), self.path.name)
+            self.frame = pd.concat([self.frame, rows], ignore_index=True)
+            added = len(rows)
+        self.size += len(new)
+        self._save_state(response)
+        return added
+
+    def view(self):
+        return self.frame.copy(deep=False)
+
+
 class MoonDevAPI:
-    def __init__(self, api_key=None, base_url="http://api.moondev.com:8000"):
-        """Initialize the API handler"""
+    # Shared by every instance so agents in one process sync each file once
+    _mirrors = {}
+    _mirrors_lock = threading.Lock()
+
+    def __init__(self, api_key=None, base_url="http://api.moondev.com:8000", quiet=False):
+        """Initialize the API handler (quiet=True keeps status lines out, errors still print)"""
+        self.quiet = quiet
         self.base_dir = PROJECT_ROOT / "src" / "agents" / "api_data"
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.api_key = api_key or os.getenv('MOONDEV_API_KEY')
@@ -98,87 +334,114 @@ class MoonDevAPI:
         self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
         self.session = requests.Session()
         
-        print("🌙 Moon Dev API: Ready to rock! 🚀")
-        print(f"📂 Cache directory: {self.base_dir.absolute()}")
-        print(f"🌐 API URL: {self.base_url}")
+        self._log("🌙 Moon Dev API: Ready to rock! 🚀")
+        self._log(f"📂 Cache directory: {self.base_dir.absolute()}")
+        self._log(f"🌐 API URL: {self.base_url}")
         if not self.api_key:
             print("⚠️ No API key found! Please set MOONDEV_API_KEY in your .env file")
         else:
-            print("🔑 API key loaded successfully!")
+            self._log("🔑 API key loaded successfully!")
 
-    def _fetch_csv(self, filename, limit=None):
+    def _log(self, message):
+        if not self.quiet:
+            print(message)
+
+    def _fetch_csv(self, filename, limit=None, as_arrow=False):
         """Fetch CSV data from the API"""
         try:
-            print(f"🚀 Moon Dev API: Fetching {filename} {'with limit '+str(limit) if limit else ''}...")
+            self._log(f"🚀 Moon Dev API: Fetching {filename} {'with limit '+str(limit) if limit else ''}...")
+            
+            if not limit:
+                df = self._sync_csv(filename)
+                return _as_arrow(df) if as_arrow else df
             
-            url = f'{self.base_url}/files/{filename}'
-            if limit:
-                url += f'?limit={limit}'
+            # The server already trims limited requests to the newest rows
+            url = f'{self.base_url}/files/{filename}?limit={limit}'
                 
-            response = self.session.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, stream=True)
             response.raise_for_status()
             
-            # Save to cache and read
-            save_path = self.base_dir / filename
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            df = pd.read_csv(save_path)
-            print(f"✨ Successfully loaded {len(df)} rows from {filename}")
+            # Parse while the cache copy is written in the background, to its own
+            # file so a partial pull never replaces the synced mirror and its state
+            cache_path = self.base_dir / f"{Path(filename).stem}.limit{Path(filename).suffix}"
+            df, _ = _stream_csv(response, cache_path, filename, as_arrow)
+            self._log(f"✨ Successfully loaded {len(df)} rows from {filename}")
             return df
                 
         except Exception as e:
             print(f"💥 Error fetching {filename}: {str(e)}")
             return None
 
-    def get_liquidation_data(self, limit=10000):
+    def _mirror(self, filename):
+        key = (self.base_url, filename)
+        with self._mirrors_lock:
+            if key not in self._mirrors:
+                self._mirrors[key] = _CsvMirror(self.base_dir / filename)
+            return self._mirrors[key]
+
+    def _sync_csv(self, filename):
+        """Bring the local copy of a CSV up to date and return it as a DataFrame"""
+        mirror = self._mirror(filename)
+        url = f'{self.base_url}/files/{filename}'
+        with mirror.lock:
+            if mirror.frame is None:
+                mirror.load()
+
+            if mirror.frame is not None:
+                start, delta_headers = mirror.request_headers()
+                response = self.session.get(url, headers={**self.headers, **delta_headers})
+                if response.status_code == 304:
+                    self._log(f"✨ {filename} unchanged, {len(mirror.frame)} cached rows")
+                    return mirror.view()
+                if response.status_code == 206:
+                    added = mirror.extend(start, response)
+                    if added is not None:
+                        self._log(f"✨ Synced {added} new rows from {filename} ({len(mirror.frame)} total)")
+                        return mirror.view()
+                    self._log(f"🔄 {filename} was rewritten on the server, downloading it again")
+                    response = None
+                elif response.status_code != 416:
+                    response.raise_for_status()  # 200 means the server ignored Range
+                else:
+                    response = None  # Remote file is shorter than ours
+            else:
+                response = None
+
+            if response is None:
+                response = self.session.get(url, headers=self.headers, stream=True)
+                response.raise_for_status()
+            rows = mirror.replace(response)
+            self._log(f"✨ Successfully loaded {rows} rows from {filename}")
+            return mirror.view()
+
+    def get_liquidation_data(self, limit=10000, as_arrow=False):
         """Get liquidation data from API, limited to last N rows by default"""
-        return self._fetch_csv("liq_data.csv", limit=limit)
+        return self._fetch_csv("liq_data.csv", limit=limit, as_arrow=as_arrow)
 
-    def get_funding_data(self):
+    def get_funding_data(self, as_arrow=False):
         """Get funding data from API"""
-        return self._fetch_csv("funding.csv")
+        return self._fetch_csv("funding.csv", as_arrow=as_arrow)
 
-    def get_token_addresses(self):
+    def get_token_addresses(self, as_arrow=False):
         """Get token addresses from API"""
-        return self._fetch_csv("new_token_addresses.csv")
+        return self._fetch_csv("new_token_addresses.csv", as_arrow=as_arrow)
 
-    def get_oi_total(self):
+    def get_oi_total(self, as_arrow=False):
         """Get total open interest data from API"""
-        return self._fetch_csv("oi_total.csv")
+        return self._fetch_csv("oi_total.csv", as_arrow=as_arrow)
 
-    def get_oi_data(self):
+    def get_oi_data(self, as_arrow=False):
         """Get detailed open interest data from API"""
         max_retries = 3
         retry_delay = 2  # seconds
         
         for attempt in range(max_retries):
             try:
-                print(f"🚀 Moon Dev API: Fetching oi.csv... (Attempt {attempt + 1}/{max_retries})")
-                
-                url = f'{self.base_url}/files/oi.csv'
-                
-                # Use stream=True and a larger chunk size
-                response = self.session.get(url, headers=self.headers, stream=True)
-                response.raise_for_status()
-                
-                # Save streamed content to a temporary file first
-                temp_file = self.base_dir / "temp_oi.csv"
-                with open(temp_file, 'wb') as f:
-                    # Use a larger chunk size for better performance
-                    for chunk in response.iter_content(chunk_size=8192*16):
-                        if chunk:
-                            f.write(chunk)
-                
-                # Once download is complete, read the file
-                df = pd.read_csv(temp_file)
-                print(f"✨ Successfully loaded {len(df)} rows from oi.csv")
+                self._log(f"🚀 Moon Dev API: Fetching oi.csv... (Attempt {attempt + 1}/{max_retries})")
                 
-                # Move temp file to final location
-                final_file = self.base_dir / "oi.csv"
-                temp_file.rename(final_file)
-                
-                return df
+                # Only rows added since the last call are downloaded
+                df = self._sync_csv("oi.csv")
+                return _as_arrow(df) if as_arrow else df
                 
             except (requests.exceptions.ChunkedEncodingError, 
                     requests.exceptions.ConnectionError,
@@ -201,14 +464,15 @@ class MoonDevAPI:
     def get_copybot_follow_list(self):
         """Get current copy trading follow list"""
         try:
-            print("📋 Moon Dev CopyBot: Fetching follow list...")
+            self._log("📋 Moon Dev CopyBot: Fetching follow list...")
             if not self.api_key:
                 print("❗ API key is required for copybot endpoints")
                 return None
                 
             response = self.session.get(
                 f"{self.base_url}/copybot/data/follow_list",
-                headers=self.headers
+                headers=self.headers,
+                stream=True
             )
             
             if response.status_code == 403:
@@ -218,13 +482,9 @@ class MoonDevAPI:
                 
             response.raise_for_status()
             
-            # Save to cache and read
-            save_path = self.base_dir / "follow_list.csv"
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            df = pd.read_csv(save_path)
-            print(f"✨ Successfully loaded {len(df)} rows from follow list")
+            # Parse while the cache copy is written in the background
+            df, _ = _stream_csv(response, self.base_dir / "follow_list.csv", "follow_list.csv")
+            self._log(f"✨ Successfully loaded {len(df)} rows from follow list")
             return df
                 
         except Exception as e:
@@ -236,14 +496,15 @@ class MoonDevAPI:
     def get_copybot_recent_transactions(self):
         """Get recent copy trading transactions"""
         try:
-            print("🔄 Moon Dev CopyBot: Fetching recent transactions...")
+            self._log("🔄 Moon Dev CopyBot: Fetching recent transactions...")
             if not self.api_key:
                 print("❗ API key is required for copybot endpoints")
                 return None
                 
             response = self.session.get(
                 f"{self.base_url}/copybot/data/recent_txs",
-                headers=self.headers
+                headers=self.headers,
+                stream=True
             )
             
             if response.status_code == 403:
@@ -253,13 +514,9 @@ class MoonDevAPI:
                 
             response.raise_for_status()
             
-            # Save to cache and read
-            save_path = self.base_dir / "recent_txs.csv"
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            df = pd.read_csv(save_path)
-            print(f"✨ Successfully loaded {len(df)} rows from recent transactions")
+            # Parse while the cache copy is written in the background
+            df, _ = _stream_csv(response, self.base_dir / "recent_txs.csv", "recent_txs.csv")
+            self._log(f"✨ Successfully loaded {len(df)} rows from recent transactions")
             return df
                 
         except Exception as e:
@@ -19,6 +19,7 @@ import openai
 from src import nice_funcs as n
 from src import nice_funcs_hl as hl
 from src.agents.base_agent import BaseAgent
+from src.data.indicators import chart_indicators
 import traceback
 import base64
 from io import BytesIO
@@ -119,13 +120,9 @@ class ChartAnalysisAgent(BaseAgent):
                 print("❌ No data available for chart generation")
                 return None
                 
-            # Calculate indicators
-            if 'SMA20' in INDICATORS:
-                df['SMA20'] = df['close'].rolling(window=20).mean()
-            if 'SMA50' in INDICATORS:
-                df['SMA50'] = df['close'].rolling(window=50).mean()
-            if 'SMA200' in INDICATORS:
-                df['SMA200'] = df['close'].rolling(window=200).mean()
+            # Calculate indicators (skipped when analyze_symbol already added them)
+            if not all(sma in df.columns for sma in ['SMA20', 'SMA50', 'SMA200']):
+                df = chart_indicators().apply(df, column='close')
             
             # Create addplot for indicators
             ap = []
@@ -323,12 +320,8 @@ class ChartAnalysisAgent(BaseAgent):
                 return
                 
             # Calculate additional indicators
-            if 'SMA20' not in data.columns:
-                data['SMA20'] = data['close'].rolling(window=20).mean()
-            if 'SMA50' not in data.columns:
-                data['SMA50'] = data['close'].rolling(window=50).mean()
-            if 'SMA200' not in data.columns:
-                data['SMA200'] = data['close'].rolling(window=200).mean()
+            if not all(sma in data.columns for sma in ['SMA20', 'SMA50', 'SMA200']):
+                data = chart_indicators().apply(data, column='close')
             
             # Generate and save chart first
             print(f"\n📊 Generating chart for {symbol} {timeframe}...")
@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 import pandas as pd
 from src.config import *
 from src.models import model_factory
+from src.data.history_store import history_store
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import json
@@ -650,7 +651,8 @@ class ChatAgent:
         self.data_dir = Path(project_root) / "src" / "data" / "chat_agent"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.knowledge_base_path = self.data_dir / "knowledge_base.txt"
-        self.chat_log_path = self.data_dir / "chat_history.csv"
+        self.chat_log_path = self.data_dir / "chat_history.csv"  # Legacy CSV, imported once
+        self.chat_log = history_store.series("chat_history")
         
         # Initialize chat memory
         self.chat_memory = []
@@ -659,9 +661,8 @@ class ChatAgent:
         if not self.knowledge_base_path.exists():
             self._create_knowledge_base()
         
-        # Create chat log if it doesn't exist
-        if not self.chat_log_path.exists():
-            self._create_chat_log()
+        # Import the old chat log CSV into the history store
+        self.chat_log.migrate_csv(self.chat_log_path)
             
         # Debug environment variables
         for key in ["OPENAI_KEY", "ANTHROPIC_KEY", "GEMINI_KEY", "GROQ_API_KEY", "DEEPSEEK_KEY", "YOUTUBE_API_KEY"]:
@@ -735,12 +736,6 @@ class ChatAgent:
         self.knowledge_base_path.write_text(initial_knowledge)
         cprint("📚 Created initial knowledge base!", "green")
         
-    def _create_chat_log(self):
-        """Create empty chat history CSV with all required columns"""
-        df = pd.DataFrame(columns=['timestamp', 'user', 'message', 'score'])
-        df.to_csv(self.chat_log_path, index=False)
-        cprint("📝 Created chat history log with all required columns!", "green")
-        
     def _announce_model(self):
         """Announce current model with eye-catching formatting"""
         model_msg = f"🤖 USING MODEL: {MODEL_TYPE.upper()} - {MODEL_NAME} 🤖"
@@ -754,7 +749,7 @@ class ChatAgent:
         return self.knowledge_base_path.read_text()
         
     def _log_chat(self, user, question, confidence, response):
-        """Log chat interaction to CSV silently"""
+        """Log chat interaction to the history store silently"""
         try:
             new_data = {
                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -764,9 +759,7 @@ class ChatAgent:
                 'response': response
             }
             
-            df = pd.read_csv(self.chat_log_path)
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            df.to_csv(self.chat_log_path, index=False)
+            self.chat_log.append(new_data)
             
         except Exception as e:
             cprint(f"❌ Error logging chat: {str(e)}", "red")
@@ -867,7 +860,7 @@ class ChatAgent:
         """
         try:
             # Read chat history
-            df = pd.read_csv(self.chat_log_path)
+            df = self.chat_log.frame()
             
             # Check if score column exists
             if not df.empty and 'score' in df.columns:
@@ -1006,7 +999,7 @@ class ChatAgent:
         🌙 MOON DEV SAYS: Let's get that chat history! 📚
         """
         try:
-            df = pd.read_csv(self.chat_log_path)
+            df = self.chat_log.frame()
             if not df.empty and 'message' in df.columns:
                 return df[df['user'] == username]['message'].tolist()
             return []
@@ -1018,17 +1011,12 @@ class ChatAgent:
         """
         🌙 MOON DEV SAYS: Saving chat history with scores! 📊
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Check if file exists and has headers
-        file_exists = os.path.exists(self.chat_log_path)
-        
-        with open(self.chat_log_path, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                # Write headers if file doesn't exist
-                writer.writerow(['timestamp', 'user', 'message', 'score'])
-            writer.writerow([timestamp, username, message, score])
+        self.chat_log.append({
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'user': username,
+            'message': message,
+            'score': score
+        })
 
 def is_meaningful_chat(new_message, chat_history, threshold=0.3):
     """
@@ -11,7 +11,6 @@ think about list
 
 import os
 import pandas as pd
-import openai
 from termcolor import colored, cprint
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
@@ -19,6 +18,8 @@ import time
 from src.config import *
 from src import nice_funcs as n
 from src.data.ohlcv_collector import collect_token_data
+from src.data.prompt_serializer import summarize_ohlcv, budget_report
+from src.models import model_factory
 
 # Data path for current copybot portfolio
 COPYBOT_PORTFOLIO_PATH = (
@@ -69,10 +70,7 @@ class CopyBotAgent:
     def __init__(self):
         """Initialize the CopyBot agent with LLM"""
         load_dotenv()
-        self.client = openai.OpenAI(
-            base_url="http://localhost:11434/v1", 
-            api_key="ollama"
-        )
+        self.llm = model_factory.get_model("ollama", AI_MODEL)
         self.recommendations_df = pd.DataFrame(
             columns=["token", "action", "confidence", "reasoning"]
         )
@@ -120,11 +118,11 @@ class CopyBotAgent:
                     print("❌ No OHLCV data found")
                     token_market_data = "No market data available"
                 else:
-                    print("✅ OHLCV data found:")
-                    print("Shape:", token_market_data.shape)
-                    print("\nFirst few rows:")
-                    print(token_market_data.head())
-                    print("\nColumns:", token_market_data.columns.tolist())
+                    print(f"✅ OHLCV data found: {len(token_market_data)} candles")
+                    # Compact summary instead of the whole frame
+                    token_market_data = summarize_ohlcv(
+                        token_market_data, PROMPT_TOKEN_BUDGET, PROMPT_RECENT_BARS
+                    )
             except Exception as e:
                 print(f"❌ Error collecting OHLCV data: {str(e)}")
                 token_market_data = "No market data available"
@@ -140,26 +138,17 @@ class CopyBotAgent:
             print("=" * 80)
             print(full_prompt)
             print("=" * 80)
+            print(budget_report("Prompt", token_market_data, PROMPT_TOKEN_BUDGET, full_prompt))
 
             print("\n🤖 Sending data to Moon Dev's AI for analysis...")
 
             # Get LLM analysis
-            message = self.client.chat.completions.create(
-                model=AI_MODEL,
-                max_tokens=AI_MAX_TOKENS,
+            response = self.llm.generate_response(
+                system_prompt="",
+                user_content=full_prompt,
                 temperature=AI_TEMPERATURE,
-                messages=[{"role": "user", "content": full_prompt}],
-            )
-
-            # Parse response
-            response = message.choices[0].message.content
-            if isinstance(response, list):
-                response = "\n".join(
-                    [
-                        item.text if hasattr(item, "text") else str(item)
-                        for item in response
-                    ]
-                )
+                max_tokens=AI_MAX_TOKENS,
+            ).content
 
             print("\n🎯 AI Analysis Results:")
             print("=" * 50)
@@ -22,11 +22,12 @@ import time
 from datetime import datetime, timedelta
 from termcolor import colored, cprint
 from dotenv import load_dotenv
-from openai import OpenAI  # Use OpenAI client for Ollama
 from pathlib import Path
 from src import nice_funcs as n
 from src import nice_funcs_hl as hl
-from src.agents.api import MoonDevAPI
+from src.data.data_bus import BusClient
+from src.models import model_factory
+from src.data.history_store import history_store
 from collections import deque
 from src.agents.base_agent import BaseAgent
 import traceback
@@ -109,18 +110,15 @@ class FundingAgent(BaseAgent):
                 
         load_dotenv()
         
-        # Initialize Ollama client
-        self.client = OpenAI(
-            base_url="http://localhost:11434/v1",  # Ollama's OpenAI-compatible endpoint
-            api_key="ollama"  # API key is not required for Ollama
-        )
+        # Local Ollama model, shared with the other agents through the model factory
+        self.llm = model_factory.get_model("ollama", self.ai_model)
         
         # Initialize pyttsx3 TTS engine
         self.tts_engine = pyttsx3.init()
         self.tts_engine.setProperty('rate', 150)  # Speed of speech
         self.tts_engine.setProperty('volume', 1.0)  # Volume level (0.0 to 1.0)
         
-        self.api = MoonDevAPI()
+        self.api = BusClient(interval=CHECK_INTERVAL_MINUTES * 60)  # Feeds shared through the data bus
         
         # Create data directories if they don't exist
         self.audio_dir = PROJECT_ROOT / "src" / "audio"
@@ -129,7 +127,7 @@ class FundingAgent(BaseAgent):
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize or load historical data
-        self.history_file = self.data_dir / "funding_history.csv"
+        self.history = history_store.series("funding_history", time_column="event_time")
         self.load_history()
         
         print("💰 Fran the Funding Agent initialized!")
@@ -184,17 +182,14 @@ class FundingAgent(BaseAgent):
             print(f"\n🤖 Analyzing {symbol} with AI...")
             
             # Use Ollama client for AI analysis
-            response = self.client.chat.completions.create(
-                model=self.ai_model,
-                messages=[
-                    {"role": "system", "content": FUNDING_ANALYSIS_PROMPT},
-                    {"role": "user", "content": context}
-                ],
-                max_tokens=self.ai_max_tokens,
-                temperature=self.ai_temperature
+            response = self.llm.generate_response(
+                system_prompt=FUNDING_ANALYSIS_PROMPT,
+                user_content=context,
+                temperature=self.ai_temperature,
+                max_tokens=self.ai_max_tokens
             )
             
-            content = response.choices[0].message.content.strip()
+            content = response.content.strip()
             
             # Debug: Print raw response
             print("\n🔍 Raw response:")
@@ -335,15 +330,14 @@ class FundingAgent(BaseAgent):
     def load_history(self):
         """Load or initialize historical funding rate data"""
         try:
-            # Always start with clean history using the new format
-            self.funding_history = pd.DataFrame(columns=['timestamp', 'symbol', 'funding_rate', 'annual_rate'])
-            print("📝 Initialized new funding rate history")
-            
-            if self.history_file.exists():
-                # Keep just one backup file
-                backup_file = self.data_dir / "funding_history_backup.csv"
-                os.rename(self.history_file, backup_file)
-                print(f"📦 Backed up old history file")
+            # Keep only last 24 hours of data
+            self.history.prune(max_age=timedelta(hours=24))
+            self.funding_history = self.history.frame()
+            if self.funding_history.empty:
+                self.funding_history = pd.DataFrame(columns=['event_time'])
+                print("📝 Initialized new funding rate history")
+            else:
+                print(f"📈 Loaded {len(self.funding_history)} funding rate records")
                 
         except Exception as e:
             print(f"❌ Error loading history: {str(e)}")
@@ -409,8 +403,12 @@ class FundingAgent(BaseAgent):
                 # Sort by event_time
                 self.funding_history = self.funding_history.sort_values('event_time')
                 
-                # Save to file
-                self.funding_history.to_csv(self.history_file, index=False)
+                # Append only a new event_time to the store (same dedupe as above)
+                row = wide_data.iloc[0].to_dict()
+                last = self.history.last()
+                if last is None or str(last.get('event_time')) != str(row['event_time']):
+                    self.history.append(row)
+                self.history.prune(max_age=timedelta(hours=24))
                 
         except Exception as e:
             print(f"❌ Error saving to history: {str(e)}")
@@ -13,13 +13,14 @@ import time
 from datetime import datetime, timedelta, timezone
 from termcolor import colored, cprint
 from dotenv import load_dotenv
-from openai import OpenAI  # Use OpenAI client for Ollama
 from pathlib import Path
 from src import nice_funcs as n
 from src import nice_funcs_hl as hl
-from src.agents.api import MoonDevAPI
+from src.data.data_bus import BusClient
 from collections import deque
 from src.agents.base_agent import BaseAgent
+from src.models import model_factory
+from src.data.history_store import history_store
 import traceback
 import numpy as np
 import pyttsx3  # Add pyttsx3 for TTS
@@ -28,8 +29,10 @@ import pyttsx3  # Add pyttsx3 for TTS
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 # Configuration
-CHECK_INTERVAL_MINUTES = 10  # How often to check liquidations
-LIQUIDATION_ROWS = 10000  # Number of rows to fetch each time
+CHECK_INTERVAL_MINUTES = 10  # How often to check liquidations (fractions work, e.g. 0.5 = 30s)
+LIQUIDATION_ROWS = 10000  # Rows fetched on the first check
+LIQUIDATION_DELTA_ROWS = 2000  # Newest rows fetched on later checks (only unseen ones are kept)
+LIQUIDATION_WINDOWS = [15, 60, 240]  # Minutes, every window is totalled in one pass
 LIQUIDATION_THRESHOLD = (
     0.5  # Multiplier for average liquidation to detect significant events
 )
@@ -38,7 +41,7 @@ LIQUIDATION_THRESHOLD = (
 TIMEFRAME = "15m"  # Candlestick timeframe
 LOOKBACK_BARS = 100  # Number of candles to analyze
 
-# Select which time window to use for comparisons (options: 15, 60, 240)
+# Select which time window to use for comparisons (must be one of LIQUIDATION_WINDOWS)
 # 15 = 15 minutes (most reactive to sudden changes)
 # 60 = 1 hour (medium-term changes)
 # 240 = 4 hours (longer-term changes)
@@ -82,6 +85,61 @@ Consider the ratio of long vs short liquidations and their relative changes.
 **IMPORTANT**: Do NOT include "LINE 1:", "LINE 2:", or "LINE 3:". Output only the required text on three lines.
 """
 
+LIQUIDATION_COLUMNS = [
+    "symbol",
+    "side",
+    "type",
+    "time_in_force",
+    "quantity",
+    "price",
+    "price2",
+    "status",
+    "filled_qty",
+    "total_qty",
+    "timestamp",
+    "usd_value",
+]
+
+
+def liquidation_windows(timestamps_ms, sides, usd_values, now_ms, windows_minutes):
+    """USD totals and event counts per side for every trailing window, in one pass
+
+    Each side is sorted by time once and cumulatively summed, so each window is
+    two searchsorted lookups instead of a fresh boolean mask over the frame.
+    SELL side = long liquidation, BUY side = short liquidation.
+    Returns {minutes: {"longs", "shorts", "long_events", "short_events"}}.
+    """
+    timestamps_ms = np.asarray(timestamps_ms, dtype=np.float64)
+    usd_values = np.nan_to_num(np.asarray(usd_values, dtype=np.float64))
+    sides = np.asarray(sides)
+    cutoffs = now_ms - np.asarray(windows_minutes, dtype=np.float64) * 60_000
+
+    per_side = {}
+    for side, name in (("SELL", "longs"), ("BUY", "shorts")):
+        mask = sides == side
+        order = np.argsort(timestamps_ms[mask], kind="stable")
+        ts = timestamps_ms[mask][order]
+        cumulative = np.concatenate(([0.0], np.cumsum(usd_values[mask][order])))
+        start = np.searchsorted(ts, cutoffs, side="left")
+        per_side[name] = (cumulative[-1] - cumulative[start], len(ts) - start)
+
+    return {
+        minutes: {
+            "longs": float(per_side["longs"][0][i]),
+            "shorts": float(per_side["shorts"][0][i]),
+            "long_events": int(per_side["longs"][1][i]),
+            "short_events": int(per_side["shorts"][1][i]),
+        }
+        for i, minutes in enumerate(windows_minutes)
+    }
+
+
+def _window_label(minutes):
+    if minutes < 60 or minutes % 60:
+        return f"Last {minutes}min"
+    hours = minutes // 60
+    return f"Last {hours}hr{'s' if hours > 1 else ''}"
+
 
 class LiquidationAgent(BaseAgent):
     """Luna the Liquidation Monitor 🌊"""
@@ -115,13 +173,10 @@ class LiquidationAgent(BaseAgent):
 
         load_dotenv()
 
-        # Initialize Ollama client
-        self.client = OpenAI(
-            base_url="http://localhost:11434/v1",  # Ollama's OpenAI-compatible endpoint
-            api_key="ollama",  # API key is not required for Ollama
-        )
+        # Local Ollama model, shared with the other agents through the model factory
+        self.llm = model_factory.get_model("ollama", self.ai_model)
 
-        self.api = MoonDevAPI()
+        self.api = BusClient(interval=CHECK_INTERVAL_MINUTES * 60)  # Feeds shared through the data bus
 
         # Create data directories if they don't exist
         self.audio_dir = PROJECT_ROOT / "src" / "audio"
@@ -130,7 +185,8 @@ class LiquidationAgent(BaseAgent):
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize or load historical data
-        self.history_file = self.data_dir / "liquidation_history.csv"
+        self.history = history_store.series("liquidation_history")
+        self.liq_rows = None  # Recent liquidation events, grown incrementally
         self.load_history()
 
         # Initialize pyttsx3 TTS engine
@@ -151,9 +207,12 @@ class LiquidationAgent(BaseAgent):
     def load_history(self):
         """Load or initialize historical liquidation data"""
         try:
-            if self.history_file.exists():
-                self.liquidation_history = pd.read_csv(self.history_file)
+            # One-time import of the old CSV, then keep only last 24 hours
+            self.history.migrate_csv(self.data_dir / "liquidation_history.csv")
+            self.history.prune(max_age=timedelta(hours=24))
+            self.liquidation_history = self.history.frame()
 
+            if not self.liquidation_history.empty:
                 # Handle transition from old format to new format
                 if "long_size" not in self.liquidation_history.columns:
                     print(
@@ -174,15 +233,7 @@ class LiquidationAgent(BaseAgent):
                 self.liquidation_history = pd.DataFrame(
                     columns=["timestamp", "long_size", "short_size", "total_size"]
                 )
-                print("📝 Created new liquidation history file")
-
-            # Clean up old data (keep only last 24 hours)
-            if not self.liquidation_history.empty:
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.liquidation_history = self.liquidation_history[
-                    pd.to_datetime(self.liquidation_history["timestamp"]) > cutoff_time
-                ]
-                self.liquidation_history.to_csv(self.history_file, index=False)
+                print("📝 Started new liquidation history")
 
         except Exception as e:
             print(f"❌ Error loading history: {str(e)}")
@@ -190,91 +241,70 @@ class LiquidationAgent(BaseAgent):
                 columns=["timestamp", "long_size", "short_size", "total_size"]
             )
 
+    def _fetch_liquidations(self):
+        """Rolling frame of recent liquidations, only downloading rows we haven't seen
+
+        The first call (or a gap bigger than one delta fetch) pulls
+        LIQUIDATION_ROWS rows; after that only the newest LIQUIDATION_DELTA_ROWS.
+        Rows older than the largest window are dropped.
+        """
+        full = self.liq_rows is None or self.liq_rows.empty
+        df = self.api.get_liquidation_data(limit=LIQUIDATION_ROWS if full else LIQUIDATION_DELTA_ROWS)
+        if df is None or df.empty:
+            return self.liq_rows
+
+        df.columns = LIQUIDATION_COLUMNS
+        df["timestamp"] = pd.to_numeric(df["timestamp"], errors="coerce")
+        df = df.dropna(subset=["timestamp"])
+
+        if not full:
+            last_ts = self.liq_rows["timestamp"].iloc[-1]
+            if df["timestamp"].min() > last_ts:
+                # More rows arrived than one delta fetch covers, start over
+                print("⚠️ Liquidation feed moved past our delta window, refetching")
+                self.liq_rows = None
+                return self._fetch_liquidations()
+            # Events sharing the last timestamp we saw may be partly new, skip as many as we already have
+            seen_at_last = int((self.liq_rows["timestamp"] == last_ts).sum())
+            fresh = pd.concat([
+                df[df["timestamp"] == last_ts].iloc[seen_at_last:],
+                df[df["timestamp"] > last_ts],
+            ])
+            df = pd.concat([self.liq_rows, fresh], ignore_index=True)
+            print(f"📥 {len(fresh)} new liquidation events")
+
+        df = df.sort_values("timestamp", kind="stable")
+        cutoff = time.time() * 1000 - max(LIQUIDATION_WINDOWS) * 60_000
+        self.liq_rows = df[df["timestamp"] >= cutoff].reset_index(drop=True)
+        return self.liq_rows
+
     def _get_current_liquidations(self):
         """Get current liquidation data"""
         try:
             print("\n🔍 Fetching fresh liquidation data...")
-            df = self.api.get_liquidation_data(limit=LIQUIDATION_ROWS)
+            df = self._fetch_liquidations()
 
             if df is not None and not df.empty:
-                # Set column names
-                df.columns = [
-                    "symbol",
-                    "side",
-                    "type",
-                    "time_in_force",
-                    "quantity",
-                    "price",
-                    "price2",
-                    "status",
-                    "filled_qty",
-                    "total_qty",
-                    "timestamp",
-                    "usd_value",
-                ]
-
-                # Convert timestamp to datetime (UTC)
-                df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
-                current_time = datetime.utcnow()
-                
-                # Calculate time windows
-                fifteen_min = current_time - timedelta(minutes=15)
-                one_hour = current_time - timedelta(hours=1)
-                four_hours = current_time - timedelta(hours=4)
-
-                # Separate long and short liquidations
-                longs = df[df["side"] == "SELL"]  # SELL side = long liquidation
-                shorts = df[df["side"] == "BUY"]  # BUY side = short liquidation
-
-                # Calculate totals for each time window and type
-                fifteen_min_longs = longs[longs["datetime"] >= fifteen_min][
-                    "usd_value"
-                ].sum()
-                fifteen_min_shorts = shorts[shorts["datetime"] >= fifteen_min][
-                    "usd_value"
-                ].sum()
-                one_hour_longs = longs[longs["datetime"] >= one_hour]["usd_value"].sum()
-                one_hour_shorts = shorts[shorts["datetime"] >= one_hour][
-                    "usd_value"
-                ].sum()
-                four_hour_longs = longs[longs["datetime"] >= four_hours][
-                    "usd_value"
-                ].sum()
-                four_hour_shorts = shorts[shorts["datetime"] >= four_hours][
-                    "usd_value"
-                ].sum()
-
-                # Get event counts
-                fifteen_min_long_events = len(longs[longs["datetime"] >= fifteen_min])
-                fifteen_min_short_events = len(
-                    shorts[shorts["datetime"] >= fifteen_min]
+                windows = liquidation_windows(
+                    df["timestamp"].to_numpy(),
+                    df["side"].to_numpy(),
+                    df["usd_value"].to_numpy(),
+                    time.time() * 1000,
+                    LIQUIDATION_WINDOWS,
                 )
-                one_hour_long_events = len(longs[longs["datetime"] >= one_hour])
-                one_hour_short_events = len(shorts[shorts["datetime"] >= one_hour])
-                four_hour_long_events = len(longs[longs["datetime"] >= four_hours])
-                four_hour_short_events = len(shorts[shorts["datetime"] >= four_hours])
+                current = windows[COMPARISON_WINDOW]
 
                 # Calculate percentage change for active window
                 pct_change_longs = 0
                 pct_change_shorts = 0
                 if not self.liquidation_history.empty:
                     previous_record = self.liquidation_history.iloc[-1]
-                    if COMPARISON_WINDOW == 60:
-                        current_longs = one_hour_longs
-                        current_shorts = one_hour_shorts
-                    elif COMPARISON_WINDOW == 240:
-                        current_longs = four_hour_longs
-                        current_shorts = four_hour_shorts
-                    else:
-                        current_longs = fifteen_min_longs
-                        current_shorts = fifteen_min_shorts
-
                     if (
                         "long_size" in previous_record
                         and previous_record["long_size"] > 0
                     ):
                         pct_change_longs = (
-                            (current_longs - previous_record["long_size"])
+                            (current["longs"] - previous_record["long_size"])
                             / previous_record["long_size"]
                         ) * 100
                     if (
@@ -282,7 +312,7 @@ class LiquidationAgent(BaseAgent):
                         and previous_record["short_size"] > 0
                     ):
                         pct_change_shorts = (
-                            (current_shorts - previous_record["short_size"])
+                            (current["shorts"] - previous_record["short_size"])
                             / previous_record["short_size"]
                         ) * 100
 
@@ -293,128 +323,24 @@ class LiquidationAgent(BaseAgent):
                 )
                 print("╠" + "═" * 70 + "╣")
 
-                # Format each line based on which window is active
-                if COMPARISON_WINDOW == 15:
-                    print(
-                        f"║  Last 15min LONGS:  ${fifteen_min_longs:,.2f} ({fifteen_min_long_events} events) [{pct_change_longs:+.1f}%]".ljust(
-                            71
-                        )
-                        + "║"
-                    )
+                # The comparison window also shows its change from the previous record
+                for minutes, totals in windows.items():
+                    label = _window_label(minutes)
+                    long_change = f" [{pct_change_longs:+.1f}%]" if minutes == COMPARISON_WINDOW else ""
+                    short_change = f" [{pct_change_shorts:+.1f}%]" if minutes == COMPARISON_WINDOW else ""
                     print(
-                        f"║  Last 15min SHORTS: ${fifteen_min_shorts:,.2f} ({fifteen_min_short_events} events) [{pct_change_shorts:+.1f}%]".ljust(
-                            71
-                        )
+                        f"║  {(label + ' LONGS:').ljust(19)}${totals['longs']:,.2f} ({totals['long_events']} events){long_change}".ljust(71)
                         + "║"
                     )
                     print(
-                        f"║  Last 1hr LONGS:    ${one_hour_longs:,.2f} ({one_hour_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 1hr SHORTS:   ${one_hour_shorts:,.2f} ({one_hour_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs LONGS:   ${four_hour_longs:,.2f} ({four_hour_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs SHORTS:  ${four_hour_shorts:,.2f} ({four_hour_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                elif COMPARISON_WINDOW == 60:
-                    print(
-                        f"║  Last 15min LONGS:  ${fifteen_min_longs:,.2f} ({fifteen_min_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 15min SHORTS: ${fifteen_min_shorts:,.2f} ({fifteen_min_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 1hr LONGS:    ${one_hour_longs:,.2f} ({one_hour_long_events} events) [{pct_change_longs:+.1f}%]".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 1hr SHORTS:   ${one_hour_shorts:,.2f} ({one_hour_short_events} events) [{pct_change_shorts:+.1f}%]".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs LONGS:   ${four_hour_longs:,.2f} ({four_hour_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs SHORTS:  ${four_hour_shorts:,.2f} ({four_hour_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                else:  # 240 minutes (4 hours)
-                    print(
-                        f"║  Last 15min LONGS:  ${fifteen_min_longs:,.2f} ({fifteen_min_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 15min SHORTS: ${fifteen_min_shorts:,.2f} ({fifteen_min_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 1hr LONGS:    ${one_hour_longs:,.2f} ({one_hour_long_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 1hr SHORTS:   ${one_hour_shorts:,.2f} ({one_hour_short_events} events)".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs LONGS:   ${four_hour_longs:,.2f} ({four_hour_long_events} events) [{pct_change_longs:+.1f}%]".ljust(
-                            71
-                        )
-                        + "║"
-                    )
-                    print(
-                        f"║  Last 4hrs SHORTS:  ${four_hour_shorts:,.2f} ({four_hour_short_events} events) [{pct_change_shorts:+.1f}%]".ljust(
-                            71
-                        )
+                        f"║  {(label + ' SHORTS:').ljust(19)}${totals['shorts']:,.2f} ({totals['short_events']} events){short_change}".ljust(71)
                         + "║"
                     )
 
                 print("╚" + "═" * 70 + "╝")
 
-                # Return the totals based on selected comparison window
-                if COMPARISON_WINDOW == 60:
-                    return one_hour_longs, one_hour_shorts
-                elif COMPARISON_WINDOW == 240:
-                    return four_hour_longs, four_hour_shorts
-                else:  # Default to 15 minutes
-                    return fifteen_min_longs, fifteen_min_shorts
+                # Return the totals for the selected comparison window
+                return current["longs"], current["shorts"]
             return None, None
 
         except Exception as e:
@@ -464,30 +390,18 @@ class LiquidationAgent(BaseAgent):
             print(f"\n🤖 Analyzing liquidation spike with AI...")
             
             # Get AI analysis using instance settings
-            ai_response = self.client.chat.completions.create(
-                model=self.ai_model,
-                max_tokens=self.ai_max_tokens,
+            ai_response = self.llm.generate_response(
+                system_prompt="",
+                user_content=context,
                 temperature=self.ai_temperature,
-                messages=[{
-                    "role": "user",
-                    "content": context
-                }]
+                max_tokens=self.ai_max_tokens
             )
             
             # Handle response
-            if not ai_response or not ai_response.choices[0].message.content:
+            if not ai_response or not ai_response.content:
                 print("❌ No response from AI")
                 return None
-                
-            # Handle TextBlock response
-            response = ai_response.choices[0].message.content
-            if isinstance(response, list):
-                # If it's a list of TextBlocks, get the text from the first one
-                if len(response) > 0 and hasattr(response[0], 'text'):
-                    response = response[0].text
-                else:
-                    print("❌ Invalid response format from AI")
-                    return None
+            response = ai_response.content
                     
             # Parse response - handle both newline and period-based splits
             lines = [line.strip() for line in response.split('\n') if line.strip()]
@@ -579,16 +493,13 @@ class LiquidationAgent(BaseAgent):
         try:
             if long_size is not None and short_size is not None:
                 # Create new row
-                new_row = pd.DataFrame(
-                    [
-                        {
-                            "timestamp": datetime.now(),
-                            "long_size": long_size,
-                            "short_size": short_size,
-                            "total_size": long_size + short_size,
-                        }
-                    ]
-                )
+                row = {
+                    "timestamp": datetime.now(),
+                    "long_size": long_size,
+                    "short_size": short_size,
+                    "total_size": long_size + short_size,
+                }
+                new_row = pd.DataFrame([row])
 
                 # Add to history
                 if self.liquidation_history.empty:
@@ -604,8 +515,9 @@ class LiquidationAgent(BaseAgent):
                     pd.to_datetime(self.liquidation_history["timestamp"]) > cutoff_time
                 ]
 
-                # Save to file
-                self.liquidation_history.to_csv(self.history_file, index=False)
+                # Append to the store instead of rewriting the whole file
+                self.history.append(row)
+                self.history.prune(max_age=timedelta(hours=24))
 
         except Exception as e:
             print(f"❌ Error saving to history: {str(e)}")
@@ -42,13 +42,15 @@ import pandas as pd
 import json
 from termcolor import colored, cprint
 import time
-import openai
 from dotenv import load_dotenv
 from src import nice_funcs as n
 from src.data.ohlcv_collector import collect_all_tokens
+from src.data.prompt_serializer import summarize_ohlcv, budget_report
+from src.data.history_store import history_store
 from datetime import datetime, timedelta
 from src.config import *
 from src.agents.base_agent import BaseAgent
+from src.models import model_factory, ModelRouter
 
 # Load environment variables
 load_dotenv()
@@ -61,8 +63,13 @@ class RiskAgent(BaseAgent):
 
         self.override_active = False
         self.last_override_check = None
-        self.client = openai.OpenAI(
-            base_url="http://localhost:11434/v1", api_key="ollama"
+        self.llm = model_factory.get_model("ollama", AI_MODEL)
+        # Override checks gate closing positions, so a bounded answer time
+        # matters more than which model gives it
+        self.override_router = ModelRouter(
+            MODEL_ROUTER_CANDIDATES,
+            hedge_after=RISK_AI_HEDGE_SECONDS,
+            deadline=RISK_AI_DEADLINE_SECONDS,
         )
 
         # Initialize start balance using portfolio value
@@ -77,15 +84,9 @@ class RiskAgent(BaseAgent):
         total_value = 0.0
 
         try:
-            # Get USDC balance first
-            usdc_value = n.get_token_balance_usd(USDC_ADDRESS)
-            total_value += usdc_value
-
-            # Get balance of each monitored token
-            for token in MONITORED_TOKENS:
-                if token != USDC_ADDRESS:  # Skip USDC as we already counted it
-                    token_value = n.get_token_balance_usd(token)
-                    total_value += token_value
+            # One wallet scan covers USDC and every monitored token
+            snapshot = n.get_portfolio_snapshot()
+            total_value = snapshot.total_value([USDC_ADDRESS] + MONITORED_TOKENS)
 
             return total_value
 
@@ -96,41 +97,30 @@ class RiskAgent(BaseAgent):
     def log_daily_balance(self):
         """Log portfolio value if not logged in past check period"""
         try:
-            # Create data directory if it doesn't exist
-            os.makedirs("src/data", exist_ok=True)
-            balance_file = "src/data/portfolio_balance.csv"
+            balances = history_store.series("portfolio_balance")
+            balances.migrate_csv("src/data/portfolio_balance.csv")
 
             # Check if we already have a recent log
-            if os.path.exists(balance_file):
-                df = pd.read_csv(balance_file)
-                if not df.empty:
-                    df["timestamp"] = pd.to_datetime(df["timestamp"])
-                    last_log = df["timestamp"].max()
-                    hours_since_log = (datetime.now() - last_log).total_seconds() / 3600
-
-                    if hours_since_log < MAX_LOSS_GAIN_CHECK_HOURS:
-                        cprint(
-                            f"✨ Recent balance log found ({hours_since_log:.1f} hours ago)",
-                            "white",
-                            "on_blue",
-                        )
-                        return
-            else:
-                df = pd.DataFrame(columns=["timestamp", "balance"])
+            last_log = balances.last_time()
+            if last_log is not None:
+                hours_since_log = (datetime.now() - last_log).total_seconds() / 3600
+
+                if hours_since_log < MAX_LOSS_GAIN_CHECK_HOURS:
+                    cprint(
+                        f"✨ Recent balance log found ({hours_since_log:.1f} hours ago)",
+                        "white",
+                        "on_blue",
+                    )
+                    return
 
             # Get current portfolio value
             current_value = self.get_portfolio_value()
 
-            # Add new row
-            new_row = {
+            # Append the new row (no rewrite of the whole log)
+            balances.append({
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "balance": current_value,
-            }
-            df = pd.concat([df, pd.DataFrame([new_row], columns=df.columns)], ignore_index=True)
-
-
-            # Save updated log
-            df.to_csv(balance_file, index=False)
+            })
             cprint(
                 f"💾 New portfolio balance logged: ${current_value:.2f}",
                 "white",
@@ -149,9 +139,11 @@ class RiskAgent(BaseAgent):
             # Get 2h of 5m data
             data_5m = n.get_data(token, 0.083, "5m")  # 2 hours = 0.083 days
 
+            # Compact summaries, half the per-token budget for each timeframe
+            budget = PROMPT_TOKEN_BUDGET // 2
             return {
-                "15m": data_15m.to_dict() if data_15m is not None else None,
-                "5m": data_5m.to_dict() if data_5m is not None else None,
+                "15m": summarize_ohlcv(data_15m, budget, PROMPT_RECENT_BARS) if data_15m is not None else None,
+                "5m": summarize_ohlcv(data_5m, budget, PROMPT_RECENT_BARS) if data_5m is not None else None,
             }
         except Exception as e:
             cprint(f"❌ Error getting data for {token}: {str(e)}", "white", "on_red")
@@ -209,24 +201,22 @@ class RiskAgent(BaseAgent):
                 return False
 
             # Format data for AI analysis
-            prompt = RISK_OVERRIDE_PROMPT.format(
-                limit_type=limit_type, position_data=json.dumps(position_data, indent=2)
+            position_text = "\n\n".join(
+                f"{token} (${info['value_usd']:.2f})\n"
+                + "\n".join(f"[{tf}]\n{summary or 'no data'}" for tf, summary in info["data"].items())
+                for token, info in position_data.items()
             )
+            prompt = RISK_OVERRIDE_PROMPT.format(limit_type=limit_type, position_data=position_text)
+            print(budget_report("Override prompt", position_text, PROMPT_TOKEN_BUDGET * len(position_data), prompt))
 
             cprint("🤖 AI Agent analyzing market data...", "white", "on_green")
-            response = self.client.chat.completions.create(
-                model="llama3.2",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are Moon Dev's Risk Management AI. Analyze market data and provide clear OVERRIDE or RESPECT_LIMIT decisions.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],  # Use the Llama2 model
+            response = self.override_router.generate_response(
+                system_prompt="You are Moon Dev's Risk Management AI. Analyze market data and provide clear OVERRIDE or RESPECT_LIMIT decisions.",
+                user_content=prompt,
             )
 
             # Get the response content and ensure it's a string
-            response = str(response["response"]) if response else ""
+            response = str(response.content) if response else ""
             self.last_override_check = datetime.now()
 
             # Check if we should override (keep positions open)
@@ -441,11 +431,9 @@ class RiskAgent(BaseAgent):
                 },
             ]
 
-            response = self.client.chat.completions.create(
-                model=AI_MODEL, messages=messages, temperature=0.7, max_tokens=150
-            )
-
-            response_text = response.choices[0].message.content
+            response_text = self.llm.generate_response(
+                messages[0]["content"], messages[1]["content"], temperature=0.7, max_tokens=150
+            ).content
 
             print("\n🤖 AI Risk Assessment:")
             print("=" * 50)
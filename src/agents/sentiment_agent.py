@@ -15,12 +15,17 @@ Required:
 TOKENS_TO_TRACK = ["solana", "bitcoin", "ethereum", "xrp"]  # Add tokens you want to track
 TWEETS_PER_RUN = 30  # Number of tweets to collect per run
 DATA_FOLDER = "src/data/sentiment"  # Where to store sentiment data
-SENTIMENT_HISTORY_FILE = "src/data/sentiment_history.csv"  # Store sentiment scores over time
+SENTIMENT_HISTORY_FILE = "src/data/sentiment_history.csv"  # Legacy CSV, imported once into the history store
 IGNORE_LIST = ['t.co', 'discord', 'join', 'telegram', 'discount', 'pay']
 CHECK_INTERVAL_MINUTES = 15  # How often to run sentiment analysis
 
 # Sentiment settings
 SENTIMENT_ANNOUNCE_THRESHOLD = 0.4  # Announce vocally if abs(sentiment) > this value (-1 to 1 scale)
+SENTIMENT_CACHE_HOURS = 24  # Reuse a tweet's score for this long instead of rescoring it
+SENTIMENT_MODE = "llm"  # "llm" scores tweets in batched Ollama prompts, "lexicon" skips the LLM entirely
+SENTIMENT_BATCH_SIZE = 15  # Tweets packed into one LLM prompt
+SENTIMENT_MODEL = "llama2"  # Ollama model used for scoring
+SENTIMENT_TEMPERATURE = 0  # Deterministic scoring, so cached scores follow the shared cache policy
 
 # Voice settings (using pyttsx3)
 VOICE_NAME = "english"  # pyttsx3 voice name (platform-dependent)
@@ -34,6 +39,8 @@ from termcolor import cprint
 import time
 from datetime import datetime, timedelta
 import csv 
+import json
+import re
 from random import randint
 import pathlib
 import asyncio
@@ -42,6 +49,8 @@ import numpy as np
 import ollama  # Open-source LLM alternative
 import pyttsx3  # Open-source TTS alternative
 from pathlib import Path
+from src.models.response_cache import response_cache, cache_key
+from src.data.history_store import history_store
 
 # Create data directory if it doesn't exist
 pathlib.Path(DATA_FOLDER).mkdir(parents=True, exist_ok=True)
@@ -89,6 +98,46 @@ httpx.Client = patched_client
 # imports 
 from twikit import Client, TooManyRequests, BadRequest
 
+# Lexicon for the LLM-free scorer and for tweets the LLM fails to score
+POSITIVE_WORDS = {
+    'bull', 'bullish', 'moon', 'mooning', 'pump', 'pumping', 'buy', 'buying', 'long', 'breakout',
+    'rally', 'gain', 'gains', 'green', 'ath', 'up', 'higher', 'strong', 'growth', 'win', 'winning',
+    'profit', 'love', 'great', 'good', 'amazing', 'bullrun', 'rocket', 'undervalued', 'accumulate',
+    'hodl', 'support', 'adoption', 'upgrade', 'soar', 'soaring', 'surge', 'surging', 'rebound',
+}
+NEGATIVE_WORDS = {
+    'bear', 'bearish', 'dump', 'dumping', 'sell', 'selling', 'short', 'crash', 'crashing', 'red',
+    'loss', 'losses', 'down', 'lower', 'weak', 'scam', 'rug', 'rugpull', 'hack', 'hacked', 'fear',
+    'panic', 'bad', 'terrible', 'overvalued', 'bubble', 'dead', 'rekt', 'liquidated', 'plunge',
+    'plunging', 'collapse', 'fraud', 'ban', 'lawsuit', 'exploit', 'fud', 'capitulation',
+}
+BATCH_SENTIMENT_PROMPT = """Score the sentiment of each numbered tweet from -1 (very negative) to 1 (very positive).
+Respond with ONLY a JSON array of {count} numbers, one per tweet, in the same order. No other text.
+
+{tweets}"""
+
+def lexicon_scores(texts):
+    """Word-list sentiment in [-1, 1] per text, (pos - neg) / (pos + neg)"""
+    counts = np.array([
+        [sum(w in POSITIVE_WORDS for w in words), sum(w in NEGATIVE_WORDS for w in words)]
+        for words in (re.findall(r"[a-z]+", text.lower()) for text in texts)
+    ], dtype=float).reshape(-1, 2)
+    total = counts.sum(axis=1)
+    return np.divide(counts[:, 0] - counts[:, 1], total, out=np.zeros(len(counts)), where=total > 0)
+
+def parse_score_array(response, count):
+    """Scores from the model's JSON array, or None if it is not count numbers"""
+    match = re.search(r"\[.*?\]", response or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        scores = [float(score) for score in json.loads(match.group(0))]
+    except (ValueError, TypeError):
+        return None
+    if len(scores) != count:
+        return None
+    return [max(-1.0, min(1.0, score)) for score in scores]
+
 class SentimentAgent:
     def __init__(self):
         """Initialize the Sentiment Agent"""
@@ -99,42 +148,72 @@ class SentimentAgent:
         self.audio_dir = Path("src/audio")
         self.audio_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize sentiment history file
-        if not os.path.exists(SENTIMENT_HISTORY_FILE):
-            pd.DataFrame(columns=['timestamp', 'sentiment_score', 'num_tweets']).to_csv(SENTIMENT_HISTORY_FILE, index=False)
+        # Sentiment history lives in the shared history store
+        self.history = history_store.series("sentiment_history")
+        self.history.migrate_csv(SENTIMENT_HISTORY_FILE)
         
         cprint("🌙 Moon Dev's Sentiment Agent initialized!", "green")
         
     def analyze_sentiment(self, texts):
         """Analyze sentiment of a batch of texts using Ollama"""
         try:
-            cprint("🤖 Analyzing sentiment with Ollama...", "cyan")
-            sentiment_scores = []
+            if not texts:
+                return 0.0  # Neutral if nothing to score
             
-            for text in texts:
-                # Use Ollama to analyze sentiment
-                response = ollama.generate(
-                    model="llama2",  # Use the Llama2 model
-                    prompt=f"Analyze the sentiment of this text and respond with a single number between -1 (very negative) and 1 (very positive):\n\n{text}"
-                )
-                
-                # Extract the sentiment score from the response
-                try:
-                    sentiment_score = float(response['response'].strip())
-                    sentiment_scores.append(sentiment_score)
-                except ValueError:
-                    cprint(f"⚠️ Could not parse sentiment score from response: {response['response']}", "yellow")
-                    continue
-            
-            if not sentiment_scores:
-                return 0.0  # Neutral if no valid scores
+            start = time.perf_counter()
+            if SENTIMENT_MODE == "lexicon":
+                cprint("📖 Analyzing sentiment with the local lexicon...", "cyan")
+                sentiment_scores = lexicon_scores(texts)
+            else:
+                cprint(f"🤖 Analyzing sentiment with Ollama ({SENTIMENT_BATCH_SIZE} tweets per prompt)...", "cyan")
+                sentiment_scores = self.score_batched(texts)
+            cprint(f"⏱️ Scored {len(texts)} tweets in {time.perf_counter() - start:.1f}s", "cyan")
             
-            return np.mean(sentiment_scores)
+            return float(np.mean(sentiment_scores))
             
         except Exception as e:
             cprint(f"❌ Error analyzing sentiment: {str(e)}", "red")
             return 0.0  # Neutral on error
 
+    def score_batched(self, texts):
+        """Score every text, N tweets per Ollama prompt, reusing cached scores"""
+        ttl = SENTIMENT_CACHE_HOURS * 3600
+        use_cache = response_cache.cacheable(SENTIMENT_TEMPERATURE)
+        keys = [cache_key(SENTIMENT_MODEL, "tweet-sentiment", text, SENTIMENT_TEMPERATURE) for text in texts]
+        scores = np.full(len(texts), np.nan)
+        
+        # Tweets seen before come straight from the cache
+        for i, key in enumerate(keys):
+            cached = response_cache.get(key, ttl) if use_cache else None
+            if cached is not None:
+                scores[i] = float(cached.content)
+        
+        pending = [i for i in range(len(texts)) if np.isnan(scores[i])]
+        for batch_start in range(0, len(pending), SENTIMENT_BATCH_SIZE):
+            batch = pending[batch_start:batch_start + SENTIMENT_BATCH_SIZE]
+            numbered = "\n".join(
+                f"{n}. {' '.join(texts[i].split())}" for n, i in enumerate(batch, 1)
+            )
+            response = ollama.generate(
+                model=SENTIMENT_MODEL,
+                prompt=BATCH_SENTIMENT_PROMPT.format(count=len(batch), tweets=numbered),
+                options={"temperature": SENTIMENT_TEMPERATURE},
+            )['response']
+            
+            batch_scores = parse_score_array(response, len(batch))
+            if batch_scores is None:
+                # Never drop tweets: fall back to the lexicon for this batch
+                cprint(f"⚠️ Could not parse {len(batch)} batch scores, using lexicon: {response[:100]}", "yellow")
+                scores[batch] = lexicon_scores([texts[i] for i in batch])
+                continue
+            
+            for i, score in zip(batch, batch_scores):
+                scores[i] = score
+                if use_cache:
+                    response_cache.put(keys[i], SENTIMENT_MODEL, str(score))
+        
+        return scores
+
     def _announce(self, message, is_important=False):
         """Announce a message using pyttsx3"""
         try:
@@ -154,28 +233,14 @@ class SentimentAgent:
     def save_sentiment_score(self, sentiment_score, num_tweets):
         """Save sentiment score to history"""
         try:
-            new_data = pd.DataFrame([{
+            self.history.append({
                 'timestamp': datetime.now().isoformat(),
                 'sentiment_score': sentiment_score,
                 'num_tweets': num_tweets
-            }])
+            })
             
-            # Load existing data
-            if os.path.exists(SENTIMENT_HISTORY_FILE):
-                history_df = pd.read_csv(SENTIMENT_HISTORY_FILE)
-                # Convert timestamps to datetime for comparison
-                history_df['timestamp'] = pd.to_datetime(history_df['timestamp'])
-                # Keep only last 24 hours of data
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                history_df = history_df[history_df['timestamp'] > cutoff_time]
-                # Convert back to ISO format for consistent storage
-                history_df['timestamp'] = history_df['timestamp'].dt.isoformat()
-                # Append new data
-                history_df = pd.concat([history_df, new_data], ignore_index=True)
-            else:
-                history_df = new_data
-                
-            history_df.to_csv(SENTIMENT_HISTORY_FILE, index=False)
+            # Keep only last 24 hours of data
+            self.history.prune(max_age=timedelta(hours=24))
             
         except Exception as e:
             cprint(f"❌ Error saving sentiment history: {str(e)}", "red")
@@ -183,16 +248,10 @@ class SentimentAgent:
     def get_sentiment_change(self):
         """Calculate sentiment change from last run"""
         try:
-            if not os.path.exists(SENTIMENT_HISTORY_FILE):
-                return None, None
-                
-            history_df = pd.read_csv(SENTIMENT_HISTORY_FILE)
+            # Only the last two scores are needed
+            history_df = self.history.frame(limit=2)
             if len(history_df) < 2:
                 return None, None
-                
-            # Convert timestamps using ISO format
-            history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], format='ISO8601')
-            history_df = history_df.sort_values('timestamp')
             
             current_score = float(history_df.iloc[-1]['sentiment_score'])
             previous_score = float(history_df.iloc[-2]['sentiment_score'])
@@ -10,14 +10,18 @@ import os
 import sys
 from pathlib import Path
 
-# Add src directory to Python path
+# Add src directory and project root to Python path
 src_path = str(Path(__file__).parent.parent)
 if src_path not in sys.path:
     sys.path.append(src_path)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.data.data_bus import BusClient
 
 import time
 import random
-import requests
 from termcolor import colored
 import pandas as pd
 from pathlib import Path
@@ -40,7 +44,6 @@ ANIMATION_DURATION = 10  # Seconds to show attention-grabbing animation
 AUTO_OPEN_BROWSER = False  # Set to True to automatically open new tokens in browser
 USE_DEXSCREENER = True  # Set to True to use DexScreener instead of Birdeye
 EXCLUDE_PATTERNS = ['So11111111111111111111111111111111111111112']  # Exclude the SOLE token pattern
-BASE_URL = "http://api.moondev.com:8000"
 SOUND_ENABLED = True  # Set to True to enable sound effects, False to disable them
 DATA_FOLDER = Path(__file__).parent.parent / "data" / "sniper_agent"  # Folder for token data
 
@@ -77,13 +80,12 @@ SOUND_EFFECTS = [
 class TokenScanner:
     def __init__(self):
         """🌙 Moon Dev's Token Scanner - Built with love by Moon Dev 🚀"""
-        self.base_dir = Path(__file__).parent / "api_data"
-        self.base_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir = DATA_FOLDER
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.seen_tokens = set()
         self.last_check_time = None
         self.sound_enabled = SOUND_ENABLED
+        self.bus = BusClient(interval=CHECK_INTERVAL, quiet=True)  # Shared new_tokens feed
         
         # Only check sound files if sound is enabled
         if self.sound_enabled:
@@ -128,17 +130,7 @@ class TokenScanner:
     def get_token_addresses(self):
         """Fetch token data silently"""
         try:
-            url = f'{BASE_URL}/files/new_token_addresses.csv'
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            # Save to cache
-            save_path = self.base_dir / "new_token_addresses.csv"
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            df = pd.read_csv(save_path)
-            return df
+            return self.bus.get_token_addresses()
                 
         except Exception as e:
             return None
@@ -322,7 +314,8 @@ class TokenScanner:
             except Exception:
                 pass
                 
-            time.sleep(CHECK_INTERVAL)
+            # Wake up as soon as the data bus publishes new launches
+            self.bus.wait_for_update("new_tokens", timeout=CHECK_INTERVAL)
 
 def main():
     """Main entry point"""
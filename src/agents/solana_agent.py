@@ -76,7 +76,6 @@ class SolanaAnalyzer:
         """🌙 Moon Dev's Solana Analyzer - Built with love by Moon Dev 🚀"""
         self.api_key = os.getenv('MOONDEV_API_KEY')
         self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
-        self.session = requests.Session()
         
         # Create data directory if it doesn't exist
         (DATA_FOLDER / "solana_agent").mkdir(parents=True, exist_ok=True)
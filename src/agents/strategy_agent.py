@@ -6,12 +6,13 @@ Handles all strategy-based trading decisions
 from src.config import *
 import json
 from termcolor import cprint
-import openai
 import os
 import importlib
 import inspect
 import time
 from src import nice_funcs as n
+from src.models import model_factory
+from src.models.structured_output import SignalVerdicts, generate_structured
 import pyttsx3
 from transformers import pipeline
 
@@ -32,13 +33,13 @@ Your task:
 3. Look for confirmation/contradiction between different strategies
 4. Consider risk factors
 
-Respond in this format:
-1. First line: EXECUTE or REJECT for each signal (e.g., "EXECUTE signal_1, REJECT signal_2")
-2. Then explain your reasoning:
+Respond with a JSON object:
+- decisions: EXECUTE or REJECT for each signal, in the order given (e.g. ["EXECUTE", "REJECT"])
+- confidence: your confidence in each decision (0-100), in the same order
+- reasoning: your explanation:
    - Signal analysis
    - Market alignment
    - Risk assessment
-   - Confidence in each decision (0-100%)
 
 Remember:
 - Moon Dev prioritizes risk management! 🛡️
@@ -52,9 +53,7 @@ class StrategyAgent:
     def __init__(self):
         self.enabled_strategies = []
 
-        self.client = openai.OpenAI(
-            base_url="http://localhost:11434/v1", api_key="ollama"
-        )
+        self.llm = model_factory.get_model("ollama", AI_MODEL)
 
         if ENABLE_STRATEGIES:
             try:
@@ -88,24 +87,18 @@ class StrategyAgent:
 
             signals_str = json.dumps(signals, indent=2)
 
-            response = self.client.chat.completions.create(
-                model=self.model,  # Replace with your local model name
-                messages=[
-                    {
-                        "role": "user",
-                        "content": STRATEGY_EVAL_PROMPT.format(
-                            strategy_signals=signals_str, market_data=market_data
-                        ),
-                    }
-                ],
+            # One validated verdict per signal (one repair pass, then an error)
+            verdicts = generate_structured(
+                self.llm,
+                "",
+                STRATEGY_EVAL_PROMPT.format(
+                    strategy_signals=signals_str, market_data=market_data
+                ),
+                SignalVerdicts,
+                expected=len(signals),
             )
-            response = response.choices[
-                0
-            ].message.content  # Extract the response content
-
-            lines = response.split("\n")
-            decisions = lines[0].strip().split(",")
-            reasoning = "\n".join(lines[1:])
+            decisions = verdicts.decisions
+            reasoning = verdicts.reasoning
 
             print("🤖 Strategy Evaluation:")
             print(f"Decisions: {decisions}")
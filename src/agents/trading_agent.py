@@ -4,7 +4,6 @@ Handles all LLM-based trading decisions
 """
 
 import anthropic
-import openai
 import os
 import pandas as pd
 import json
@@ -12,11 +11,23 @@ from termcolor import colored, cprint
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Local imports
 from src.config import *
 from src import nice_funcs as n
 from src.data.ohlcv_collector import collect_all_tokens
+from src.data.prompt_serializer import summarize_ohlcv, budget_report
+from src.models import model_factory
+from src.models.response_cache import response_cache
+from src.models.structured_output import (
+    Allocation,
+    StructuredOutputError,
+    TradeDecision,
+    generate_structured,
+    parse_metrics,
+    parse_structured,
+)
 
 # Keep only these prompts
 TRADING_PROMPT = """
@@ -32,14 +43,14 @@ Market Data Criteria:
 
 {strategy_context}
 
-Respond in this exact format:
-1. First line must be one of: BUY, SELL, or NOTHING (in caps)
-2. Then explain your reasoning, including:
+Respond with a JSON object:
+- action: one of BUY, SELL, or NOTHING (in caps)
+- confidence: your confidence level as a percentage (0-100)
+- reasoning: your explanation, including:
    - Technical analysis
    - Strategy signals analysis (if available)
    - Risk factors
    - Market conditions
-   - Confidence level (as a percentage, e.g. 75%)
 
 Remember: 
 - Moon Dev always prioritizes risk management! 🛡️
@@ -82,10 +93,8 @@ load_dotenv()
 class TradingAgent:
     def __init__(self):
         # self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_KEY"))
-        self.client = openai.OpenAI(
-            base_url="http://localhost:11434/v1", api_key="ollama"
-        )
         self.model = AI_MODEL if AI_MODEL else AI_MODEL
+        self.llm = model_factory.get_model("ollama", self.model)
         self.recommendations_df = pd.DataFrame(
             columns=["token", "action", "confidence", "reasoning"]
         )
@@ -93,11 +102,60 @@ class TradingAgent:
 
     def analyze_market_data(self, token, market_data):
         """Analyze market data using Claude"""
+        recommendation, response = self._analyze_token(token, market_data)
+        if recommendation:
+            self.recommendations_df = pd.concat(
+                [self.recommendations_df, pd.DataFrame([recommendation])],
+                ignore_index=True,
+            )
+        return response
+
+    def analyze_tokens(self, market_data, strategy_signals=None):
+        """Analyze every token concurrently, then add all recommendations at once"""
+        for token, data in market_data.items():
+            # Include strategy signals in analysis if available
+            if strategy_signals and token in strategy_signals:
+                cprint(
+                    f"📊 Including {len(strategy_signals[token])} strategy signals for {token[:4]}",
+                    "cyan",
+                )
+                data["strategy_signals"] = strategy_signals[token]
+
+        cprint(
+            f"\n🤖 AI Agent Analyzing {len(market_data)} tokens ({AI_MAX_INFLIGHT} at a time)",
+            "white",
+            "on_green",
+        )
+        start = time.perf_counter()
+        tokens = list(market_data)
+        with ThreadPoolExecutor(max_workers=max(1, AI_MAX_INFLIGHT)) as pool:
+            results = list(
+                pool.map(lambda token: self._analyze_token(token, market_data[token]), tokens)
+            )
+
+        for token, (_, analysis) in zip(tokens, results):
+            print(f"\n📈 Analysis for contract: {token}")
+            print(analysis)
+            print("\n" + "=" * 50 + "\n")
+
+        recommendations = [rec for rec, _ in results if rec]
+        if recommendations:
+            self.recommendations_df = pd.concat(
+                [self.recommendations_df, pd.DataFrame(recommendations)],
+                ignore_index=True,
+            )
+        cprint(
+            f"⏱️ Analyzed {len(tokens)} tokens in {time.perf_counter() - start:.1f}s",
+            "cyan",
+        )
+
+    def _analyze_token(self, token, market_data):
+        """One LLM analysis, returns (recommendation row, raw response)"""
         try:
             # Skip analysis for excluded tokens
             if token in EXCLUDED_TOKENS:
                 print(f"⚠️ Skipping analysis for excluded token: {token}")
-                return None
+                return None, None
 
             # Prepare strategy context
             strategy_context = ""
@@ -109,88 +167,39 @@ class TradingAgent:
             else:
                 strategy_context = "No strategy signals available."
 
-            message = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=AI_MAX_TOKENS,
-                temperature=AI_TEMPERATURE,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{TRADING_PROMPT.format(strategy_context=strategy_context)}\n\nMarket Data to Analyze:\n{market_data}",
-                    }
-                ],
-            )
-
-            # Parse the response - handle both string and list responses
-            response = message.choices[0].message.content
-            if isinstance(response, list):
-                # Extract text from TextBlock objects if present
-                response = "\n".join(
-                    [
-                        item.text if hasattr(item, "text") else str(item)
-                        for item in response
-                    ]
-                )
+            # Compact summary instead of the whole frame: far less prefill, nothing truncated
+            market_summary = summarize_ohlcv(market_data, PROMPT_TOKEN_BUDGET, PROMPT_RECENT_BARS)
+            prompt = f"{TRADING_PROMPT.format(strategy_context=strategy_context)}\n\nMarket Data to Analyze:\n{market_summary}"
+            print(budget_report(f"{token[:4]} prompt", market_summary, PROMPT_TOKEN_BUDGET, prompt))
 
-            lines = response.split("\n")
-            action = lines[0].strip() if lines else "NOTHING"
-
-            # Extract confidence from the response (assuming it's mentioned as a percentage)
-            confidence = 0
-            for line in lines:
-                if "confidence" in line.lower():
-                    # Extract number from string like "Confidence: 75%"
-                    try:
-                        confidence = int("".join(filter(str.isdigit, line)))
-                    except:
-                        confidence = 50  # Default if not found
-
-            # Add to recommendations DataFrame with proper reasoning
-            reasoning = (
-                "\n".join(lines[1:])
-                if len(lines) > 1
-                else "No detailed reasoning provided"
-            )
-            self.recommendations_df = pd.concat(
-                [
-                    self.recommendations_df,
-                    pd.DataFrame(
-                        [
-                            {
-                                "token": token,
-                                "action": action,
-                                "confidence": confidence,
-                                "reasoning": reasoning,
-                            }
-                        ]
-                    ),
-                ],
-                ignore_index=True,
+            # Validated JSON decision (one repair pass, then StructuredOutputError)
+            decision = generate_structured(
+                self.llm, "", prompt, TradeDecision,
+                temperature=AI_TEMPERATURE, max_tokens=AI_MAX_TOKENS,
             )
+            reasoning = decision.reasoning or "No detailed reasoning provided"
+            response = f"{decision.action} ({decision.confidence}% confidence)\n{reasoning}"
+
+            recommendation = {
+                "token": token,
+                "action": decision.action,
+                "confidence": decision.confidence,
+                "reasoning": reasoning,
+            }
 
             print(f"🎯 Moon Dev's AI Analysis Complete for {token[:4]}!")
-            return response
+            return recommendation, response
 
         except Exception as e:
             print(f"❌ Error in AI analysis: {str(e)}")
             # Still add to DataFrame even on error, but mark as NOTHING with 0 confidence
-            self.recommendations_df = pd.concat(
-                [
-                    self.recommendations_df,
-                    pd.DataFrame(
-                        [
-                            {
-                                "token": token,
-                                "action": "NOTHING",
-                                "confidence": 0,
-                                "reasoning": f"Error during analysis: {str(e)}",
-                            }
-                        ]
-                    ),
-                ],
-                ignore_index=True,
-            )
-            return None
+            recommendation = {
+                "token": token,
+                "action": "NOTHING",
+                "confidence": 0,
+                "reasoning": f"Error during analysis: {str(e)}",
+            }
+            return recommendation, None
 
     def allocate_portfolio(self):
         """Get AI-recommended portfolio allocation"""
@@ -203,14 +212,7 @@ class TradingAgent:
             )
 
             # Get allocation from AI
-            response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=AI_MAX_TOKENS,
-                temperature=AI_TEMPERATURE,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"""You are Moon Dev's Portfolio Allocation AI 🌙
+            allocation_prompt = f"""You are Moon Dev's Portfolio Allocation AI 🌙
 
                     Given:
                     - Total portfolio size: ${usd_size}
@@ -229,15 +231,22 @@ class TradingAgent:
                     {{
                         "token_address": amount_in_usd,
                         "{USDC_ADDRESS}": remaining_cash_amount  # Use exact USDC address
-                    }}""",
-                    }
-                ],
+                    }}"""
+
+            # The prompt is built only from config, so one sampled allocation is reused for LLM_CACHE_TTL
+            response = response_cache.get_or_generate(
+                self.model, "", allocation_prompt, AI_TEMPERATURE,
+                lambda: json.dumps(generate_structured(
+                    self.llm, "", allocation_prompt, Allocation,
+                    temperature=AI_TEMPERATURE, max_tokens=AI_MAX_TOKENS,
+                ).amounts),
+                ttl=LLM_CACHE_TTL,
+                accept=lambda text: "{" in text,
+                reuse_sampled=True,
             )
 
             # Parse the response
-            allocations = self.parse_allocation_response(
-                str(response.choices[0].message.content)
-            )
+            allocations = self.parse_allocation_response(str(response))
             if not allocations:
                 return None
 
@@ -272,6 +281,9 @@ class TradingAgent:
         try:
             print("\n🚀 Moon Dev executing portfolio allocations...")
 
+            # Read every position from one wallet snapshot (fills invalidate it)
+            snapshot = n.get_portfolio_snapshot()
+
             for token, amount in allocation_dict.items():
                 # Skip USDC and other excluded tokens
                 if token in EXCLUDED_TOKENS:
@@ -282,7 +294,7 @@ class TradingAgent:
 
                 try:
                     # Get current position value
-                    current_position = n.get_token_balance_usd(token)
+                    current_position = snapshot.usd_value(token)
                     target_allocation = amount
 
                     print(f"🎯 Target allocation: ${target_allocation:.2f} USD")
@@ -308,6 +320,9 @@ class TradingAgent:
         """Check and exit positions based on SELL or NOTHING recommendations"""
         cprint("\n🔄 Checking for positions to exit...", "white", "on_blue")
 
+        # Read every position from one wallet snapshot (fills invalidate it)
+        snapshot = n.get_portfolio_snapshot()
+
         for _, row in self.recommendations_df.iterrows():
             token = row["token"]
 
@@ -318,7 +333,7 @@ class TradingAgent:
             action = row["action"]
 
             # Check if we have a position
-            current_position = n.get_token_balance_usd(token)
+            current_position = snapshot.usd_value(token)
 
             if current_position > 0 and action in ["SELL", "NOTHING"]:
                 cprint(
@@ -345,92 +360,26 @@ class TradingAgent:
                 )
 
     def parse_allocation_response(self, response):
-        """Parse the AI's allocation response and handle both string and TextBlock formats"""
+        """Parse the AI's allocation response into {token: usd_amount}, None if unusable"""
         try:
-            # Handle TextBlock format from Claude 3
-            if isinstance(response, list):
-                response = (
-                    response[0].text
-                    if hasattr(response[0], "text")
-                    else str(response[0])
-                )
-
             print("🔍 Raw response received:")
             print(response)
 
-            # Find the JSON block between curly braces
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            if start == -1 or end == 0:
-                raise ValueError("No JSON object found in response")
-
-            json_str = response[start:end]
-
-            # More aggressive JSON cleaning
-            json_str = (
-                json_str.replace("\n", "")  # Remove newlines
-                .replace("    ", "")  # Remove indentation
-                .replace("\t", "")  # Remove tabs
-                .replace("\\n", "")  # Remove escaped newlines
-                .replace(" ", "")  # Remove all spaces
-                .strip()
-            )  # Remove leading/trailing whitespace
-
-            print("\n🧹 Cleaned JSON string:")
-            print(json_str)
-
-            # Parse the cleaned JSON
-            allocations = json.loads(json_str)
+            allocations = parse_structured(str(response), Allocation).amounts
 
             print("\n📊 Parsed allocations:")
             for token, amount in allocations.items():
                 print(f"  • {token}: ${amount}")
 
-            # Validate amounts are numbers
-            for token, amount in allocations.items():
-                if not isinstance(amount, (int, float)):
-                    raise ValueError(f"Invalid amount type for {token}: {type(amount)}")
-                if amount < 0:
-                    raise ValueError(f"Negative allocation for {token}: {amount}")
-
             return allocations
 
-        except Exception as e:
+        except StructuredOutputError as e:
             print(f"❌ Error parsing allocation response: {str(e)}")
-            print("🔍 Raw response:")
-            print(response)
             return None
 
     def parse_portfolio_allocation(self, allocation_text):
         """Parse portfolio allocation from text response"""
-        try:
-            # Clean up the response text
-            cleaned_text = allocation_text.strip()
-            if "```json" in cleaned_text:
-                # Extract JSON from code block if present
-                json_str = cleaned_text.split("```json")[1].split("```")[0]
-            else:
-                # Find the JSON object between curly braces
-                start = cleaned_text.find("{")
-                end = cleaned_text.rfind("}") + 1
-                json_str = cleaned_text[start:end]
-
-            # Parse the JSON
-            allocations = json.loads(json_str)
-
-            print("📊 Parsed allocations:")
-            for token, amount in allocations.items():
-                print(f"  • {token}: ${amount}")
-
-            return allocations
-
-        except json.JSONDecodeError as e:
-            print(f"❌ Error parsing allocation JSON: {e}")
-            print(f"🔍 Raw text received:\n{allocation_text}")
-            return None
-        except Exception as e:
-            print(f"❌ Unexpected error parsing allocations: {e}")
-            return None
+        return self.parse_allocation_response(allocation_text)
 
     def run(self):
         """Run the trading agent (implements BaseAgent interface)"""
@@ -446,22 +395,8 @@ class TradingAgent:
             cprint("📊 Collecting market data...", "white", "on_blue")
             market_data = collect_all_tokens()
 
-            # Analyze each token's data
-            for token, data in market_data.items():
-                cprint(f"\n🤖 AI Agent Analyzing Token: {token}", "white", "on_green")
-
-                # Include strategy signals in analysis if available
-                if strategy_signals and token in strategy_signals:
-                    cprint(
-                        f"📊 Including {len(strategy_signals[token])} strategy signals in analysis",
-                        "cyan",
-                    )
-                    data["strategy_signals"] = strategy_signals[token]
-
-                analysis = self.analyze_market_data(token, data)
-                print(f"\n📈 Analysis for contract: {token}")
-                print(analysis)
-                print("\n" + "=" * 50 + "\n")
+            # Analyze every token's data concurrently
+            self.analyze_tokens(market_data, strategy_signals)
 
             # Show recommendations summary
             cprint("\n📊 Moon Dev's Trading Recommendations:", "white", "on_blue")
@@ -499,6 +434,8 @@ class TradingAgent:
             except Exception as e:
                 cprint(f"⚠️ Error cleaning temp data: {str(e)}", "white", "on_yellow")
 
+            parse_metrics.report()
+
         except Exception as e:
             cprint(f"\n❌ Error in trading cycle: {str(e)}", "white", "on_red")
             cprint(
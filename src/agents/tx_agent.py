@@ -7,7 +7,6 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-import requests
 import pandas as pd
 import time
 import random
@@ -17,10 +16,15 @@ from rich.console import Console
 from rich import print as rprint
 from playsound import playsound
 
-# Add src directory to Python path
+# Add src directory and project root to Python path
 src_path = str(Path(__file__).parent.parent)
 if src_path not in sys.path:
     sys.path.append(src_path)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.data.data_bus import BusClient
 
 # Load environment variables for API key
 load_dotenv()
@@ -35,7 +39,6 @@ console = Console()
 PAST_TRANSACTIONS_TO_SHOW = 40
 CHECK_INTERVAL = 3
 DISPLAY_DELAY = 0.5
-BASE_URL = "http://api.moondev.com:8000"
 SOUND_ENABLED = True
 AUTO_OPEN_BROWSER = (
     False  # Set to True to automatically open new transactions in browser
@@ -91,16 +94,12 @@ SOUND_EFFECTS = [
 class TxScanner:
     def __init__(self):
         """🌙 Moon Dev's Transaction Scanner - Built with love by Moon Dev 🚀"""
-        self.base_dir = Path(__file__).parent / "api_data"
-        self.base_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir = DATA_FOLDER
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.seen_links = set()
         self.last_check_time = None
         self.sound_enabled = SOUND_ENABLED
-        self.api_key = os.getenv("MOONDEV_API_KEY")
-        self.headers = {"X-API-Key": self.api_key} if self.api_key else {}
-        self.session = requests.Session()
+        self.bus = BusClient(interval=CHECK_INTERVAL, quiet=True)  # Shared recent_txs feed
 
         # Only check sound files if sound is enabled
         if self.sound_enabled:
@@ -112,19 +111,7 @@ class TxScanner:
     def get_recent_transactions(self):
         """Fetch recent transactions data silently"""
         try:
-            url = f"{BASE_URL}/copybot/data/recent_txs"
-            response = self.session.get(url, headers=self.headers)
-            response.raise_for_status()
-
-            # Save to cache
-            save_path = self.base_dir / "recent_txs.csv"
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-
-            # Read without printing status
-            with pd.option_context("mode.chained_assignment", None):
-                df = pd.read_csv(save_path)
-                return df
+            return self.bus.get_copybot_recent_transactions()
 
         except Exception:
             return None
@@ -298,7 +285,8 @@ class TxScanner:
             except Exception:
                 pass
 
-            time.sleep(CHECK_INTERVAL)
+            # Wake up as soon as the data bus publishes new transactions
+            self.bus.wait_for_update("recent_txs", timeout=CHECK_INTERVAL)
 
 
 def main():
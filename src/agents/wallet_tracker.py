@@ -1,6 +1,6 @@
-import requests
 import os
 from dotenv import load_dotenv
+from src.http_client import http_post
 
 load_dotenv()
 
@@ -14,7 +14,7 @@ def get_top_traders(token_address):
         "params": [token_address, {"limit": 1000}]
     }
     
-    response = requests.post(
+    response = http_post(
         RPC_ENDPOINT,
         headers={"Content-Type": "application/json"},
         json=tx_payload
@@ -40,7 +40,7 @@ def get_transaction_detail(signature):
         "params": [signature, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}],
     }
 
-    tx_detail = requests.post(
+    tx_detail = http_post(
         RPC_ENDPOINT,
         headers={"Content-Type": "application/json"},
         json=tx_detail_payload,
@@ -56,7 +56,7 @@ def get_wallet_transactions(wallet_address):
         "params": [wallet_address, {"limit": 1000}]
     }
 
-    tx_response = requests.post(
+    tx_response = http_post(
         RPC_ENDPOINT,
         headers={"Content-Type": "application/json"},
         json=tx_payload
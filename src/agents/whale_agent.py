@@ -14,9 +14,11 @@ from dotenv import load_dotenv
 from pathlib import Path
 from src import nice_funcs as n
 from src import nice_funcs_hl as hl  # Add import for hyperliquid functions
-from src.agents.api import MoonDevAPI
+from src.data.data_bus import BusClient
 from collections import deque
 from src.agents.base_agent import BaseAgent
+from src.data.history_store import history_store
+from src.data.ring_buffer import TimeRingBuffer
 import traceback
 import numpy as np
 import pyttsx3  # Open-source TTS alternative
@@ -26,10 +28,14 @@ import ollama  # Open-source LLM alternative
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 # Configuration
-CHECK_INTERVAL_MINUTES = 5  # How often to check OI (can be set to 0.5 for 30 seconds)
+CHECK_INTERVAL_MINUTES = 0.5  # How often to check OI (lookbacks are O(log n), 30 seconds is fine)
 LOOKBACK_PERIODS = {
-    '15min': 15  # Simplified to just 15 minutes
+    '15min': 15,
+    '1h': 60,
+    '4h': 240
 }
+HISTORY_HOURS = 24  # OI history kept in memory and in the history store
+OI_COLUMNS = ['btc_oi', 'eth_oi', 'total_oi', 'btc_change_pct', 'eth_change_pct', 'total_change_pct', 'btc_abs_change']
 
 # Whale Detection Settings
 WHALE_THRESHOLD_MULTIPLIER = 1.31  # Multiplier for average change to detect whale activity
@@ -90,7 +96,7 @@ class WhaleAgent(BaseAgent):
         self.tts_engine.setProperty('rate', VOICE_SPEED)
         self.tts_engine.setProperty('voice', VOICE_NAME)
         
-        self.api = MoonDevAPI()
+        self.api = BusClient(interval=CHECK_INTERVAL_MINUTES * 60)  # Feeds shared through the data bus
         
         # Create data directories if they don't exist
         self.audio_dir = PROJECT_ROOT / "src" / "audio"
@@ -99,7 +105,8 @@ class WhaleAgent(BaseAgent):
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize or load historical data
-        self.history_file = self.data_dir / "oi_history.csv"
+        self.history_file = self.data_dir / "oi_history.csv"  # Legacy CSV, imported once
+        self.history = history_store.series("oi_history")
         self.load_history()
         
         print("🐋 Dez the Whale Agent initialized!")
@@ -107,33 +114,32 @@ class WhaleAgent(BaseAgent):
     def load_history(self):
         """Load or initialize historical OI data with change tracking"""
         try:
-            if self.history_file.exists():
-                df = pd.read_csv(self.history_file)
-                
-                # Check if we have the new column format
-                required_columns = ['timestamp', 'btc_oi', 'eth_oi', 'total_oi', 'btc_change_pct', 'eth_change_pct', 'total_change_pct']
-                if all(col in df.columns for col in required_columns):
-                    self.oi_history = df
-                    self.oi_history['timestamp'] = pd.to_datetime(self.oi_history['timestamp'])
-                    print(f"📈 Loaded {len(self.oi_history)} historical OI records")
-                else:
-                    print("📝 Detected old format, creating new history file")
-                    self.oi_history = pd.DataFrame(columns=required_columns)
-                    self.history_file.unlink()
-            else:
-                self.oi_history = pd.DataFrame(columns=['timestamp', 'btc_oi', 'eth_oi', 'total_oi', 
-                                                      'btc_change_pct', 'eth_change_pct', 'total_change_pct'])
-                print("📝 Created new OI history file")
-                
+            self.history.migrate_csv(self.history_file)
+
             # Clean up old data (keep only last 24 hours)
-            if not self.oi_history.empty:
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.oi_history = self.oi_history[self.oi_history['timestamp'] > cutoff_time]
-                self.oi_history.to_csv(self.history_file, index=False)
+            self.history.prune(max_age=timedelta(hours=HISTORY_HOURS))
+            timestamps, columns = self.history.arrays(OI_COLUMNS[:-1])
+            columns['btc_abs_change'] = np.abs(columns['btc_change_pct'])
+            self.oi_history = self._new_buffer()
+            self.oi_history.extend(timestamps, columns)
+            if not len(self.oi_history):
+                print("📝 Created new OI history")
+            else:
+                print(f"📈 Loaded {len(self.oi_history)} historical OI records")
                 
         except Exception as e:
             print(f"❌ Error loading history: {str(e)}")
-            self.oi_history = pd.DataFrame(columns=['timestamp', 'btc_oi', 'eth_oi', 'total_oi'])
+            self.oi_history = self._new_buffer()
+
+    def _new_buffer(self):
+        """Time-sorted ring buffer sized for HISTORY_HOURS of checks"""
+        capacity = int(HISTORY_HOURS * 60 / CHECK_INTERVAL_MINUTES * 1.5)  # Slack for restarts and jitter
+        return TimeRingBuffer(
+            OI_COLUMNS,
+            capacity=capacity,
+            max_age=HISTORY_HOURS * 3600,
+            cumulative=['btc_abs_change']  # Running sum for the whale threshold
+        )
             
     def _save_oi_data(self, timestamp, btc_oi, eth_oi, total_oi):
         """Save new OI data point with change percentages"""
@@ -141,8 +147,8 @@ class WhaleAgent(BaseAgent):
             # Calculate percentage changes if we have previous data
             btc_change_pct = eth_change_pct = total_change_pct = 0.0
             
-            if not self.oi_history.empty:
-                prev_data = self.oi_history.iloc[-1]
+            if len(self.oi_history):
+                prev_data = {name: self.oi_history.last(name) for name in ('btc_oi', 'eth_oi', 'total_oi')}
                 print("\n📊 Previous vs Current OI:")
                 print(f"Previous BTC OI: ${prev_data['btc_oi']:,.2f}")
                 print(f"Current BTC OI: ${btc_oi:,.2f}")
@@ -157,7 +163,7 @@ class WhaleAgent(BaseAgent):
                 print(f"Total Change: {total_change_pct:.4f}%")
             
             # Add new data point
-            new_row = pd.DataFrame([{
+            row = {
                 'timestamp': timestamp,
                 'btc_oi': float(btc_oi),
                 'eth_oi': float(eth_oi),
@@ -165,22 +171,17 @@ class WhaleAgent(BaseAgent):
                 'btc_change_pct': btc_change_pct,
                 'eth_change_pct': eth_change_pct,
                 'total_change_pct': total_change_pct
-            }])
-            
-            print("\n📝 Adding new data point to history...")
-            print(f"History size before: {len(self.oi_history)}")
-            self.oi_history = pd.concat([self.oi_history, new_row], ignore_index=True)
-            print(f"History size after: {len(self.oi_history)}")
+            }
             
-            # Clean up old data
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            old_size = len(self.oi_history)
-            self.oi_history = self.oi_history[self.oi_history['timestamp'] > cutoff_time]
-            print(f"Removed {old_size - len(self.oi_history)} old records")
+            # Ring buffer append drops rows older than HISTORY_HOURS itself
+            values = {name: row[name] for name in OI_COLUMNS if name in row}
+            self.oi_history.append(timestamp.timestamp(), btc_abs_change=abs(btc_change_pct), **values)
+            print(f"📝 Added data point, {len(self.oi_history)} in history")
             
-            # Save to file
-            self.oi_history.to_csv(self.history_file, index=False)
-            print("💾 Saved to history file")
+            # Append just this row to the history store
+            self.history.append(row)
+            self.history.prune(max_age=timedelta(hours=HISTORY_HOURS))
+            print("💾 Saved to history store")
             
         except Exception as e:
             print(f"❌ Error saving OI data: {str(e)}")
@@ -217,12 +218,8 @@ class WhaleAgent(BaseAgent):
         try:
             target_time = datetime.now() - timedelta(minutes=minutes_ago)
             
-            # Find closest data point before target time
-            historical_data = self.oi_history[self.oi_history['timestamp'] <= target_time]
-            
-            if not historical_data.empty:
-                return float(historical_data.iloc[-1]['total_oi'])
-            return None
+            # Closest data point at or before target time (binary search)
+            return self.oi_history.value_at('total_oi', target_time.timestamp())
             
         except Exception as e:
             print(f"❌ Error getting historical OI: {str(e)}")
@@ -235,19 +232,17 @@ class WhaleAgent(BaseAgent):
         print("\n📊 Calculating OI Changes:")
         
         # Get current BTC value
-        current_btc = float(self.oi_history.iloc[-1]['btc_oi'])
+        current_btc = self.oi_history.last('btc_oi')
         print(f"Current BTC OI: ${current_btc:,.2f}")
         
         # Use our local CHECK_INTERVAL_MINUTES constant
         interval = CHECK_INTERVAL_MINUTES
+        now = datetime.now().timestamp()
         
         # Get historical data from X minutes ago
-        historical_data = self.oi_history[
-            self.oi_history['timestamp'] <= (datetime.now() - timedelta(minutes=interval))
-        ]
+        historical_btc = self.oi_history.value_at('btc_oi', now - interval * 60)
         
-        if not historical_data.empty:
-            historical_btc = float(historical_data.iloc[-1]['btc_oi'])
+        if historical_btc:
             print(f"Historical BTC OI ({interval}m ago): ${historical_btc:,.2f}")
             
             # Calculate percentage change
@@ -258,8 +253,16 @@ class WhaleAgent(BaseAgent):
                 'btc': btc_pct_change,
                 'interval': interval,
                 'start_btc': historical_btc,
-                'current_btc': current_btc
+                'current_btc': current_btc,
+                'horizons': {}
             }
+            
+            # Every lookback horizon is one more binary search
+            for period_name, minutes in LOOKBACK_PERIODS.items():
+                pct = self.oi_history.change_pct('btc_oi', minutes * 60, now=now)
+                if pct is not None:
+                    changes['horizons'][period_name] = pct
+                    print(f"BTC OI change over {period_name}: {pct:.4f}%")
         else:
             print(f"⚠️ No historical data found from {interval}m ago")
         
@@ -417,13 +420,12 @@ class WhaleAgent(BaseAgent):
     def _announce_initial_summary(self):
         """Announce the current state of the market based on existing data"""
         try:
-            if self.oi_history.empty:
+            if not len(self.oi_history):
                 current_data = self._get_current_oi()
-                if current_data is not None:
-                    latest_data = self.oi_history.iloc[-1]
-                    btc_oi = latest_data['btc_oi']
-                    eth_oi = latest_data['eth_oi']
-                    total_oi = latest_data['total_oi']
+                if current_data is not None and len(self.oi_history):
+                    btc_oi = self.oi_history.last('btc_oi')
+                    eth_oi = self.oi_history.last('eth_oi')
+                    total_oi = self.oi_history.last('total_oi')
                     
                     message = "🌙 Moon Dev's Whale Watcher starting fresh! I'll compare changes once I have more data. "
                     message += f"Current total open interest is {self._format_number_for_speech(total_oi)} with Bitcoin at "
@@ -432,7 +434,7 @@ class WhaleAgent(BaseAgent):
                 return
                 
             # Rest of the method remains unchanged
-            current_oi = float(self.oi_history.iloc[-1]['total_oi'])
+            current_oi = self.oi_history.last('total_oi')
             changes = {}
             available_periods = []
             
@@ -445,10 +447,10 @@ class WhaleAgent(BaseAgent):
                     available_periods.append(period_name)
             
             if not changes:
-                earliest_data = self.oi_history.iloc[0]
-                latest_data = self.oi_history.iloc[-1]
-                minutes_diff = (latest_data['timestamp'] - earliest_data['timestamp']).total_seconds() / 60
-                pct_change = ((latest_data['total_oi'] - earliest_data['total_oi']) / earliest_data['total_oi']) * 100
+                times = self.oi_history.times
+                minutes_diff = (times[-1] - times[0]) / 60
+                earliest_oi = self.oi_history.first('total_oi')
+                pct_change = ((self.oi_history.last('total_oi') - earliest_oi) / earliest_oi) * 100
                 
                 message = f"Open Interest has {('increased' if pct_change > 0 else 'decreased')} "
                 message += f"by {abs(pct_change):.1f}% over the last {int(minutes_diff)} minutes."
@@ -472,13 +474,12 @@ class WhaleAgent(BaseAgent):
                 print("⚠️ Not enough history for whale detection")
                 return False
             
-            # Get rolling average of absolute changes
-            historical_changes = self.oi_history['btc_change_pct'].abs().rolling(window=10).mean().dropna()
-            if historical_changes.empty:
+            # Average absolute change over the window, kept as a running sum
+            avg_change = self.oi_history.mean('btc_abs_change')
+            if avg_change is None:
                 print("⚠️ No historical changes available")
                 return False
                 
-            avg_change = historical_changes.mean()
             threshold = avg_change * WHALE_THRESHOLD_MULTIPLIER
             
             print(f"\n🔍 Whale Detection Analysis:")
@@ -7,6 +7,7 @@ import threading
 import base58
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from src.http_client import http_get, http_post
 
 load_dotenv()
 
@@ -82,18 +83,12 @@ def format_number(number, decimals=2):
         return f"${number/1_000:.{decimals}f}K"
     return f"${number:.{decimals}f}"
 
-def make_api_request(url, payload, max_retries=3, initial_delay=1):
-    """Make API requests with exponential backoff"""
-    for attempt in range(max_retries):
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:
-                raise
-            delay = initial_delay * (2 ** attempt)
-            time.sleep(delay)
+def make_api_request(url, payload, max_retries=3):
+    """Make API requests on the pooled session, max_retries attempts in total (jittered backoff)"""
+    # http_post counts retries after the first attempt
+    response = http_post(url, json=payload, max_retries=max(max_retries - 1, 0))
+    response.raise_for_status()
+    return response.json()
 
 def setup_logging():
     """Configure logging system"""
@@ -138,7 +133,7 @@ def validate_solana_address(address):
 # Fetch initial data
 def fetch_initial_data():
     # Fetch price and liquidity from DexScreener
-    dex_data = requests.get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
+    dex_data = http_get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
     price = float(dex_data["pairs"][0]["priceUsd"])
     liquidity = float(dex_data["pairs"][0]["liquidity"]["usd"])
 
@@ -150,7 +145,7 @@ def fetch_initial_data():
         "params": [TOKEN_ADDRESS],
     }
 
-    supply_response = requests.post(
+    supply_response = http_post(
         HELIUS_RPC_URL,
         headers={"Content-Type": "application/json"},
         json=helius_payload,
@@ -197,7 +192,7 @@ def check_lp_burn(lp_address):
         ],
     }
 
-    holders = requests.post(
+    holders = http_post(
         HELIUS_RPC_URL,
         headers={"Content-Type": "application/json"},
         json=holders_payload,
@@ -219,7 +214,7 @@ def get_token_creator(token_address):
         }
     }
     
-    response = requests.post(
+    response = http_post(
         HELIUS_RPC_URL,
         headers={"Content-Type": "application/json"},
         json=payload
@@ -251,7 +246,7 @@ def get_creator_tokens(creator_address):
         }
     }
 
-    tokens_response = requests.post(
+    tokens_response = http_post(
         HELIUS_RPC_URL,
         headers={"Content-Type": "application/json"},
         json=search_payload
@@ -270,7 +265,7 @@ def get_creator_tokens(creator_address):
             "params": [token_address, {"encoding": "jsonParsed"}],
         }
 
-        token_info = requests.post(
+        token_info = http_post(
             HELIUS_RPC_URL,
             headers={"Content-Type": "application/json"},
             json=token_info_payload,
@@ -297,7 +292,7 @@ def get_creator_tokens(creator_address):
             ],
         }
 
-        holders = requests.post(
+        holders = http_post(
             HELIUS_RPC_URL,
             headers={"Content-Type": "application/json"},
             json=holders_payload,
@@ -324,7 +319,7 @@ def get_creator_tokens(creator_address):
         )
 
         # Get DEX data including LP info
-        dex_data = requests.get(f"{DEXSCREENER_API}/{token_address}").json()
+        dex_data = http_get(f"{DEXSCREENER_API}/{token_address}").json()
 
         if "pairs" in dex_data:
             raydium_pairs = [
@@ -355,7 +350,7 @@ def get_creator_tokens(creator_address):
 def send_alert(message):
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     params = {"chat_id": TELEGRAM_CHAT_ID, "text": message}
-    requests.get(url, params=params)
+    http_get(url, params=params)
 
     print(message)
 
@@ -389,7 +384,7 @@ def monitor_creator_tokens(creator_address, config):
 def monitor_price(initial_price, config):
     dex_url = f"https://dexscreener.com/solana/{TOKEN_ADDRESS}"
     while True:
-        dex_data = requests.get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
+        dex_data = http_get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
         current_price = float(dex_data["pairs"][0]["priceUsd"])
         price_change = abs((current_price - initial_price) / initial_price) * 100
 
@@ -406,7 +401,7 @@ def monitor_price(initial_price, config):
 def monitor_liquidity(initial_liquidity, config):
     dex_url = f"https://dexscreener.com/solana/{TOKEN_ADDRESS}"
     while True:
-        dex_data = requests.get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
+        dex_data = http_get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
         current_liquidity = float(dex_data["pairs"][0]["liquidity"]["usd"])
         liquidity_change = abs((current_liquidity - initial_liquidity) / initial_liquidity) * 100
 
@@ -437,7 +432,7 @@ def monitor_whales(total_supply, config):
             ],
         }
 
-        holders_response = requests.post(
+        holders_response = http_post(
             HELIUS_RPC_URL,
             headers={"Content-Type": "application/json"},
             json=holders_payload,
@@ -466,7 +461,7 @@ def monitor_transactions(total_supply, config):
                 "params": [TOKEN_ADDRESS, {"limit": 100}],
             }
 
-            tx_response = requests.post(
+            tx_response = http_post(
                 HELIUS_RPC_URL,
                 headers={"Content-Type": "application/json"},
                 json=tx_payload,
@@ -481,7 +476,7 @@ def monitor_transactions(total_supply, config):
                         "params": [tx["signature"], {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}],
                     }
 
-                    tx_detail = requests.post(
+                    tx_detail = http_post(
                         HELIUS_RPC_URL,
                         headers={"Content-Type": "application/json"},
                         json=tx_detail_payload,
@@ -527,7 +522,7 @@ def monitor_transactions(total_supply, config):
 
 def monitor_market_cap(initial_price, total_supply, config):
     while True:
-        dex_data = requests.get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
+        dex_data = http_get(f"{DEXSCREENER_API}/{TOKEN_ADDRESS}").json()
         current_price = float(dex_data["pairs"][0]["priceUsd"])
 
         initial_market_cap = initial_price * total_supply
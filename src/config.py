@@ -70,6 +70,9 @@ MAX_GAIN_PERCENT = 5  # Maximum gain as percentage (e.g., 50 = 50% gain)
 slippage = 199  # 500 = 5% and 50 = .5% slippage
 PRIORITY_FEE = 100000  # ~0.02 USD at current SOL prices
 orders_per_open = 3  # Multiple orders for better fill rates
+SWAP_PIPELINE_WORKERS = 4  # Chunks quoted/signed/sent in parallel by the swap executor
+SWAP_CONFIRM_TIMEOUT = 60  # Seconds to wait for chunk signatures to confirm
+SWAP_CONFIRM_POLL_SECONDS = 1  # How often to poll signature statuses while confirming
 
 # Market maker settings 📊
 buy_under = .0946
@@ -79,11 +82,31 @@ sell_over = 1
 DAYSBACK_4_DATA = 3
 DATA_TIMEFRAME = '1H'  # 1m, 3m, 5m, 15m, 30m, 1H, 2H, 4H, 6H, 8H, 12H, 1D, 3D, 1W, 1M
 SAVE_OHLCV_DATA = False  # 🌙 Set to True to save data permanently, False will only use temp data during run
+COINGECKO_CALLS_PER_MINUTE = 30  # CoinGecko demo quota - the collector paces all requests to this rate
+OHLCV_MAX_WORKERS = 5  # Max tokens fetched in parallel by the OHLCV collector
+COINGECKO_PRICE_BATCH_SIZE = 30  # Max contract addresses per CoinGecko price request
+PORTFOLIO_SNAPSHOT_TTL = 30  # Seconds a wallet snapshot is reused before re-reading balances
+PRICE_CACHE_TTL = 10  # Seconds a token price quote is served from cache
+PRICE_MAX_STALE = 120  # Seconds a cached price may still be served (flagged stale) when a refresh fails
 
 # AI Model Settings 🤖
 AI_MODEL = "deepseek-r1:1.5b"  # Model to use: claude-3-haiku-20240307,claude-3-sonnet-20240229, claude-3-opus-20240229
 AI_MAX_TOKENS = 1024  # Max tokens for response
 AI_TEMPERATURE = 0.3  # Creativity vs precision (0-1)
+AI_MAX_INFLIGHT = 4  # Max token analyses sent to the LLM at the same time
+LLM_CACHE_TTL = 3600  # Seconds a cached LLM answer to an identical prompt is reused
+PROMPT_TOKEN_BUDGET = 600  # Max estimated tokens of market data per token in an LLM prompt
+PROMPT_RECENT_BARS = 12  # Most recent candles included verbatim (fewer if over budget)
+
+# Model router 🔀 (fastest healthy model first, unconfigured providers are skipped)
+MODEL_ROUTER_CANDIDATES = [
+    ('ollama', 'llama3.2'),
+    ('ollama', AI_MODEL),
+    ('groq', 'llama-3.3-70b-versatile'),
+    ('claude', 'claude-3-5-haiku-latest'),
+]
+RISK_AI_HEDGE_SECONDS = 8  # Send the risk override check to a model on another provider/server if the first is this slow
+RISK_AI_DEADLINE_SECONDS = 30  # Give up on the AI (and respect the limit) after this long
 
 # Trading Strategy Agent Settings - MAY NOT BE USED YET 1/5/25
 ENABLE_STRATEGIES = True  # Set this to True to use strategies
@@ -92,6 +115,16 @@ STRATEGY_MIN_CONFIDENCE = 0.7  # Minimum confidence to act on strategy signals
 # Sleep time between main agent runs
 SLEEP_BETWEEN_RUNS_MINUTES = 15  # How long to sleep between agent runs 🕒
 
+# Agent scheduler settings ⏱️ (main.py gives each agent its own cadence)
+AGENT_INTERVALS_MINUTES = {
+    'risk': SLEEP_BETWEEN_RUNS_MINUTES,  # Risk checks run on their own thread and keep this interval
+    'trading': SLEEP_BETWEEN_RUNS_MINUTES,
+    'strategy': SLEEP_BETWEEN_RUNS_MINUTES,
+    'copybot': SLEEP_BETWEEN_RUNS_MINUTES,
+    'sentiment': SLEEP_BETWEEN_RUNS_MINUTES,
+}
+SCHEDULER_MAX_WORKERS = 3  # Non-risk agents allowed to run at the same time
+
 # Future variables (not active yet) 🔮
 sell_at_multiple = 3
 USDC_SIZE = 1
@@ -0,0 +1,163 @@
+"""
+🌙 Moon Dev's Candle Store
+Persistent columnar OHLCV store backed by memory-mapped NumPy record files
+Built with love by Moon Dev 🚀
+
+Layout: <root>/<timeframe>/<token>.bin, one fixed-size record per candle,
+sorted by timestamp. New candles are appended in place, so an update costs
+O(new rows) and readers get a zero-copy view through np.memmap.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# One candle on disk - timestamps are epoch milliseconds (UTC)
+CANDLE_DTYPE = np.dtype([
+    ('t', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+DEFAULT_STORE_DIR = Path(__file__).parent / "ohlcv_store"
+
+
+class CandleStore:
+    """OHLCV candles partitioned by token and timeframe"""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def _path(self, token, timeframe):
+        return self.root / str(timeframe) / f"{token}.bin"
+
+    def read(self, token, timeframe, start_ms=None, end_ms=None):
+        """Memory-mapped, read-only record array for [start_ms, end_ms]"""
+        path = self._path(token, timeframe)
+        if not path.exists() or path.stat().st_size < CANDLE_DTYPE.itemsize:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+        records = np.memmap(path, dtype=CANDLE_DTYPE, mode='r')
+        lo = 0 if start_ms is None else np.searchsorted(records['t'], start_ms, side='left')
+        hi = len(records) if end_ms is None else np.searchsorted(records['t'], end_ms, side='right')
+        return records[lo:hi]
+
+    def last_timestamp(self, token, timeframe):
+        """Timestamp (ms) of the newest stored candle, or None"""
+        path = self._path(token, timeframe)
+        size = path.stat().st_size if path.exists() else 0
+        if size < CANDLE_DTYPE.itemsize:
+            return None
+        with open(path, 'rb') as f:
+            f.seek((size // CANDLE_DTYPE.itemsize - 1) * CANDLE_DTYPE.itemsize)
+            last = np.frombuffer(f.read(CANDLE_DTYPE.itemsize), dtype=CANDLE_DTYPE)
+        return int(last['t'][0])
+
+    def first_timestamp(self, token, timeframe):
+        """Timestamp (ms) of the oldest stored candle, or None"""
+        records = self.read(token, timeframe)
+        return int(records['t'][0]) if len(records) else None
+
+    def history_start(self, token, timeframe):
+        """Earliest timestamp (ms) the upstream source has for a token, or None if unknown"""
+        try:
+            return json.loads(self._path(token, timeframe).with_suffix('.json').read_text())['history_start']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set_history_start(self, token, timeframe, start_ms):
+        """Remember that upstream history begins at start_ms, so older bars are never refetched"""
+        path = self._path(token, timeframe).with_suffix('.json')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'history_start': int(start_ms)}))
+
+    def write(self, token, timeframe, records):
+        """Merge candles into the store, returns number of new rows
+
+        Rows at or after the last stored candle are written in place (the last
+        record is overwritten, newer ones appended). Anything that overlaps
+        older history triggers a one-off merge and rewrite.
+        """
+        records = np.asarray(records, dtype=CANDLE_DTYPE)
+        if len(records) == 0:
+            return 0
+        records = records[np.argsort(records['t'], kind='stable')]
+
+        # Drop duplicate timestamps inside the batch, keeping the latest value
+        keep = np.append(records['t'][1:] != records['t'][:-1], True)
+        records = records[keep]
+
+        path = self._path(token, timeframe)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            last_ts = self.last_timestamp(token, timeframe)
+
+            if last_ts is None or records['t'][0] > last_ts:
+                with open(path, 'ab') as f:
+                    f.write(records.tobytes())
+                return len(records)
+
+            if records['t'][0] == last_ts:
+                # Refreshing the newest (possibly still forming) candle
+                with open(path, 'r+b') as f:
+                    f.seek(-CANDLE_DTYPE.itemsize, os.SEEK_END)
+                    f.write(records.tobytes())
+                return len(records) - 1
+
+            existing = np.fromfile(path, dtype=CANDLE_DTYPE)
+            merged = np.concatenate([existing, records])
+            # Stable sort keeps incoming rows after stored ones so they win on ties
+            merged = merged[np.argsort(merged['t'], kind='stable')]
+            keep = np.append(merged['t'][1:] != merged['t'][:-1], True)
+            merged = merged[keep]
+
+            tmp_path = path.with_suffix('.tmp')
+            merged.tofile(tmp_path)
+            os.replace(tmp_path, path)
+            return len(merged) - len(existing)
+
+    def prune(self, token, timeframe, before_ms):
+        """Drop candles older than before_ms, returns rows removed"""
+        path = self._path(token, timeframe)
+        with self._lock:
+            if not path.exists():
+                return 0
+            existing = np.fromfile(path, dtype=CANDLE_DTYPE)
+            cut = np.searchsorted(existing['t'], before_ms, side='left')
+            if cut == 0:
+                return 0
+            tmp_path = path.with_suffix('.tmp')
+            existing[cut:].tofile(tmp_path)
+            os.replace(tmp_path, path)
+            return int(cut)
+
+    def to_frame(self, token, timeframe, start_ms=None, end_ms=None):
+        """Stored candles as a DataFrame with a UTC datetime column"""
+        records = self.read(token, timeframe, start_ms, end_ms)
+        df = pd.DataFrame({name: np.asarray(records[name]) for name in CANDLE_DTYPE.names})
+        df.insert(0, 'timestamp', pd.to_datetime(df['t'], unit='ms'))
+        return df
+
+
+def records_from_columns(t, open_, high, low, close, volume=None):
+    """Pack column arrays into a CANDLE_DTYPE record array"""
+    t = np.asarray(t, dtype='<i8')
+    records = np.empty(len(t), dtype=CANDLE_DTYPE)
+    records['t'] = t
+    records['open'] = open_
+    records['high'] = high
+    records['low'] = low
+    records['close'] = close
+    records['volume'] = 0.0 if volume is None else volume
+    return records
+
+
+# Shared store used by nice_funcs and the collectors
+candle_store = CandleStore()
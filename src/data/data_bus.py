@@ -0,0 +1,277 @@
+"""
+🌙 Moon Dev's Data Bus
+One poller per Moon Dev API feed, shared by every agent process
+Built with love by Moon Dev 🚀
+
+The whale, liquidation, funding, tx and sniper agents each polled the same
+endpoints on their own timers. With the bus running, one process owns every
+feed:
+
+    python -m src.data.data_bus          # from the project root
+
+Agents swap MoonDevAPI for a BusClient, which has the same getters:
+
+    self.api = BusClient(interval=60)    # seconds between this agent's reads
+    df = self.api.get_funding_data()
+
+The bus is file-backed (src/data/bus/), so it works the same on every OS:
+- Each subscriber keeps a lease file per feed with its cadence and a
+  heartbeat. The bus polls each feed at the fastest live lease and skips
+  feeds nobody reads.
+- A poll that changed the data publishes a pickle snapshot and bumps the
+  version in the feed's manifest. Readers load a snapshot only when the
+  version moved. `wait_for_update` watches the manifest, not the network.
+- Every poll stamps the manifest with checked_at and its error (None when
+  the fetch worked), so readers skip a failing feed straight away.
+- With no bus heartbeat, or when the bus can't fetch a feed, BusClient calls
+  MoonDevAPI directly, so every agent still runs on its own.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+import pandas as pd
+from termcolor import cprint
+from src.agents.api import MoonDevAPI
+
+BUS_DIR = Path(__file__).parent / "bus"
+BUS_TICK = 0.5  # Seconds between bus heartbeats and lease scans
+BUS_STALE_AFTER = 10  # A bus heartbeat older than this means no bus is running
+LEASE_GRACE = 30  # A lease expires after 2x its interval plus this many seconds
+FIRST_PUBLISH_WAIT = 15  # Seconds a reader waits for the bus to pick up an idle feed
+LIQUIDATION_FEED_ROWS = 10000  # Newest liquidations the bus keeps published
+
+# Feed name -> (MoonDevAPI getter, keyword arguments)
+FEEDS = {
+    "liquidations": ("get_liquidation_data", {"limit": LIQUIDATION_FEED_ROWS}),
+    "funding": ("get_funding_data", {}),
+    "oi": ("get_oi_data", {}),
+    "oi_total": ("get_oi_total", {}),
+    "new_tokens": ("get_token_addresses", {}),
+    "recent_txs": ("get_copybot_recent_transactions", {}),
+}
+
+_client_ids = itertools.count()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(data))
+    os.replace(temp_path, path)
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+class DataBus:
+    """Polls each feed at its fastest subscriber cadence and publishes snapshots"""
+
+    def __init__(self, api: Optional[MoonDevAPI] = None, bus_dir: Path = BUS_DIR):
+        self.bus_dir = Path(bus_dir)
+        self.lease_dir = self.bus_dir / "leases"
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        self.api = api or MoonDevAPI()
+        self.last_poll: Dict[str, float] = {}
+        self.digests: Dict[str, int] = {}
+        self.stats = {feed: {"polls": 0, "published": 0, "errors": 0} for feed in FEEDS}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(FEEDS), thread_name_prefix="data-bus")
+
+    def cadences(self) -> Dict[str, float]:
+        """Fastest live subscriber interval per feed; expired leases are removed"""
+        now = time.time()
+        cadences = {}
+        for path in self.lease_dir.glob("*.json"):
+            lease = _read_json(path)
+            if not lease or now - lease["heartbeat"] > 2 * lease["interval"] + LEASE_GRACE:
+                path.unlink(missing_ok=True)
+                continue
+            feed = lease["feed"]
+            cadences[feed] = min(cadences.get(feed, lease["interval"]), lease["interval"])
+        return cadences
+
+    def poll(self, feed: str) -> None:
+        """Fetch one feed and publish it if it changed"""
+        getter, kwargs = FEEDS[feed]
+        manifest_path = self.bus_dir / f"{feed}.json"
+        manifest = _read_json(manifest_path) or {"version": 0, "published_at": 0}
+        try:
+            df = getattr(self.api, getter)(**kwargs)
+            self.stats[feed]["polls"] += 1
+            if df is None:
+                raise RuntimeError(f"{getter} returned no data")
+
+            digest = int(pd.util.hash_pandas_object(df, index=False).sum())
+            if digest != self.digests.get(feed):
+                snapshot = self.bus_dir / f"{feed}.pkl"
+                temp_path = snapshot.with_name(snapshot.name + ".tmp")
+                df.to_pickle(temp_path)
+                os.replace(temp_path, snapshot)
+                self.digests[feed] = digest
+                manifest.update(version=manifest["version"] + 1, published_at=time.time(), rows=len(df))
+                self.stats[feed]["published"] += 1
+            manifest["error"] = None
+        except Exception as e:
+            self.stats[feed]["errors"] += 1
+            manifest["error"] = str(e)
+            cprint(f"⚠️ Data bus: {feed} poll failed: {str(e)}", "yellow")
+        finally:
+            # Failed polls are stamped too, so readers see the error instead of waiting out staleness
+            manifest["checked_at"] = time.time()
+            try:
+                _write_json(manifest_path, manifest)
+            except OSError as e:
+                cprint(f"⚠️ Data bus: could not write {feed} manifest: {str(e)}", "yellow")
+            with self._lock:
+                self._in_flight.discard(feed)
+
+    def run_forever(self) -> None:
+        cprint(f"🚌 Moon Dev's Data Bus running ({self.bus_dir})", "white", "on_blue")
+        try:
+            while True:
+                _write_json(self.bus_dir / "bus.json", {"pid": os.getpid(), "heartbeat": time.time()})
+                now = time.time()
+                for feed, interval in self.cadences().items():
+                    if feed not in FEEDS or now - self.last_poll.get(feed, 0) < interval:
+                        continue
+                    with self._lock:
+                        if feed in self._in_flight:
+                            continue
+                        self._in_flight.add(feed)
+                    self.last_poll[feed] = now
+                    self._executor.submit(self.poll, feed)
+                time.sleep(BUS_TICK)
+        except KeyboardInterrupt:
+            cprint("\n👋 Data bus shutting down", "yellow")
+        finally:
+            self._executor.shutdown(wait=False)
+            (self.bus_dir / "bus.json").unlink(missing_ok=True)
+            self.report()
+
+    def report(self) -> None:
+        cprint("\n📊 Data bus feeds", "white", "on_blue")
+        for feed, s in self.stats.items():
+            print(f"  {feed:14} polls {s['polls']:5} | published {s['published']:5} | errors {s['errors']:3}")
+
+
+class BusClient:
+    """MoonDevAPI getters served from the data bus, or directly when no bus is running"""
+
+    def __init__(self, interval: float, bus_dir: Path = BUS_DIR, quiet: bool = False):
+        self.interval = float(interval)
+        self.bus_dir = Path(bus_dir)
+        self.quiet = quiet  # Keep MoonDevAPI status lines out of the direct fallback
+        self.client_id = f"{os.getpid()}-{next(_client_ids)}"
+        self._api = None
+        self._leased: Dict[str, float] = {}
+        self._cache: Dict[str, tuple] = {}  # feed -> (version, DataFrame)
+
+    @property
+    def api(self) -> MoonDevAPI:
+        # Only built when the bus is down or failing
+        if self._api is None:
+            self._api = MoonDevAPI(quiet=self.quiet)
+        return self._api
+
+    def bus_alive(self) -> bool:
+        status = _read_json(self.bus_dir / "bus.json")
+        return bool(status) and time.time() - status["heartbeat"] < BUS_STALE_AFTER
+
+    def _lease(self, feed: str) -> None:
+        now = time.time()
+        if now - self._leased.get(feed, 0) < min(self.interval, LEASE_GRACE) / 2:
+            return
+        lease_dir = self.bus_dir / "leases"
+        lease_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(lease_dir / f"{feed}.{self.client_id}.json",
+                    {"feed": feed, "interval": self.interval, "heartbeat": now})
+        self._leased[feed] = now
+
+    def _manifest(self, feed: str) -> Optional[dict]:
+        return _read_json(self.bus_dir / f"{feed}.json")
+
+    def _direct(self, feed: str, **overrides):
+        getter, kwargs = FEEDS[feed]
+        return getattr(self.api, getter)(**{**kwargs, **overrides})
+
+    def read(self, feed: str, **direct_overrides) -> Optional[pd.DataFrame]:
+        """Latest published data for a feed (a shallow copy, don't edit values in place)"""
+        if not self.bus_alive():
+            return self._direct(feed, **direct_overrides)
+        self._lease(feed)
+
+        # A feed nobody was reading gets polled on the bus's next tick
+        deadline = time.time() + FIRST_PUBLISH_WAIT
+        manifest = self._manifest(feed)
+        while not manifest or time.time() - manifest.get("checked_at", 0) > self.interval + BUS_STALE_AFTER:
+            if time.time() > deadline:
+                return self._direct(feed, **direct_overrides)
+            time.sleep(BUS_TICK)
+            manifest = self._manifest(feed)
+
+        if manifest.get("error"):
+            # The bus's last fetch failed, don't serve its older snapshot
+            return self._direct(feed, **direct_overrides)
+
+        cached = self._cache.get(feed)
+        if cached is None or cached[0] != manifest["version"]:
+            try:
+                cached = (manifest["version"], pd.read_pickle(self.bus_dir / f"{feed}.pkl"))
+            except (OSError, ValueError, EOFError):
+                return self._direct(feed, **direct_overrides)
+            self._cache[feed] = cached
+        return cached[1].copy(deep=False)
+
+    def wait_for_update(self, feed: str, timeout: float) -> bool:
+        """Block until the bus publishes a new version of a feed, or timeout
+
+        Without a bus this just sleeps for timeout. Returns True if the feed changed.
+        """
+        if not self.bus_alive():
+            time.sleep(timeout)
+            return False
+        self._lease(feed)
+        cached = self._cache.get(feed)
+        start_version = cached[0] if cached else (self._manifest(feed) or {}).get("version")
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            manifest = self._manifest(feed)
+            if manifest and manifest["version"] != start_version:
+                return True
+            time.sleep(BUS_TICK)
+        return False
+
+    def get_liquidation_data(self, limit=10000):
+        df = self.read("liquidations", limit=limit)
+        if df is not None and limit:
+            df = df.tail(limit).reset_index(drop=True)
+        return df
+
+    def get_funding_data(self):
+        return self.read("funding")
+
+    def get_oi_data(self):
+        return self.read("oi")
+
+    def get_oi_total(self):
+        return self.read("oi_total")
+
+    def get_token_addresses(self):
+        return self.read("new_tokens")
+
+    def get_copybot_recent_transactions(self):
+        return self.read("recent_txs")
+
+
+if __name__ == "__main__":
+    DataBus().run_forever()
@@ -0,0 +1,249 @@
+"""
+🌙 Moon Dev's History Store
+Append-only time series for agent history, in SQLite (WAL mode)
+Built with love by Moon Dev 🚀
+
+Agent histories (balances, OI, funding, liquidations, sentiment, chat) used
+to be CSVs that were read, concatenated and rewritten on every update, so
+each write cost O(history). Here every series is rows in one SQLite table,
+indexed on (series, ts):
+
+    balances = history_store.series("portfolio_balance")
+    balances.append({"timestamp": now, "balance": 123.4})   # one INSERT
+    df = balances.frame(start=now - timedelta(hours=24))    # time-range query
+    balances.prune(max_age=timedelta(days=30))              # retention
+
+WAL mode lets several agents (threads or processes) write at the same time.
+Readers never block writers, and writers wait on busy_timeout instead of
+failing. `migrate_csv` imports a legacy CSV once, the first time a series is
+empty.
+"""
+
+import json
+import math
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+DEFAULT_HISTORY_PATH = Path(__file__).parent / "history.db"
+BUSY_TIMEOUT_MS = 5000
+
+TimeLike = Union[datetime, pd.Timestamp, str, float, int, None]
+
+
+def _to_epoch(value: TimeLike) -> Optional[float]:
+    """Unix seconds from a datetime, timestamp string or number (naive times are local)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    try:
+        ts = pd.Timestamp(value)
+    except (TypeError, ValueError):
+        return None
+    if ts is pd.NaT:
+        return None
+    if ts.tzinfo is None:
+        return ts.to_pydatetime().timestamp()
+    return ts.timestamp()
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _clean(row: dict) -> dict:
+    # JSON has no NaN, store missing values as null
+    return {
+        key: None if isinstance(value, float) and math.isnan(value) else value
+        for key, value in row.items()
+    }
+
+
+class HistorySeries:
+    """One named time series in a HistoryStore"""
+
+    def __init__(self, store: "HistoryStore", name: str, time_column: str = "timestamp"):
+        self.store = store
+        self.name = name
+        self.time_column = time_column
+
+    def _ts(self, row: dict) -> float:
+        ts = _to_epoch(row.get(self.time_column))
+        return datetime.now().timestamp() if ts is None else ts
+
+    def append(self, row: dict) -> None:
+        """Add one row, O(1) however long the history is"""
+        self.extend([row])
+
+    def extend(self, rows: Iterable[dict]) -> int:
+        """Add many rows in one transaction"""
+        records = [
+            (self.name, self._ts(row), json.dumps(_clean(row), default=_json_default))
+            for row in rows
+        ]
+        if records:
+            with self.store.transaction() as conn:
+                conn.executemany("INSERT INTO history (series, ts, data) VALUES (?, ?, ?)", records)
+        return len(records)
+
+    def rows(self, start: TimeLike = None, end: TimeLike = None, limit: Optional[int] = None,
+             newest_first: bool = False) -> List[dict]:
+        """Rows with start <= time <= end, oldest first unless newest_first"""
+        query = "SELECT data FROM history WHERE series = ?"
+        params = [self.name]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(_to_epoch(start))
+        if end is not None:
+            query += " AND ts <= ?"
+            params.append(_to_epoch(end))
+        query += f" ORDER BY ts {'DESC' if newest_first else 'ASC'}, id {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self.store.lock:
+            found = self.store.conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in found]
+
+    def frame(self, start: TimeLike = None, end: TimeLike = None, limit: Optional[int] = None,
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Time-range query as a DataFrame, time column parsed to datetime"""
+        if limit is not None:
+            rows = self.rows(start, end, limit=limit, newest_first=True)[::-1]
+        else:
+            rows = self.rows(start, end)
+        df = pd.DataFrame(rows, columns=columns)
+        if columns is None and not rows:
+            df = pd.DataFrame(columns=[self.time_column])
+        if self.time_column in df.columns:
+            df[self.time_column] = pd.to_datetime(df[self.time_column])
+        return df
+
+    def arrays(self, columns: List[str], start: TimeLike = None):
+        """Epoch seconds and float columns as NumPy arrays, oldest first (missing values NaN)"""
+        fields = ", ".join("json_extract(data, ?)" for _ in columns)
+        query = f"SELECT ts{', ' + fields if columns else ''} FROM history WHERE series = ?"
+        params = [f'$."{name}"' for name in columns] + [self.name]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(_to_epoch(start))
+        query += " ORDER BY ts, id"
+        with self.store.lock:
+            found = self.store.conn.execute(query, params).fetchall()
+        table = np.array(found, dtype=np.float64).reshape(len(found), len(columns) + 1)
+        return table[:, 0], {name: table[:, i + 1] for i, name in enumerate(columns)}
+
+    def last(self) -> Optional[dict]:
+        """Most recent row, or None"""
+        found = self.rows(limit=1, newest_first=True)
+        return found[0] if found else None
+
+    def last_time(self) -> Optional[datetime]:
+        with self.store.lock:
+            (ts,) = self.store.conn.execute(
+                "SELECT MAX(ts) FROM history WHERE series = ?", (self.name,)
+            ).fetchone()
+        return None if ts is None else datetime.fromtimestamp(ts)
+
+    def count(self) -> int:
+        with self.store.lock:
+            return self.store.conn.execute(
+                "SELECT COUNT(*) FROM history WHERE series = ?", (self.name,)
+            ).fetchone()[0]
+
+    def prune(self, max_age: Optional[timedelta] = None, before: TimeLike = None) -> int:
+        """Retention: delete rows older than max_age (or before a time), returns rows removed"""
+        cutoff = _to_epoch(before) if before is not None else (datetime.now() - max_age).timestamp()
+        with self.store.transaction() as conn:
+            return conn.execute(
+                "DELETE FROM history WHERE series = ? AND ts < ?", (self.name, cutoff)
+            ).rowcount
+
+    def migrate_csv(self, csv_path) -> int:
+        """One-time import of a legacy CSV history into an empty series"""
+        csv_path = Path(csv_path)
+        if not csv_path.exists() or self.count():
+            return 0
+        try:
+            df = pd.read_csv(csv_path)
+        except Exception as e:
+            print(f"⚠️ Could not import {csv_path.name}: {str(e)}")
+            return 0
+        imported = self.extend(df.to_dict("records"))
+        print(f"📦 Imported {imported} rows from {csv_path.name} into the history store")
+        return imported
+
+
+class HistoryStore:
+    """SQLite-backed, append-only store for many time series"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.lock = threading.RLock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        # Opened on first use so importing the module never touches disk
+        with self.lock:
+            if self._conn is None:
+                self._conn = self._connect()
+        return self._conn
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints, fast appends
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                series TEXT NOT NULL,
+                ts REAL NOT NULL,
+                data TEXT NOT NULL
+            )"""
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS history_series_ts ON history (series, ts)")
+        conn.commit()
+        return conn
+
+    def transaction(self):
+        return _Transaction(self)
+
+    def series(self, name: str, time_column: str = "timestamp") -> HistorySeries:
+        return HistorySeries(self, name, time_column)
+
+
+class _Transaction:
+    """Lock the shared connection and commit (or roll back) around a block"""
+
+    def __init__(self, store: HistoryStore):
+        self.store = store
+
+    def __enter__(self):
+        self.store.lock.acquire()
+        return self.store.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.store.conn.commit()
+            else:
+                self.store.conn.rollback()
+        finally:
+            self.store.lock.release()
+        return False
+
+
+# Shared store used by all agents
+history_store = HistoryStore()
@@ -0,0 +1,445 @@
+"""
+🌙 Moon Dev's Indicator Engine
+One vectorized pass for every technical indicator the agents use
+Built with love by Moon Dev 🚀
+
+Declare the indicator set once, compute it over a contiguous float64 close
+array, then keep it current with `append()` as new bars arrive. Each
+indicator keeps its own rolling state, so an append costs O(1) per
+indicator no matter how much history came before it.
+
+    engine = IndicatorEngine([SMA(20), RSI(14), MACD()])
+    df = engine.apply(df, column='close')     # full history, one pass
+    latest = engine.append(new_close)         # O(1) per indicator
+
+The rolling state is plain JSON (`get_state()` / `set_state()`), so an
+IndicatorStream can be saved to disk and resumed after a restart without
+refetching the warm-up history.
+"""
+
+import json
+import math
+import os
+from collections import deque
+import numpy as np
+import pandas as pd
+
+
+def _as_array(values):
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _sma(x, n):
+    """Simple moving average via cumulative sums, NaN until n values are seen"""
+    out = np.full(len(x), np.nan)
+    if len(x) >= n:
+        cs = np.cumsum(np.insert(x, 0, 0.0))
+        out[n - 1:] = (cs[n:] - cs[:-n]) / n
+    return out
+
+
+def _plain(value):
+    """JSON-friendly copy of a state value (deques and NumPy scalars included)"""
+    if isinstance(value, (deque, list, tuple, np.ndarray)):
+        return [float(v) for v in value]
+    if isinstance(value, (float, np.floating, int, np.integer)):
+        return float(value)
+    return value
+
+
+def _seeded_ewm(x, alpha, n, seed_at):
+    """Recursive average y[t] = y[t-1] + alpha * (x[t] - y[t-1])
+
+    Seeded with the mean of the n values ending at seed_at, the convention
+    used by pandas_ta EMA. Output before seed_at is NaN.
+    """
+    out = np.full(len(x), np.nan)
+    if seed_at >= len(x) or seed_at - n + 1 < 0:
+        return out
+    tail = x[seed_at:].copy()
+    tail[0] = x[seed_at - n + 1:seed_at + 1].mean()
+    # pandas' ewm(adjust=False) runs the recursion in compiled code
+    out[seed_at:] = pd.Series(tail).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+
+class _Indicator:
+    """Shared state (de)serialisation, driven by each class's _state_fields"""
+    _state_fields = ()
+
+    def get_state(self):
+        return {name: _plain(getattr(self, name)) for name in self._state_fields}
+
+    def set_state(self, state):
+        for name in self._state_fields:
+            current = getattr(self, name)
+            value = state[name]
+            if isinstance(current, deque):
+                value = deque(value, maxlen=current.maxlen)
+            setattr(self, name, value)
+
+
+class SMA(_Indicator):
+    """Simple moving average"""
+    _state_fields = ('_window', '_sum', '_since_resync')
+
+    def __init__(self, length, name=None):
+        self.length = length
+        self.name = name or f"SMA_{length}"
+        self.outputs = [self.name]
+        self.reset()
+
+    def reset(self):
+        self._window = deque(maxlen=self.length)
+        self._sum = 0.0
+        self._since_resync = 0
+
+    def compute(self, close):
+        self.reset()
+        self._window.extend(close[-self.length:])
+        self._sum = float(np.sum(self._window))
+        return {self.name: _sma(close, self.length)}
+
+    def update(self, value):
+        if len(self._window) == self.length:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+        # Re-add the window now and then so float drift never accumulates
+        self._since_resync += 1
+        if self._since_resync >= self.length:
+            self._sum = math.fsum(self._window)
+            self._since_resync = 0
+        value = self._sum / self.length if len(self._window) == self.length else np.nan
+        return {self.name: value}
+
+
+class EMA(_Indicator):
+    """Exponential moving average seeded with the SMA of the first `length` bars"""
+    _state_fields = ('_seed', 'value')
+
+    def __init__(self, length, name=None):
+        self.length = length
+        self.alpha = 2.0 / (length + 1)
+        self.name = name or f"EMA_{length}"
+        self.outputs = [self.name]
+        self.reset()
+
+    def reset(self):
+        self._seed = []
+        self.value = np.nan
+
+    def compute(self, close):
+        self.reset()
+        out = _seeded_ewm(close, self.alpha, self.length, self.length - 1)
+        if len(close) >= self.length:
+            self.value = out[-1]
+        else:
+            self._seed = list(close)
+        return {self.name: out}
+
+    def update(self, value):
+        if np.isnan(self.value):
+            self._seed.append(value)
+            if len(self._seed) == self.length:
+                self.value = float(np.mean(self._seed))
+                self._seed = []
+        else:
+            self.value += self.alpha * (value - self.value)
+        return {self.name: self.value}
+
+
+class RSI(_Indicator):
+    """Relative strength index, pandas_ta's formula
+
+    pandas_ta smooths gains and losses with rma: ewm(alpha=1/length,
+    min_periods=length) with adjust=True and no SMA seed. The adjusted
+    average is a ratio of two decaying sums, so updates keep those sums.
+    """
+    _state_fields = ('_prev', '_seen', 'gain_sum', 'loss_sum', 'weight')
+
+    def __init__(self, length=14, name=None):
+        self.length = length
+        self.name = name or f"RSI_{length}"
+        self.outputs = [self.name]
+        self.reset()
+
+    def reset(self):
+        self._prev = np.nan
+        self._seen = 0  # price changes folded into the sums
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.weight = 0.0
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100.0 * avg_gain / (avg_gain + avg_loss)
+
+    def compute(self, close):
+        self.reset()
+        n = self.length
+        delta = pd.Series(close).diff()
+        gains, losses = delta.clip(lower=0), (-delta).clip(lower=0)
+        avg_gain = gains.ewm(alpha=1.0 / n, min_periods=n).mean().to_numpy()
+        avg_loss = losses.ewm(alpha=1.0 / n, min_periods=n).mean().to_numpy()
+        out = self._rsi(avg_gain, avg_loss)
+
+        if len(close):
+            self._prev = close[-1]
+        if len(close) > 1:
+            # The same decaying sums ewm used, so update() carries on from here
+            g, l = gains.to_numpy()[1:], losses.to_numpy()[1:]
+            w = (1.0 - 1.0 / n) ** np.arange(len(g) - 1, -1, -1)
+            self._seen = len(g)
+            self.gain_sum, self.loss_sum, self.weight = float(w @ g), float(w @ l), float(w.sum())
+        return {self.name: out}
+
+    def update(self, value):
+        if np.isnan(self._prev):
+            self._prev = value
+            return {self.name: np.nan}
+        change = value - self._prev
+        self._prev = value
+
+        decay = 1.0 - 1.0 / self.length
+        self.gain_sum = self.gain_sum * decay + max(change, 0.0)
+        self.loss_sum = self.loss_sum * decay + max(-change, 0.0)
+        self.weight = self.weight * decay + 1.0
+        self._seen += 1
+        if self._seen < self.length:
+            return {self.name: np.nan}
+        return {self.name: float(self._rsi(self.gain_sum / self.weight, self.loss_sum / self.weight))}
+
+
+class MACD(_Indicator):
+    """MACD line, histogram and signal (pandas_ta column names)"""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast, self.slow, self.signal = fast, slow, signal
+        suffix = f"{fast}_{slow}_{signal}"
+        self.line_name, self.hist_name, self.signal_name = f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"
+        self.outputs = [self.line_name, self.hist_name, self.signal_name]
+        self.reset()
+
+    def reset(self):
+        self._fast = EMA(self.fast)
+        self._slow = EMA(self.slow)
+        self._signal = EMA(self.signal)
+
+    def compute(self, close):
+        self.reset()
+        fast = self._fast.compute(close)[self._fast.name]
+        slow = self._slow.compute(close)[self._slow.name]
+        line = fast - slow
+
+        signal = np.full(len(close), np.nan)
+        start = self.slow - 1
+        if len(close) > start:
+            signal[start:] = self._signal.compute(line[start:])[self._signal.name]
+        return {self.line_name: line, self.hist_name: line - signal, self.signal_name: signal}
+
+    def update(self, value):
+        fast = self._fast.update(value)[self._fast.name]
+        slow = self._slow.update(value)[self._slow.name]
+        line = fast - slow
+        signal = self._signal.update(line)[self._signal.name] if not np.isnan(line) else np.nan
+        return {self.line_name: line, self.hist_name: line - signal, self.signal_name: signal}
+
+    def get_state(self):
+        return {"fast": self._fast.get_state(), "slow": self._slow.get_state(), "signal": self._signal.get_state()}
+
+    def set_state(self, state):
+        self._fast.set_state(state["fast"])
+        self._slow.set_state(state["slow"])
+        self._signal.set_state(state["signal"])
+
+
+class BBands(_Indicator):
+    """Bollinger Bands (pandas_ta column names, population std)"""
+    _state_fields = ('_window',)
+
+    def __init__(self, length=5, std=2.0):
+        self.length, self.std = length, float(std)
+        suffix = f"{length}_{self.std}"
+        self.names = {key: f"{key}_{suffix}" for key in ("BBL", "BBM", "BBU", "BBB", "BBP")}
+        self.outputs = list(self.names.values())
+        self.reset()
+
+    def reset(self):
+        self._window = deque(maxlen=self.length)
+
+    def _bands(self, close, mid, dev):
+        lower, upper = mid - self.std * dev, mid + self.std * dev
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bandwidth = 100.0 * (upper - lower) / mid
+            percent = (close - lower) / (upper - lower)
+        return {
+            self.names["BBL"]: lower,
+            self.names["BBM"]: mid,
+            self.names["BBU"]: upper,
+            self.names["BBB"]: bandwidth,
+            self.names["BBP"]: percent,
+        }
+
+    def compute(self, close):
+        self.reset()
+        self._window.extend(close[-self.length:])
+        n = self.length
+        mid = _sma(close, n)
+        dev = np.full(len(close), np.nan)
+        if len(close) >= n:
+            dev[n - 1:] = np.lib.stride_tricks.sliding_window_view(close, n).std(axis=1)
+        return self._bands(close, mid, dev)
+
+    def update(self, value):
+        self._window.append(value)
+        if len(self._window) < self.length:
+            return {name: np.nan for name in self.outputs}
+        window = np.fromiter(self._window, dtype=np.float64, count=self.length)
+        return {k: float(v) for k, v in self._bands(value, window.mean(), window.std()).items()}
+
+
+class IndicatorEngine:
+    """Computes a declared indicator set in one pass and updates it per bar"""
+
+    def __init__(self, indicators):
+        self.indicators = list(indicators)
+        self.outputs = [name for ind in self.indicators for name in ind.outputs]
+
+    def compute(self, close):
+        """All indicator columns for a close series, priming incremental state"""
+        close = _as_array(close)
+        columns = {}
+        for indicator in self.indicators:
+            columns.update(indicator.compute(close))
+        return columns
+
+    def append(self, close):
+        """Latest indicator values after one new close, O(1) per indicator"""
+        close = float(close)
+        values = {}
+        for indicator in self.indicators:
+            values.update(indicator.update(close))
+        return values
+
+    def apply(self, df, column='close'):
+        """Copy of df with every indicator column added in one concat"""
+        if df.empty:
+            return df
+        columns = self.compute(df[column].to_numpy())
+        new = pd.DataFrame(columns, index=df.index)
+        return pd.concat([df.drop(columns=[c for c in new.columns if c in df.columns]), new], axis=1)
+
+    def get_state(self):
+        return {"outputs": self.outputs, "indicators": [ind.get_state() for ind in self.indicators]}
+
+    def set_state(self, state):
+        if state["outputs"] != self.outputs:
+            raise ValueError(f"Indicator state is for {state['outputs']}, engine computes {self.outputs}")
+        for indicator, indicator_state in zip(self.indicators, state["indicators"]):
+            indicator.set_state(indicator_state)
+
+
+class IndicatorStream:
+    """Live OHLCV + indicator window for one series, advanced one closed candle at a time
+
+    Keeps the last `history` rows alongside the engine's rolling state. Both
+    round-trip through JSON, so a restarted process picks up where it stopped.
+    """
+    BASE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+    def __init__(self, engine, history=100):
+        self.engine = engine
+        self.history = history
+        self.rows = deque(maxlen=history)
+        self.last_timestamp = None  # epoch ms of the newest closed candle
+        self.meta = {}  # caller-owned extras saved alongside the state
+
+    @staticmethod
+    def _ms(timestamps):
+        return np.asarray(pd.to_datetime(timestamps), dtype='datetime64[ms]').astype(np.int64)
+
+    def prime(self, df):
+        """Compute the full indicator set over closed candles and keep the tail"""
+        self.rows.clear()
+        self.last_timestamp = None
+        if df.empty:
+            return
+        columns = self.engine.compute(df['close'].to_numpy())
+        t = self._ms(df['timestamp'])
+        ohlcv = df[self.BASE_COLUMNS[1:]].to_numpy(dtype=np.float64)
+        values = np.column_stack([t, ohlcv] + [columns[name] for name in self.engine.outputs])
+        self.rows.extend(values[-self.history:].tolist())
+        self.last_timestamp = int(t[-1])
+
+    def update(self, df):
+        """Feed closed candles, skipping ones already seen. Returns rows added"""
+        if df.empty:
+            return 0
+        t = self._ms(df['timestamp'])
+        ohlcv = df[self.BASE_COLUMNS[1:]].to_numpy(dtype=np.float64)
+        added = 0
+        for ts, bar in zip(t, ohlcv):
+            if self.last_timestamp is not None and ts <= self.last_timestamp:
+                continue
+            values = self.engine.append(bar[3])
+            self.rows.append([float(ts)] + bar.tolist() + [float(values[name]) for name in self.engine.outputs])
+            self.last_timestamp = int(ts)
+            added += 1
+        return added
+
+    def frame(self):
+        """The kept window as a DataFrame shaped like nice_funcs_hl.get_data output"""
+        df = pd.DataFrame(list(self.rows), columns=self.BASE_COLUMNS + self.engine.outputs)
+        df['timestamp'] = pd.to_datetime(df['timestamp'].astype('int64'), unit='ms')
+        return df
+
+    def to_dict(self):
+        return {
+            "last_timestamp": self.last_timestamp,
+            "history": self.history,
+            "rows": list(self.rows),
+            "engine": self.engine.get_state(),
+            "meta": self.meta,
+        }
+
+    def load_dict(self, state):
+        self.engine.set_state(state["engine"])
+        self.history = max(self.history, state["history"])
+        self.rows = deque(state["rows"], maxlen=self.history)
+        self.last_timestamp = state["last_timestamp"]
+        self.meta = state.get("meta", {})
+
+    def save(self, path):
+        """Write the stream to path atomically"""
+        path = str(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """Resume from a saved stream, returns False if there is none"""
+        if not os.path.exists(path):
+            return False
+        with open(path) as f:
+            self.load_dict(json.load(f))
+        return True
+
+
+# Indicator sets used by the agents (fresh engine each call, state is per series)
+def coingecko_indicators():
+    """MA20/MA40/RSI columns of nice_funcs.get_data"""
+    return IndicatorEngine([SMA(20, name="MA20"), SMA(40, name="MA40"), RSI(14, name="RSI")])
+
+
+def hyperliquid_indicators():
+    """Columns of nice_funcs_hl.add_technical_indicators"""
+    return IndicatorEngine([SMA(20, name="sma_20"), SMA(50, name="sma_50"), RSI(14, name="rsi"), MACD(), BBands()])
+
+
+def chart_indicators():
+    """Moving averages drawn by the chart analysis agent"""
+    return IndicatorEngine([SMA(20, name="SMA20"), SMA(50, name="SMA50"), SMA(200, name="SMA200")])
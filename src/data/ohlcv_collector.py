@@ -11,6 +11,10 @@ from datetime import datetime
 import os
 from termcolor import colored, cprint
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Seconds spent collecting each token during the last collect_all_tokens run
+last_collection_latency = {}
 
 def collect_token_data(contract_address, days_back=DAYSBACK_4_DATA, timeframe=DATA_TIMEFRAME):
     """Collect OHLCV data for a single token"""
@@ -45,20 +49,53 @@ def collect_token_data(contract_address, days_back=DAYSBACK_4_DATA, timeframe=DA
         cprint(f"❌ Moon Dev's AI Agent encountered an error: {str(e)}", "white", "on_red")
         return None
 
-def collect_all_tokens():
-    """Collect OHLCV data for all monitored tokens"""
-    market_data = {}
-    
-    cprint("\n🔍 Moon Dev's AI Agent starting market data collection...", "white", "on_blue")
-    
-    for contract_address in MONITORED_TOKENS:
-        data = collect_token_data(contract_address)
-        if data is not None:
-            market_data[contract_address] = data
-            time.sleep(6)  # Add a delay to avoid rate limiting
-            
-    cprint("\n✨ Moon Dev's AI Agent completed market data collection!", "white", "on_green")
-    
+def _timed_collect(contract_address):
+    """Collect one token and measure how long it took"""
+    start = time.perf_counter()
+    data = collect_token_data(contract_address)
+    return data, time.perf_counter() - start
+
+def collect_all_tokens(tokens=None, max_workers=OHLCV_MAX_WORKERS):
+    """Collect OHLCV data for all monitored tokens in parallel
+
+    Requests are paced by the shared CoinGecko token bucket in nice_funcs, so
+    cycle time depends on the API quota instead of a fixed sleep per token.
+    Per-token latency is stored in `last_collection_latency` and on each
+    DataFrame's `attrs['fetch_latency_s']`.
+    """
+    tokens = list(tokens) if tokens is not None else list(MONITORED_TOKENS)
+    results = {}
+    last_collection_latency.clear()
+
+    cprint(f"\n🔍 Moon Dev's AI Agent starting market data collection for {len(tokens)} tokens ({max_workers} workers)...", "white", "on_blue")
+    cycle_start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {pool.submit(_timed_collect, token): token for token in tokens}
+        for future in as_completed(futures):
+            token = futures[future]
+            try:
+                data, latency = future.result()
+            except Exception as e:
+                cprint(f"❌ Moon Dev's AI Agent failed collecting {token[:4]}: {str(e)}", "white", "on_red")
+                continue
+
+            last_collection_latency[token] = latency
+            if data is not None:
+                data.attrs['fetch_latency_s'] = latency
+                results[token] = data
+
+    # Keep the caller's token order regardless of completion order
+    market_data = {token: results[token] for token in tokens if token in results}
+
+    cprint(f"\n⏱️ Collection latency per token:", "white", "on_blue")
+    for token in tokens:
+        if token in last_collection_latency:
+            status = "✅" if token in market_data else "❌"
+            print(f"  {status} {token[:8]}: {last_collection_latency[token]:.2f}s")
+
+    cprint(f"\n✨ Moon Dev's AI Agent completed market data collection in {time.perf_counter() - cycle_start:.2f}s!", "white", "on_green")
+
     return market_data
 
 if __name__ == "__main__":
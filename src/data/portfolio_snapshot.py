@@ -0,0 +1,82 @@
+"""
+🌙 Moon Dev's Portfolio Snapshot
+One immutable view of wallet balances and prices shared by every agent in a cycle
+Built with love by Moon Dev 🚀
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class PortfolioSnapshot:
+    """Balances and USD prices for one wallet, captured at a single point in time"""
+    wallet: str
+    timestamp: datetime
+    balances: Mapping[str, float]
+    prices: Mapping[str, float]
+    _created: float = field(default_factory=time.monotonic, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Freeze the mappings so no agent can mutate a shared snapshot
+        object.__setattr__(self, 'balances', MappingProxyType(dict(self.balances)))
+        object.__setattr__(self, 'prices', MappingProxyType(dict(self.prices)))
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self._created
+
+    def balance(self, mint: str) -> float:
+        return self.balances.get(mint, 0.0)
+
+    def price(self, mint: str) -> Optional[float]:
+        return self.prices.get(mint)
+
+    def usd_value(self, mint: str) -> float:
+        return self.balance(mint) * (self.price(mint) or 0.0)
+
+    def total_value(self, mints: Optional[Iterable[str]] = None) -> float:
+        """Sum of USD values, over every held mint or just the given ones"""
+        mints = self.balances.keys() if mints is None else dict.fromkeys(mints)
+        return sum(self.usd_value(mint) for mint in mints)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Holdings in the same shape as nice_funcs.fetch_wallet_holdings_og"""
+        rows = [
+            {"Mint Address": mint, "Balance": balance, "USD Value": self.usd_value(mint)}
+            for mint, balance in self.balances.items()
+        ]
+        return pd.DataFrame(rows, columns=["Mint Address", "Balance", "USD Value"])
+
+
+class SnapshotCache:
+    """Holds the latest snapshot per wallet until it expires or is invalidated"""
+
+    def __init__(self, loader: Callable[[str], PortfolioSnapshot], ttl: float):
+        self.loader = loader
+        self.ttl = ttl
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def get(self, wallet: str, max_age: Optional[float] = None) -> PortfolioSnapshot:
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            snapshot = self._snapshots.get(wallet)
+            if snapshot is None or snapshot.age_seconds > max_age:
+                # Loading under the lock means concurrent agents share one RPC scan
+                snapshot = self.loader(wallet)
+                self._snapshots[wallet] = snapshot
+            return snapshot
+
+    def invalidate(self, wallet: Optional[str] = None) -> None:
+        """Drop a wallet's snapshot (or all of them) so the next read reloads"""
+        with self._lock:
+            if wallet is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(wallet, None)
@@ -0,0 +1,122 @@
+"""
+🌙 Moon Dev's Price Oracle
+Batched, TTL-cached token prices shared by every caller in the process
+Built with love by Moon Dev 🚀
+
+All mints that miss the cache are fetched together in one batched request.
+Callers asking for a mint that is already being fetched wait for that
+request instead of starting their own. If a refresh fails, the last known
+quote is served with `stale=True` for up to `max_stale` seconds.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+
+@dataclass(frozen=True)
+class PriceQuote:
+    """A USD price for one mint and when it was fetched"""
+    mint: str
+    price: Optional[float]
+    timestamp: datetime
+    fetched_at: float  # time.monotonic() at fetch
+    stale: bool = False
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class PriceOracle:
+    """Batches, caches and de-duplicates price lookups"""
+
+    def __init__(self, fetch_many: Callable[[list], Dict[str, float]], ttl: float = 10, max_stale: float = 120):
+        self.fetch_many = fetch_many
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._quotes: Dict[str, PriceQuote] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "requests": 0, "errors": 0}
+
+    def quotes(self, mints: Iterable[str], max_age: Optional[float] = None) -> Dict[str, PriceQuote]:
+        """Quotes for every mint, fetching whatever is missing in one batch"""
+        mints = list(dict.fromkeys(mints))
+        max_age = self.ttl if max_age is None else max_age
+        result = {}
+        to_fetch, to_wait = [], []
+
+        with self._lock:
+            for mint in mints:
+                quote = self._quotes.get(mint)
+                if quote is not None and quote.age_seconds <= max_age:
+                    self.stats["hits"] += 1
+                    result[mint] = quote
+                elif mint in self._inflight:
+                    to_wait.append(mint)
+                else:
+                    self.stats["misses"] += 1
+                    self._inflight[mint] = threading.Event()
+                    to_fetch.append(mint)
+
+        if to_fetch:
+            self._refresh(to_fetch)
+
+        for mint in to_wait:
+            event = self._inflight.get(mint)
+            if event is not None:
+                event.wait()
+
+        with self._lock:
+            for mint in mints:
+                if mint not in result:
+                    result[mint] = self._serve(mint)
+        return result
+
+    def _refresh(self, mints):
+        """Fetch one batch and publish it to waiting callers"""
+        try:
+            self.stats["requests"] += 1
+            prices = self.fetch_many(mints) or {}
+        except Exception as e:
+            print(f"❌ Price oracle fetch failed for {len(mints)} tokens: {str(e)}")
+            self.stats["errors"] += 1
+            prices = {}
+
+        now, fetched_at = datetime.now(), time.monotonic()
+        with self._lock:
+            for mint in mints:
+                if prices.get(mint) is not None:
+                    self._quotes[mint] = PriceQuote(mint, float(prices[mint]), now, fetched_at)
+                self._inflight.pop(mint).set()
+
+    def _serve(self, mint) -> PriceQuote:
+        """Cached quote marked stale if past the TTL, or an empty quote"""
+        quote = self._quotes.get(mint)
+        if quote is None or quote.age_seconds > self.max_stale:
+            return PriceQuote(mint, None, datetime.now(), time.monotonic(), stale=True)
+        if quote.age_seconds > self.ttl:
+            return replace(quote, stale=True)
+        return quote
+
+    def prices(self, mints: Iterable[str], max_age: Optional[float] = None) -> Dict[str, float]:
+        """Prices for every mint that has one, in a plain dict"""
+        return {
+            mint: quote.price
+            for mint, quote in self.quotes(mints, max_age).items()
+            if quote.price is not None
+        }
+
+    def price(self, mint: str, max_age: Optional[float] = None) -> Optional[float]:
+        return self.quotes([mint], max_age)[mint].price
+
+    def invalidate(self, mints: Optional[Iterable[str]] = None) -> None:
+        with self._lock:
+            if mints is None:
+                self._quotes.clear()
+            else:
+                for mint in mints:
+                    self._quotes.pop(mint, None)
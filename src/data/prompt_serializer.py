@@ -0,0 +1,195 @@
+"""
+🌙 Moon Dev's Prompt Serializer
+Compact, token-budgeted market data for LLM prompts
+Built with love by Moon Dev 🚀
+
+Dumping a whole OHLCV DataFrame into a prompt costs thousands of tokens of
+prefill, and local models truncate the tail (the most recent bars) first.
+`summarize_ohlcv` turns a frame into a short summary with a fixed layout:
+
+    bars=72 from=2025-01-03 10:00 to=2025-01-06 09:00
+    close=0.01234 chg%: 1b=-0.4 6b=+2.1 all=+8.3 | range=0.0109-0.0131 | vol=182340 | sd%=1.7
+    ind: MA20=0.01201 (Δ6b +0.8%) | RSI=61.2 (Δ6b +4.3) | ...
+    flags: Price_above_MA20=1 Price_above_MA40=1 MA20_above_MA40=0
+    recent t,o,h,l,c,v:
+    01-06 04:00,0.0121,0.0123,0.0120,0.0122,2410
+    ...
+
+Tokens are estimated before sending. If a summary is over budget, recent
+bars are dropped first, then the indicator deltas.
+"""
+
+import math
+import re
+import numpy as np
+import pandas as pd
+
+DEFAULT_TOKEN_BUDGET = 600
+DEFAULT_RECENT_BARS = 12
+DELTA_BARS = 6  # Indicator change is reported over this many bars
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+_TIME_COLUMNS = ("datetime (utc)", "datetime", "timestamp", "time", "date")
+_OHLCV = ("open", "high", "low", "close", "volume")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count: words, digit runs of up to 3, and punctuation
+
+    Numbers are what blow up market data prompts, and tokenizers split them
+    into short digit groups, so this tracks real counts far better than len/4.
+    """
+    return len(_TOKEN_PATTERN.findall(text or ""))
+
+
+def fmt_number(value) -> str:
+    """Shortest readable form: 5 significant digits, no trailing zeros"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "-"
+    if isinstance(value, (bool, np.bool_)):
+        return "1" if value else "0"
+    value = float(value)
+    if value == 0:
+        return "0"
+    if abs(value) >= 1e5:
+        return f"{value:.0f}"
+    return f"{value:.5g}"
+
+
+def _pct(new, old) -> str:
+    if old is None or new is None or not old or math.isnan(old) or math.isnan(new):
+        return "-"
+    return f"{(new / old - 1) * 100:+.1f}"
+
+
+def _columns(df):
+    """Map the frame's columns onto time, OHLCV, numeric indicators and boolean flags"""
+    lower = {str(c).lower(): c for c in df.columns}
+    time_col = next((lower[name] for name in _TIME_COLUMNS if name in lower), None)
+    ohlcv = {name: lower.get(name) for name in _OHLCV}
+    if ohlcv["close"] is None and "price" in lower:
+        ohlcv["close"] = lower["price"]
+    known = {time_col, lower.get("price"), *ohlcv.values()}
+
+    flags, indicators = [], []
+    for col in df.columns:
+        if col in known:
+            continue
+        dtype = df[col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            flags.append(col)
+        elif pd.api.types.is_numeric_dtype(dtype):
+            indicators.append(col)
+    return time_col, ohlcv, indicators, flags
+
+
+def _fmt_time(value, short=False):
+    try:
+        ts = pd.Timestamp(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return ts.strftime("%m-%d %H:%M" if short else "%Y-%m-%d %H:%M")
+
+
+def _header(df, time_col, ohlcv):
+    close = df[ohlcv["close"]].astype(float).to_numpy()
+    last = close[-1]
+    lines = []
+    span = f"bars={len(df)}"
+    if time_col is not None:
+        span += f" from={_fmt_time(df[time_col].iloc[0])} to={_fmt_time(df[time_col].iloc[-1])}"
+    lines.append(span)
+
+    parts = [
+        f"close={fmt_number(last)} chg%: 1b={_pct(last, close[-2] if len(close) > 1 else None)}"
+        f" {DELTA_BARS}b={_pct(last, close[-DELTA_BARS - 1] if len(close) > DELTA_BARS else None)}"
+        f" all={_pct(last, close[0])}"
+    ]
+    high = df[ohlcv["high"]] if ohlcv["high"] is not None else df[ohlcv["close"]]
+    low = df[ohlcv["low"]] if ohlcv["low"] is not None else df[ohlcv["close"]]
+    parts.append(f"range={fmt_number(low.min())}-{fmt_number(high.max())}")
+    if ohlcv["volume"] is not None:
+        parts.append(f"vol={fmt_number(df[ohlcv['volume']].astype(float).sum())}")
+    returns = np.diff(close) / close[:-1] if len(close) > 1 else np.array([])
+    returns = returns[np.isfinite(returns)]
+    if len(returns):
+        parts.append(f"sd%={returns.std() * 100:.2f}")
+    lines.append(" | ".join(parts))
+    return lines
+
+
+def _indicator_line(df, indicators, with_deltas):
+    items = []
+    for col in indicators:
+        series = df[col].astype(float).to_numpy()
+        last = series[-1]
+        if math.isnan(last):
+            continue
+        item = f"{col}={fmt_number(last)}"
+        if with_deltas and len(series) > DELTA_BARS and not math.isnan(series[-DELTA_BARS - 1]):
+            prev = series[-DELTA_BARS - 1]
+            # RSI reads better as a change in points, price-like values as %
+            delta = f"{last - prev:+.1f}" if "rsi" in str(col).lower() else f"{_pct(last, prev)}%"
+            item += f" (Δ{DELTA_BARS}b {delta})"
+        items.append(item)
+    return "ind: " + " | ".join(items) if items else None
+
+
+def _recent_rows(df, time_col, ohlcv, count):
+    cols = [ohlcv[name] for name in _OHLCV if ohlcv[name] is not None]
+    names = [name[0] for name in _OHLCV if ohlcv[name] is not None]
+    tail = df.tail(count)
+    header = "recent " + ",".join((["t"] if time_col is not None else []) + names) + ":"
+    rows = []
+    for _, row in tail.iterrows():
+        values = [fmt_number(row[c]) for c in cols]
+        if time_col is not None:
+            values.insert(0, _fmt_time(row[time_col], short=True))
+        rows.append(",".join(values))
+    return [header] + rows
+
+
+def summarize_ohlcv(df, budget: int = DEFAULT_TOKEN_BUDGET, recent_bars: int = DEFAULT_RECENT_BARS) -> str:
+    """Fixed-schema summary of an OHLCV (+ indicators) frame within a token budget"""
+    if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+        return "no market data"
+    time_col, ohlcv, indicators, flags = _columns(df)
+    if ohlcv["close"] is None:
+        return "no close prices"
+
+    head = _header(df, time_col, ohlcv)
+    if flags:
+        last = df[flags].iloc[-1]
+        head.append("flags: " + " ".join(f"{col}={fmt_number(last[col])}" for col in flags))
+
+    with_deltas = True
+    bars = min(recent_bars, len(df))
+    while True:
+        lines = list(head)
+        ind = _indicator_line(df, indicators, with_deltas)
+        if ind:
+            lines.insert(2, ind)
+        if bars:
+            lines += _recent_rows(df, time_col, ohlcv, bars)
+        text = "\n".join(lines)
+        if estimate_tokens(text) <= budget or (bars == 0 and not with_deltas):
+            return text
+        if bars:
+            bars = bars // 2 if bars > 2 else 0
+        else:
+            with_deltas = False
+
+
+def budget_report(label: str, market_data: str, budget: int, prompt: str = None) -> str:
+    """One line for the logs: estimated size of the market data against its budget
+
+    The budget covers only the serialized market data, so that is what gets
+    compared. Pass the full prompt to also log its total, instructions included.
+    """
+    tokens = estimate_tokens(market_data)
+    line = f"📏 {label}: market data ~{tokens} tokens (budget {budget})"
+    if tokens > budget:
+        line += " ⚠️ over budget"
+    if prompt is not None:
+        line += f" | full prompt ~{estimate_tokens(prompt)} tokens"
+    return line
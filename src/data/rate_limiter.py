@@ -0,0 +1,54 @@
+"""
+🌙 Moon Dev's Rate Limiter
+Thread-safe token bucket shared by everything that talks to a rate-limited API
+Built with love by Moon Dev 🚀
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket that refills at `rate` tokens per second up to `capacity`"""
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError("🚨 TokenBucket rate must be positive!")
+        self.rate = float(rate)
+        self.capacity = float(max(capacity, 1))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls_per_minute, burst=1):
+        """Build a bucket from a calls-per-minute quota"""
+        return cls(calls_per_minute / 60.0, capacity=burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if available right now, never blocks"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        """Block until tokens are available, returns seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
@@ -0,0 +1,132 @@
+"""
+🌙 Moon Dev's Ring Buffer
+Preallocated, time-sorted NumPy columns for a rolling window of samples
+Built with love by Moon Dev 🚀
+
+Agents that poll a feed every few seconds keep the last N hours of samples
+here instead of in a DataFrame that is concatenated and filtered with a
+full boolean mask on every update:
+
+    oi = TimeRingBuffer(['btc_oi', 'total_oi'], capacity=2880, max_age=24 * 3600,
+                        cumulative=['btc_oi'])
+    oi.append(time.time(), btc_oi=1.2e10, total_oi=2.9e10)
+    oi.value_at('btc_oi', time.time() - 15 * 60)   # searchsorted, O(log n)
+    oi.mean('btc_oi', since=time.time() - 3600)     # running sums, O(log n)
+
+Rows live in arrays twice the capacity. Appends write at the end, and when
+the end is reached the live rows are copied back to the front, so an append
+is amortized O(1) and every column is always one contiguous, sorted view.
+Columns listed in `cumulative` also keep a running sum, so the mean over any
+time range costs two lookups instead of a pass over the window.
+"""
+
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+
+class TimeRingBuffer:
+    """Fixed-capacity rolling window of float columns keyed by epoch seconds"""
+
+    def __init__(self, columns: Iterable[str], capacity: int, max_age: Optional[float] = None,
+                 cumulative: Iterable[str] = ()):
+        self.columns = list(columns)
+        self.capacity = int(capacity)
+        self.max_age = max_age  # Seconds, rows older than newest - max_age are dropped
+        self.cumulative = [c for c in cumulative if c in self.columns]
+        size = 2 * self.capacity
+        self._ts = np.empty(size, dtype=np.float64)
+        self._data = {c: np.empty(size, dtype=np.float64) for c in self.columns}
+        self._sums = {c: np.empty(size, dtype=np.float64) for c in self.cumulative}
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def times(self) -> np.ndarray:
+        """Epoch seconds of the live rows, oldest first (a view, don't modify)"""
+        return self._ts[self._start:self._end]
+
+    def column(self, name: str) -> np.ndarray:
+        """Live values of one column, oldest first (a view, don't modify)"""
+        return self._data[name][self._start:self._end]
+
+    def _compact(self):
+        live = len(self)
+        for array in (self._ts, *self._data.values(), *self._sums.values()):
+            array[:live] = array[self._start:self._end]
+        self._start, self._end = 0, live
+
+    def append(self, ts: float, **values) -> None:
+        """Add the newest row; missing columns are NaN, NaN counts as 0 in running sums"""
+        if len(self) and ts < self._ts[self._end - 1]:
+            raise ValueError("TimeRingBuffer rows must be appended in time order")
+        if len(self) == self.capacity:
+            self._start += 1  # Full, drop the oldest row
+        if self._end == len(self._ts):
+            self._compact()
+
+        i = self._end
+        self._ts[i] = ts
+        for name in self.columns:
+            self._data[name][i] = values.get(name, np.nan)
+        for name in self.cumulative:
+            value = np.nan_to_num(self._data[name][i])
+            self._sums[name][i] = value + (self._sums[name][i - 1] if len(self) else 0.0)
+        self._end += 1
+
+        if self.max_age is not None:
+            self.drop_before(ts - self.max_age, inclusive=True)
+
+    def extend(self, ts: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """Bulk load rows sorted by time, e.g. from the history store"""
+        for i in range(len(ts)):
+            self.append(float(ts[i]), **{name: values[i] for name, values in columns.items()})
+
+    def drop_before(self, cutoff: float, inclusive: bool = False) -> int:
+        """Drop rows older than cutoff (or at it, if inclusive), returns rows dropped"""
+        side = 'right' if inclusive else 'left'
+        dropped = int(np.searchsorted(self.times, cutoff, side=side))
+        self._start += dropped
+        return dropped
+
+    def index_at(self, ts: float) -> Optional[int]:
+        """Position of the newest row at or before ts, or None"""
+        pos = int(np.searchsorted(self.times, ts, side='right')) - 1
+        return pos if pos >= 0 else None
+
+    def value_at(self, name: str, ts: float) -> Optional[float]:
+        """Value of a column as of ts (newest row at or before it), or None"""
+        pos = self.index_at(ts)
+        return None if pos is None else float(self.column(name)[pos])
+
+    def last(self, name: str) -> Optional[float]:
+        return float(self._data[name][self._end - 1]) if len(self) else None
+
+    def first(self, name: str) -> Optional[float]:
+        return float(self._data[name][self._start]) if len(self) else None
+
+    def change_pct(self, name: str, seconds: float, now: Optional[float] = None) -> Optional[float]:
+        """Percent change of a column from `seconds` before now to its newest value"""
+        now = self._ts[self._end - 1] if now is None and len(self) else now
+        if now is None:
+            return None
+        then, latest = self.value_at(name, now - seconds), self.last(name)
+        if not then or latest is None:
+            return None
+        return (latest - then) / then * 100
+
+    def mean(self, name: str, since: Optional[float] = None) -> Optional[float]:
+        """Mean of a cumulative column over rows at or after `since` (all rows if None)"""
+        if name not in self._sums:
+            raise KeyError(f"{name} is not a cumulative column")
+        first = 0 if since is None else int(np.searchsorted(self.times, since, side='left'))
+        count = len(self) - first
+        if count <= 0:
+            return None
+        sums = self._sums[name][self._start:self._end]
+        values = self._data[name][self._start:self._end]
+        # Sum of [first, end) = running sum at the end minus the one before `first`
+        total = sums[-1] - sums[first] + np.nan_to_num(values[first])
+        return float(total / count)
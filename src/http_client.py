@@ -0,0 +1,112 @@
+"""
+🌙 Moon Dev's HTTP Client Layer
+Pooled keep-alive sessions, default timeouts and retries for every API we hit
+Built with love by Moon Dev 🚀
+
+One requests.Session is kept per host so Jupiter, CoinGecko, Helius and
+DexScreener calls reuse warm TLS connections instead of paying a fresh
+handshake on every request. The Solana RPC client and the trading keypair
+are also built once per process.
+"""
+
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds, doubled each attempt before jitter
+BACKOFF_MAX = 8
+POOL_SIZE = 20
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url):
+    """Shared keep-alive session for the host in url"""
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def _backoff_delay(attempt, response=None):
+    """Full-jitter exponential backoff, honouring Retry-After when sent"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(method, url, max_retries=MAX_RETRIES, limiter=None, **kwargs):
+    """Send a request on the pooled session with timeout and jittered retries
+
+    Retries connection errors and 429/5xx responses. The last response is
+    returned as-is so callers keep their own status-code handling. With a
+    limiter (e.g. a TokenBucket), every attempt, retries included, takes a token.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    session = get_session(url)
+
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == max_retries:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            time.sleep(_backoff_delay(attempt, response))
+            continue
+        return response
+
+
+def http_get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_solana_client(endpoint=None):
+    """Process-wide Solana RPC client (one connection pool per endpoint)"""
+    from solana.rpc.api import Client
+
+    endpoint = endpoint or os.getenv("RPC_ENDPOINT")
+    if not endpoint:
+        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
+    return Client(endpoint, timeout=DEFAULT_TIMEOUT[1])
+
+
+@lru_cache(maxsize=1)
+def get_keypair():
+    """Trading keypair, decoded from the environment once"""
+    from solders.keypair import Keypair
+
+    private_key = os.getenv("SOLANA_PRIVATE_KEY")
+    if not private_key:
+        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
+    return Keypair.from_base58_string(private_key)
@@ -7,8 +7,6 @@ import os
 import sys
 from termcolor import cprint
 from dotenv import load_dotenv
-import time
-from datetime import datetime, timedelta
 from config import *
 
 # Add project root to Python path
@@ -21,6 +19,7 @@ from src.agents.risk_agent import RiskAgent
 from src.agents.strategy_agent import StrategyAgent
 from src.agents.copybot_agent import CopyBotAgent
 from src.agents.sentiment_agent import SentimentAgent
+from src.scheduler import AgentScheduler
 
 # Load environment variables
 load_dotenv()
@@ -37,60 +36,48 @@ ACTIVE_AGENTS = {
     # 'portfolio': False,  # Future portfolio optimization agent
 }
 
+def run_strategy_agent(strategy_agent, scheduler):
+    """Strategy signals for every monitored token, pausing for risk checks between tokens"""
+    for token in MONITORED_TOKENS:
+        if token not in EXCLUDED_TOKENS:  # Skip USDC and other excluded tokens
+            scheduler.yield_to_priority()
+            cprint(f"\n🔍 Analyzing {token}...", "cyan")
+            strategy_agent.get_signals(token)
+
 def run_agents():
-    """Run all active agents in sequence"""
+    """Run all active agents, each on its own cadence"""
+    scheduler = AgentScheduler(max_workers=SCHEDULER_MAX_WORKERS)
     try:
         # Initialize active agents
-        trading_agent = TradingAgent() if ACTIVE_AGENTS['trading'] else None
-        risk_agent = RiskAgent() if ACTIVE_AGENTS['risk'] else None
-        strategy_agent = StrategyAgent() if ACTIVE_AGENTS['strategy'] else None
-        copybot_agent = CopyBotAgent() if ACTIVE_AGENTS['copybot'] else None
-        sentiment_agent = SentimentAgent() if ACTIVE_AGENTS['sentiment'] else None
-
-        while True:
-            try:
-                # Run Risk Management
-                if risk_agent:
-                    cprint("\n🛡️ Running Risk Management...", "cyan")
-                    risk_agent.run()
-
-                # Run Trading Analysis
-                if trading_agent:
-                    cprint("\n🤖 Running Trading Analysis...", "cyan")
-                    trading_agent.run()
-
-                # Run Strategy Analysis
-                if strategy_agent:
-                    cprint("\n📊 Running Strategy Analysis...", "cyan")
-                    for token in MONITORED_TOKENS:
-                        if token not in EXCLUDED_TOKENS:  # Skip USDC and other excluded tokens
-                            cprint(f"\n🔍 Analyzing {token}...", "cyan")
-                            strategy_agent.get_signals(token)
-
-                # Run CopyBot Analysis
-                if copybot_agent:
-                    cprint("\n🤖 Running CopyBot Portfolio Analysis...", "cyan")
-                    copybot_agent.run_analysis_cycle()
-
-                # Run Sentiment Analysis
-                if sentiment_agent:
-                    cprint("\n🎭 Running Sentiment Analysis...", "cyan")
-                    sentiment_agent.run()
-
-                # Sleep until next cycle
-                next_run = datetime.now() + timedelta(minutes=SLEEP_BETWEEN_RUNS_MINUTES)
-                cprint(f"\n😴 Sleeping until {next_run.strftime('%H:%M:%S')}", "cyan")
-                time.sleep(60 * SLEEP_BETWEEN_RUNS_MINUTES)
-
-            except Exception as e:
-                cprint(f"\n❌ Error running agents: {str(e)}", "red")
-                cprint("🔄 Continuing to next cycle...", "yellow")
-                time.sleep(60)  # Sleep for 1 minute on error before retrying
+        if ACTIVE_AGENTS['risk']:
+            risk_agent = RiskAgent()
+            scheduler.add('risk', risk_agent.run, AGENT_INTERVALS_MINUTES['risk'], priority=True)
+        if ACTIVE_AGENTS['trading']:
+            trading_agent = TradingAgent()
+            scheduler.add('trading', trading_agent.run, AGENT_INTERVALS_MINUTES['trading'])
+        if ACTIVE_AGENTS['strategy']:
+            strategy_agent = StrategyAgent()
+            scheduler.add('strategy', lambda: run_strategy_agent(strategy_agent, scheduler), AGENT_INTERVALS_MINUTES['strategy'])
+        if ACTIVE_AGENTS['copybot']:
+            copybot_agent = CopyBotAgent()
+            scheduler.add('copybot', copybot_agent.run_analysis_cycle, AGENT_INTERVALS_MINUTES['copybot'])
+        if ACTIVE_AGENTS['sentiment']:
+            sentiment_agent = SentimentAgent()
+            scheduler.add('sentiment', sentiment_agent.run, AGENT_INTERVALS_MINUTES['sentiment'])
+
+        cprint("\n⏱️ Agent cadences:", "cyan")
+        for name, job in scheduler.jobs.items():
+            cprint(f"  • {name}: every {job.interval / 60:g} min{' (priority)' if job.priority else ''}", "cyan")
+
+        scheduler.run_forever()
 
     except KeyboardInterrupt:
         cprint("\n👋 Gracefully shutting down...", "yellow")
+        scheduler.stop()
+        scheduler.report()
     except Exception as e:
         cprint(f"\n❌ Fatal error in main loop: {str(e)}", "red")
+        scheduler.stop()
         raise
 
 if __name__ == "__main__":
@@ -1,15 +1,35 @@
 """
 🌙 Moon Dev's Model System
 Built with love by Moon Dev 🚀
+
+Provider classes are imported on first access, so `from src.models import
+model_factory` doesn't pull in every provider SDK.
 """
 
 from .base_model import BaseModel, ModelResponse
-from .claude_model import ClaudeModel
-from .groq_model import GroqModel
-from .openai_model import OpenAIModel
-from .gemini_model import GeminiModel
-from .deepseek_model import DeepSeekModel
-from .model_factory import model_factory
+from .model_factory import model_factory, ModelFactory
+from .response_cache import ResponseCache, response_cache
+from .model_router import ModelRouter, RouterTimeout
+from .structured_output import (
+    generate_structured,
+    parse_structured,
+    parse_metrics,
+    StructuredOutputError,
+    TradeDecision,
+    SignalVerdicts,
+    Allocation,
+)
+
+_PROVIDER_CLASSES = {
+    class_name: module_name
+    for module_name, class_name in ModelFactory.MODEL_IMPLEMENTATIONS.values()
+}
+
+def __getattr__(name):
+    if name in _PROVIDER_CLASSES:
+        from importlib import import_module
+        return getattr(import_module(f".{_PROVIDER_CLASSES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'BaseModel',
@@ -19,5 +39,17 @@ __all__ = [
     'OpenAIModel',
     'GeminiModel',
     'DeepSeekModel',
-    'model_factory'
-] 
\ No newline at end of file
+    'OllamaModel',
+    'model_factory',
+    'ResponseCache',
+    'response_cache',
+    'ModelRouter',
+    'RouterTimeout',
+    'generate_structured',
+    'parse_structured',
+    'parse_metrics',
+    'StructuredOutputError',
+    'TradeDecision',
+    'SignalVerdicts',
+    'Allocation'
+]
\ No newline at end of file
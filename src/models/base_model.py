@@ -5,8 +5,9 @@ Built with love by Moon Dev 🚀
 This module defines the base interface for all AI models.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass
 
 @dataclass
@@ -15,7 +16,18 @@ class ModelResponse:
     content: str
     raw_response: Any  # Original response object
     model_name: str
-    usage: Optional[Dict] = None
+    usage: Optional[Dict] = None  # prompt_tokens / completion_tokens / total_tokens
+    latency: Optional[float] = None  # Seconds from request to full response
+
+def make_usage(prompt_tokens=None, completion_tokens=None) -> Optional[Dict]:
+    """Token usage in the one shape every provider reports"""
+    if prompt_tokens is None and completion_tokens is None:
+        return None
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": (prompt_tokens or 0) + (completion_tokens or 0),
+    }
     
 class BaseModel(ABC):
     """Base interface for all AI models"""
@@ -41,6 +53,61 @@ class BaseModel(ABC):
         """Generate a response from the model"""
         pass
     
+    def stream_response(self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        **kwargs
+    ) -> Iterator[str]:
+        """Yield the response text as it arrives (one chunk unless the provider streams)"""
+        yield self.generate_response(
+            system_prompt, user_content, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ).content
+    
+    async def agenerate(self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        **kwargs
+    ) -> ModelResponse:
+        """Async generate_response - runs on a worker thread so many calls can be in flight"""
+        return await asyncio.to_thread(
+            self.generate_response,
+            system_prompt, user_content, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+    
+    async def astream(self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Async stream_response - chunks are handed over from a worker thread"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        done = object()
+        
+        def pump():
+            try:
+                for chunk in self.stream_response(
+                    system_prompt, user_content, temperature=temperature, max_tokens=max_tokens, **kwargs
+                ):
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+        
+        worker = loop.run_in_executor(None, pump)
+        while (item := await queue.get()) is not done:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await worker
+    
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the model is available and properly configured"""
@@ -3,9 +3,10 @@
 Built with love by Moon Dev 🚀
 """
 
+import time
 from anthropic import Anthropic
 from termcolor import cprint
-from .base_model import BaseModel, ModelResponse
+from .base_model import BaseModel, ModelResponse, make_usage
 
 class ClaudeModel(BaseModel):
     """Implementation for Anthropic's Claude models"""
@@ -38,6 +39,7 @@ class ClaudeModel(BaseModel):
     ) -> ModelResponse:
         """Generate a response using Claude"""
         try:
+            start = time.perf_counter()
             response = self.client.messages.create(
                 model=self.model_name,
                 max_tokens=max_tokens,
@@ -52,13 +54,25 @@ class ClaudeModel(BaseModel):
                 content=response.content[0].text.strip(),
                 raw_response=response,
                 model_name=self.model_name,
-                usage={"completion_tokens": response.usage.output_tokens}
+                usage=make_usage(response.usage.input_tokens, response.usage.output_tokens),
+                latency=time.perf_counter() - start
             )
             
         except Exception as e:
             cprint(f"❌ Claude generation error: {str(e)}", "red")
             raise
     
+    def stream_response(self, system_prompt, user_content, temperature=0.7, max_tokens=1024, **kwargs):
+        """Stream text deltas from Claude"""
+        with self.client.messages.stream(
+            model=self.model_name,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_content}]
+        ) as stream:
+            yield from stream.text_stream
+    
     def is_available(self) -> bool:
         """Check if Claude is available"""
         return self.client is not None
@@ -4,8 +4,9 @@ Built with love by Moon Dev 🚀
 """
 
 from openai import OpenAI
+import time
 from termcolor import cprint
-from .base_model import BaseModel, ModelResponse
+from .base_model import BaseModel, ModelResponse, make_usage
 
 class DeepSeekModel(BaseModel):
     """Implementation for DeepSeek's models"""
@@ -42,6 +43,7 @@ class DeepSeekModel(BaseModel):
     ) -> ModelResponse:
         """Generate a response using DeepSeek"""
         try:
+            start = time.perf_counter()
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
@@ -57,13 +59,30 @@ class DeepSeekModel(BaseModel):
                 content=response.choices[0].message.content.strip(),
                 raw_response=response,
                 model_name=self.model_name,
-                usage=response.usage.model_dump() if hasattr(response, 'usage') else None
+                usage=make_usage(response.usage.prompt_tokens, response.usage.completion_tokens) if response.usage else None,
+                latency=time.perf_counter() - start
             )
             
         except Exception as e:
             cprint(f"❌ DeepSeek generation error: {str(e)}", "red")
             raise
     
+    def stream_response(self, system_prompt, user_content, temperature=0.7, max_tokens=1024, **kwargs):
+        """Stream text deltas from DeepSeek"""
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     def is_available(self) -> bool:
         """Check if DeepSeek is available"""
         return self.client is not None
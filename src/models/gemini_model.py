@@ -3,9 +3,10 @@
 Built with love by Moon Dev 🚀
 """
 
+import time
 import google.generativeai as genai
 from termcolor import cprint
-from .base_model import BaseModel, ModelResponse
+from .base_model import BaseModel, ModelResponse, make_usage
 
 class GeminiModel(BaseModel):
     """Implementation for Google's Gemini models"""
@@ -41,6 +42,7 @@ class GeminiModel(BaseModel):
             # Combine system prompt and user content since Gemini doesn't have system messages
             combined_prompt = f"{system_prompt}\n\n{user_content}"
             
+            start = time.perf_counter()
             response = self.client.generate_content(
                 combined_prompt,
                 generation_config=genai.types.GenerationConfig(
@@ -49,17 +51,36 @@ class GeminiModel(BaseModel):
                 )
             )
             
+            metadata = getattr(response, "usage_metadata", None)
             return ModelResponse(
                 content=response.text.strip(),
                 raw_response=response,
                 model_name=self.model_name,
-                usage=None  # Gemini doesn't provide token usage info
+                usage=make_usage(
+                    getattr(metadata, "prompt_token_count", None),
+                    getattr(metadata, "candidates_token_count", None)
+                ),
+                latency=time.perf_counter() - start
             )
             
         except Exception as e:
             cprint(f"❌ Gemini generation error: {str(e)}", "red")
             raise
     
+    def stream_response(self, system_prompt, user_content, temperature=0.7, max_tokens=1024, **kwargs):
+        """Stream text chunks from Gemini"""
+        response = self.client.generate_content(
+            f"{system_prompt}\n\n{user_content}",
+            generation_config=genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens
+            ),
+            stream=True
+        )
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+    
     def is_available(self) -> bool:
         """Check if Gemini is available"""
         return self.client is not None
@@ -3,13 +3,16 @@
 Built with love by Moon Dev 🚀
 """
 
-from groq import Groq
+from groq import Groq, NotFoundError
+import time
 from termcolor import cprint
-from .base_model import BaseModel, ModelResponse
+from .base_model import BaseModel, ModelResponse, make_usage
 
 class GroqModel(BaseModel):
     """Implementation for Groq's models"""
     
+    FALLBACK_MODEL = "mixtral-8x7b-32768"  # Used if Groq doesn't serve the requested model
+    
     AVAILABLE_MODELS = {
         # Production Models
         "mixtral-8x7b-32768": {
@@ -125,26 +128,9 @@ class GroqModel(BaseModel):
             self.client = Groq(api_key=self.api_key)
             cprint(f"  ├─ ✅ Groq client created", "green")
             
-            # Get list of available models first
-            cprint(f"  ├─ Fetching available models from Groq API...", "cyan")
-            available_models = self.client.models.list()
-            api_models = [model.id for model in available_models.data]
-            cprint(f"  ├─ Models available from API: {api_models}", "cyan")
-            
-            if self.model_name not in api_models:
-                cprint(f"  ├─ ⚠️ Requested model not found in API", "yellow")
-                cprint(f"  ├─ Falling back to mixtral-8x7b-32768", "yellow")
-                self.model_name = "mixtral-8x7b-32768"
-            
-            # Test the connection with a simple completion
-            cprint(f"  ├─ Testing connection with model: {self.model_name}", "cyan")
-            test_response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=10
-            )
-            cprint(f"  ├─ ✅ Test response received", "green")
-            cprint(f"  ├─ Response content: {test_response.choices[0].message.content}", "cyan")
+            # No model listing or test completion here: they cost two round trips
+            # (and tokens) on every start. A missing model is caught on the first
+            # real request, which falls back to FALLBACK_MODEL (see _create)
             
             model_info = self.AVAILABLE_MODELS.get(self.model_name, {})
             cprint(f"  ├─ ✨ Groq model initialized: {self.model_name}", "green")
@@ -178,6 +164,17 @@ class GroqModel(BaseModel):
             self.client = None
             raise
     
+    def _create(self, **kwargs):
+        """Chat completion, switching to FALLBACK_MODEL once if Groq doesn't know the model"""
+        try:
+            return self.client.chat.completions.create(model=self.model_name, **kwargs)
+        except NotFoundError as e:
+            if self.model_name == self.FALLBACK_MODEL or "model" not in str(e).lower():
+                raise
+            cprint(f"⚠️ Groq model {self.model_name} not found, falling back to {self.FALLBACK_MODEL}", "yellow")
+            self.model_name = self.FALLBACK_MODEL
+            return self.client.chat.completions.create(model=self.model_name, **kwargs)
+    
     def generate_response(self, 
         system_prompt: str,
         user_content: str,
@@ -187,8 +184,8 @@ class GroqModel(BaseModel):
     ) -> ModelResponse:
         """Generate a response using Groq"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            start = time.perf_counter()
+            response = self._create(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_content}
@@ -202,13 +199,29 @@ class GroqModel(BaseModel):
                 content=response.choices[0].message.content.strip(),
                 raw_response=response,
                 model_name=self.model_name,
-                usage=response.usage.model_dump() if hasattr(response, 'usage') else None
+                usage=make_usage(response.usage.prompt_tokens, response.usage.completion_tokens) if response.usage else None,
+                latency=time.perf_counter() - start
             )
             
         except Exception as e:
             cprint(f"❌ Groq generation error: {str(e)}", "red")
             raise
     
+    def stream_response(self, system_prompt, user_content, temperature=0.7, max_tokens=1024, **kwargs):
+        """Stream text deltas from Groq"""
+        stream = self._create(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     def is_available(self) -> bool:
         """Check if Groq is available"""
         return self.client is not None
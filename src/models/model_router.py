@@ -0,0 +1,250 @@
+"""
+🌙 Moon Dev's Model Router
+Latency-aware routing, hedging and failover across providers
+Built with love by Moon Dev 🚀
+
+The router keeps a rolling window of latencies and outcomes for every
+(model type, model name) it has used. Each request goes to the fastest
+healthy candidate by p50. If that call is still running after `hedge_after`
+seconds, the same request is also sent to the next candidate on a different
+endpoint (provider and base URL), and whichever answers first wins. Hedging
+to another model on the same local server would only queue behind the slow
+call. A failed call fails over to the next candidate right away, and
+`deadline` caps the whole request, however many providers were tried.
+A candidate whose recent error rate is too high sits out for a cooldown.
+
+Calls run on daemon threads, so one abandoned after a timeout never blocks
+interpreter exit. A candidate with a call still running is skipped until that
+call returns, which bounds abandoned work to one call per candidate.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+from termcolor import cprint
+from .base_model import ModelResponse
+from .model_factory import model_factory
+
+STATS_WINDOW = 100  # Calls kept per model for percentiles and error rate
+MAX_ERROR_RATE = 0.5  # Above this a model is unhealthy...
+MIN_CALLS_FOR_HEALTH = 4  # ...once it has at least this many recent calls
+UNHEALTHY_COOLDOWN = 120  # Seconds an unhealthy model sits out before it is retried
+
+
+def _run_daemon(fn, *args) -> Future:
+    """Run fn on a daemon thread, returning a Future for its result"""
+    future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True, name="model-router").start()
+    return future
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass
+class ModelStats:
+    """Rolling latency and error window for one model"""
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=STATS_WINDOW))
+    outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=STATS_WINDOW))
+    backup_wins: int = 0  # Requests this model answered as a hedge or failover
+    unhealthy_since: Optional[float] = None
+
+    @property
+    def p50(self) -> Optional[float]:
+        return _percentile(self.latencies, 50)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return _percentile(self.latencies, 95)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    @property
+    def healthy(self) -> bool:
+        if self.unhealthy_since is None:
+            return True
+        # Let one probe through after the cooldown
+        return time.monotonic() - self.unhealthy_since > UNHEALTHY_COOLDOWN
+
+
+class RouterTimeout(TimeoutError):
+    """No candidate answered within the request deadline"""
+
+
+class ModelRouter:
+    """Sends each request to the fastest healthy model, with optional hedging"""
+
+    def __init__(self, candidates: Sequence[Tuple[str, str]], hedge_after: Optional[float] = None,
+                 deadline: Optional[float] = None, factory=model_factory):
+        self.candidates = list(candidates)
+        self.hedge_after = hedge_after
+        self.deadline = deadline
+        self.factory = factory
+        self.stats: Dict[Tuple[str, str], ModelStats] = {c: ModelStats() for c in self.candidates}
+        self._in_flight = set()  # Candidates with a call still running, possibly abandoned
+        self._lock = threading.Lock()
+
+    def ranked(self) -> List[Tuple[str, str]]:
+        """Configured candidates, healthy ones first, fastest p50 first
+
+        Models with no latency history rank as fastest so they get measured.
+        Ties keep the configured order.
+        """
+        usable = [c for c in self.candidates if self.factory.is_configured(c[0])]
+        with self._lock:
+            return sorted(
+                usable,
+                key=lambda c: (not self.stats[c].healthy, self.stats[c].p50 or 0.0),
+            )
+
+    def _record(self, candidate, latency, ok):
+        with self._lock:
+            stats = self.stats[candidate]
+            stats.outcomes.append(ok)
+            if ok:
+                stats.latencies.append(latency)
+                stats.unhealthy_since = None
+            elif len(stats.outcomes) >= MIN_CALLS_FOR_HEALTH and stats.error_rate > MAX_ERROR_RATE:
+                stats.unhealthy_since = time.monotonic()
+            elif stats.unhealthy_since is not None:
+                # The probe after a cooldown failed, sit out again
+                stats.unhealthy_since = time.monotonic()
+
+    def _endpoint(self, candidate) -> Tuple[str, Optional[str]]:
+        """(provider, base URL) a candidate's requests are served by"""
+        model = self.factory.get_model(*candidate)
+        return candidate[0], getattr(model, "base_url", None)
+
+    def _claim(self, queue, avoid=()) -> Optional[Tuple[str, str]]:
+        """Take the first queued candidate that is idle and not on an avoided endpoint"""
+        for candidate in queue:
+            if avoid and self._endpoint(candidate) in avoid:
+                continue
+            with self._lock:
+                if candidate in self._in_flight:
+                    continue
+                self._in_flight.add(candidate)
+            queue.remove(candidate)
+            return candidate
+        return None
+
+    def _call(self, candidate, system_prompt, user_content, kwargs):
+        start = time.perf_counter()
+        try:
+            model = self.factory.get_model(*candidate)
+            if model is None:
+                raise RuntimeError(f"{candidate[0]} model {candidate[1]} is not available")
+            response = model.generate_response(system_prompt, user_content, **kwargs)
+            if response is None or not getattr(response, "content", None):
+                raise RuntimeError(f"Empty response from {candidate[1]}")
+        except Exception:
+            self._record(candidate, time.perf_counter() - start, False)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.discard(candidate)
+        self._record(candidate, time.perf_counter() - start, True)
+        return response
+
+    def generate_response(self, system_prompt: str, user_content: str, temperature: float = 0.7,
+                          max_tokens: int = 1024, hedge_after: Optional[float] = None,
+                          deadline: Optional[float] = None, **kwargs) -> ModelResponse:
+        """Route one request, hedging and failing over as needed"""
+        hedge_after = self.hedge_after if hedge_after is None else hedge_after
+        deadline = self.deadline if deadline is None else deadline
+        kwargs.update(temperature=temperature, max_tokens=max_tokens)
+
+        queue = self.ranked()
+        if not queue:
+            raise RuntimeError("No configured models to route to")
+
+        start = time.monotonic()
+        pending = {}
+        errors = []
+
+        def launch(avoid=()):
+            candidate = self._claim(queue, avoid)
+            if candidate is None:
+                return None
+            future = _run_daemon(self._call, candidate, system_prompt, user_content, dict(kwargs))
+            pending[future] = candidate
+            return candidate
+
+        primary = launch()
+        if primary is None:
+            raise RuntimeError("Every model is still busy with an earlier request")
+        last_launch = time.monotonic()
+        while pending:
+            now = time.monotonic()
+            timeout = None if deadline is None else deadline - (now - start)
+            if timeout is not None and timeout <= 0:
+                break
+            can_hedge = hedge_after is not None and queue and len(pending) == 1
+            if can_hedge:
+                hedge_in = hedge_after - (now - last_launch)
+                timeout = hedge_in if timeout is None else min(timeout, hedge_in)
+
+            done, _ = wait(list(pending), timeout=None if timeout is None else max(timeout, 0),
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                if can_hedge and time.monotonic() - last_launch >= hedge_after:
+                    slow = next(iter(pending.values()))
+                    hedge = launch(avoid={self._endpoint(slow)})
+                    if hedge is None:
+                        # Nothing idle on another endpoint, so just wait for the slow call
+                        hedge_after = None
+                        continue
+                    cprint(f"⏳ {slow[1]} is slow, hedging with {hedge[1]}", "yellow")
+                    last_launch = time.monotonic()
+                continue
+
+            for future in done:
+                candidate = pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    errors.append(f"{candidate[1]}: {str(e)}")
+                    cprint(f"⚠️ {candidate[1]} failed: {str(e)}", "yellow")
+                    if not pending and launch() is not None:
+                        last_launch = time.monotonic()
+                    continue
+                if candidate != primary:
+                    with self._lock:
+                        self.stats[candidate].backup_wins += 1
+                return response
+
+        if pending:
+            raise RouterTimeout(f"No model answered within {deadline:.1f}s")
+        raise RuntimeError(f"All models failed: {'; '.join(errors)}")
+
+    def report(self):
+        """Per-model latency and error table"""
+        cprint("\n📊 Model router stats", "white", "on_blue")
+        with self._lock:
+            for (model_type, model_name), s in self.stats.items():
+                p50 = f"{s.p50:5.2f}s" if s.p50 is not None else "    -"
+                p95 = f"{s.p95:5.2f}s" if s.p95 is not None else "    -"
+                flag = "✅" if s.healthy else "🚫"
+                print(
+                    f"  {flag} {model_type}:{model_name:28} calls {len(s.outcomes):3} | p50 {p50} | p95 {p95}"
+                    f" | errors {s.error_rate:4.0%} | backup wins {s.backup_wins}"
+                )
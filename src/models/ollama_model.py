@@ -0,0 +1,110 @@
+"""
+🌙 Moon Dev's Ollama Model Implementation
+Built with love by Moon Dev 🚀
+
+Local models served by Ollama through its OpenAI-compatible endpoint. Every
+OllamaModel pointing at the same server shares one client (and so one HTTP
+connection pool), however many agents and model names are in use.
+"""
+
+import os
+import threading
+import time
+from openai import OpenAI
+from termcolor import cprint
+from .base_model import BaseModel, ModelResponse, make_usage
+
+DEFAULT_BASE_URL = "http://localhost:11434/v1"
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_ollama_client(base_url: str) -> OpenAI:
+    """Process-wide OpenAI-compatible client for an Ollama server"""
+    with _clients_lock:
+        if base_url not in _clients:
+            _clients[base_url] = OpenAI(base_url=base_url, api_key="ollama")  # API key is not required for Ollama
+        return _clients[base_url]
+
+
+class OllamaModel(BaseModel):
+    """Implementation for local Ollama models"""
+
+    AVAILABLE_MODELS = {
+        "llama3.2": "Meta Llama 3.2 (local)",
+        "deepseek-r1:1.5b": "DeepSeek R1 1.5B (local)",
+        "deepseek-r1:7b": "DeepSeek R1 7B (local)",
+        "llama2": "Meta Llama 2 (local)"
+    }
+
+    def __init__(self, api_key: str = "ollama", model_name: str = "llama3.2", base_url: str = None, **kwargs):
+        self.model_name = model_name
+        self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_BASE_URL)
+        super().__init__(api_key, **kwargs)
+
+    def initialize_client(self, **kwargs) -> None:
+        """Attach to the shared Ollama client"""
+        try:
+            self.client = get_ollama_client(self.base_url)
+        except Exception as e:
+            cprint(f"❌ Failed to initialize Ollama model: {str(e)}", "red")
+            self.client = None
+
+    def _messages(self, system_prompt, user_content):
+        # Agents that only send a user message leave the system prompt empty
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
+    def generate_response(self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        **kwargs
+    ) -> ModelResponse:
+        """Generate a response using Ollama"""
+        try:
+            start = time.perf_counter()
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=self._messages(system_prompt, user_content),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+
+            return ModelResponse(
+                content=(response.choices[0].message.content or "").strip(),
+                raw_response=response,
+                model_name=self.model_name,
+                usage=make_usage(response.usage.prompt_tokens, response.usage.completion_tokens) if response.usage else None,
+                latency=time.perf_counter() - start
+            )
+
+        except Exception as e:
+            cprint(f"❌ Ollama generation error: {str(e)}", "red")
+            raise
+
+    def stream_response(self, system_prompt, user_content, temperature=0.7, max_tokens=1024, **kwargs):
+        """Stream text deltas from Ollama"""
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=self._messages(system_prompt, user_content),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def is_available(self) -> bool:
+        """Check if Ollama is available"""
+        return self.client is not None
+
+    @property
+    def model_type(self) -> str:
+        return "ollama"
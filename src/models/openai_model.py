@@ -3,9 +3,10 @@
 Built with love by Moon Dev 🚀
 """
 
+import time
 from openai import OpenAI
 from termcolor import cprint
-from .base_model import BaseModel, ModelResponse
+from .base_model import BaseModel, ModelResponse, make_usage
 
 class OpenAIModel(BaseModel):
     """Implementation for OpenAI's models"""
@@ -39,49 +40,74 @@ class OpenAIModel(BaseModel):
             cprint(f"❌ Failed to initialize OpenAI model: {str(e)}", "red")
             self.client = None
     
+    def _build_messages(self, system_prompt, user_content, kwargs):
+        """Messages and request parameters for this model"""
+        # Special handling for O1 models
+        if self.model_name.startswith('o1'):
+            # Remove unsupported parameters for O1
+            if 'max_tokens' in kwargs:
+                kwargs['max_completion_tokens'] = kwargs.pop('max_tokens')
+            if 'temperature' in kwargs:
+                kwargs.pop('temperature')
+            
+            # O1 models use user role for both messages
+            messages = [
+                {
+                    "role": "user",
+                    "content": f"Instructions: {system_prompt}\n\nInput: {user_content}"
+                }
+            ]
+        else:
+            messages = [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ]
+        return messages, kwargs
+    
     def generate_response(self, system_prompt, user_content, **kwargs):
         """Generate a response using the OpenAI model"""
         try:
-            # Special handling for O1 models
-            if self.model_name.startswith('o1'):
-                # Remove unsupported parameters for O1
-                if 'max_tokens' in kwargs:
-                    kwargs['max_completion_tokens'] = kwargs.pop('max_tokens')
-                if 'temperature' in kwargs:
-                    kwargs.pop('temperature')
-                
-                # O1 models use user role for both messages
-                messages = [
-                    {
-                        "role": "user",
-                        "content": f"Instructions: {system_prompt}\n\nInput: {user_content}"
-                    }
-                ]
-            else:
-                messages = [
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": user_content
-                    }
-                ]
+            messages, kwargs = self._build_messages(system_prompt, user_content, kwargs)
             
             # Create completion with appropriate parameters
+            start = time.perf_counter()
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
                 **kwargs
             )
             
-            return response.choices[0].message
+            return ModelResponse(
+                content=(response.choices[0].message.content or "").strip(),
+                raw_response=response,
+                model_name=self.model_name,
+                usage=make_usage(response.usage.prompt_tokens, response.usage.completion_tokens) if response.usage else None,
+                latency=time.perf_counter() - start
+            )
 
         except Exception as e:
             cprint(f"❌ OpenAI generation error: {str(e)}", "red")
             raise
     
+    def stream_response(self, system_prompt, user_content, **kwargs):
+        """Stream text deltas from the OpenAI model"""
+        messages, kwargs = self._build_messages(system_prompt, user_content, kwargs)
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            stream=True,
+            **kwargs
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     def is_available(self) -> bool:
         """Check if OpenAI is available"""
         return self.client is not None
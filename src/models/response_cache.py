@@ -0,0 +1,172 @@
+"""
+🌙 Moon Dev's LLM Response Cache
+Content-addressed, on-disk cache for model responses
+Built with love by Moon Dev 🚀
+
+Entries are keyed on a hash of (model, system prompt, user content,
+temperature) and stored in SQLite, so they survive restarts. Entries expire
+after a TTL, and the least recently used ones are evicted once the cache
+passes `max_entries`. Hit and miss counters live in `stats`.
+
+Caching policy, shared by every caller (see `cacheable`): deterministic
+calls (temperature 0) are cached, sampled calls are not unless the caller
+passes `reuse_sampled=True`. Opt in only where one sample is as good as any
+other for the whole TTL, e.g. a prompt built purely from static config. Code
+that uses `get`/`put` directly must key on the real temperature and check
+`cacheable` first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from termcolor import cprint
+from .base_model import ModelResponse
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "data" / "llm_cache.db"
+DEFAULT_TTL = 3600  # seconds
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def cache_key(model: str, system_prompt: str, user_content: str, temperature) -> str:
+    """Stable hash of everything that determines a completion"""
+    payload = json.dumps([model, system_prompt or "", user_content or "", temperature])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and LRU eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        # Opened on first use so importing the module never touches disk
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    content TEXT,
+                    usage TEXT,
+                    created REAL,
+                    last_access REAL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        return self._conn
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[ModelResponse]:
+        """Cached response for key, or None if missing or expired"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT model, content, usage, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[3] > ttl:
+                self.stats["misses"] += 1
+                return None
+            self.conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.stats["hits"] += 1
+
+        model, content, usage, _ = row
+        return ModelResponse(
+            content=content,
+            raw_response=None,
+            model_name=model,
+            usage=json.loads(usage) if usage else None,
+        )
+
+    def put(self, key: str, model: str, content: str, usage=None) -> None:
+        """Store a response, evicting the least recently used entries past max_entries"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, json.dumps(usage) if usage else None, now, now),
+            )
+            self.stats["writes"] += 1
+            count = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                evicted = self.conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                ).rowcount
+                self.stats["evictions"] += evicted
+            self.conn.commit()
+
+    @staticmethod
+    def cacheable(temperature, reuse_sampled: bool = False) -> bool:
+        """Whether a call at this temperature may be served from / stored in the cache"""
+        return reuse_sampled or temperature == 0
+
+    def get_or_generate(
+        self,
+        model: str,
+        system_prompt: str,
+        user_content: str,
+        temperature,
+        generate: Callable[[], str],
+        ttl: Optional[float] = None,
+        accept: Optional[Callable[[str], bool]] = None,
+        reuse_sampled: bool = False,
+    ) -> str:
+        """Cached content for this prompt, or call generate() and store its result
+
+        Calls above temperature 0 go straight to generate() unless
+        reuse_sampled is set, in which case one sample is reused for the TTL.
+        Empty results, and any the optional accept() check rejects (e.g. output
+        that failed to parse), are returned but not cached.
+        """
+        if not self.cacheable(temperature, reuse_sampled):
+            return generate()
+
+        key = cache_key(model, system_prompt, user_content, temperature)
+        cached = self.get(key, ttl)
+        if cached is not None:
+            cprint(f"⚡ LLM cache hit for {model} ({self.hit_rate:.0%} hit rate)", "cyan")
+            return cached.content
+
+        content = generate()
+        if content and (accept is None or accept(content)):
+            self.put(key, model, content)
+        return content
+
+    def purge_expired(self, ttl: Optional[float] = None) -> int:
+        """Delete entries older than ttl, returns rows removed"""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            removed = self.conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - ttl,)
+            ).rowcount
+            self.conn.commit()
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+
+# Shared cache used by the models and agents
+response_cache = ResponseCache()
@@ -0,0 +1,283 @@
+"""
+🌙 Moon Dev's Structured Output
+Schema-validated JSON decisions from any model
+Built with love by Moon Dev 🚀
+
+Agents ask for a JSON object and get back a typed decision:
+
+    decision = generate_structured(model, "", prompt, TradeDecision)
+    decision.action, decision.confidence
+
+- Backends with an OpenAI-compatible API (OpenAI, Ollama) are called in JSON
+  mode, so the output is already valid JSON.
+- `extract_json` tolerates what models wrap around the object:
+  <think> blocks, code fences, prose, trailing commas, Python literals,
+  # comments, and output cut off mid-object.
+- If the object still fails to parse or validate, the model gets exactly one
+  repair request showing the error. After that a StructuredOutputError is
+  raised.
+- `parse_metrics` counts calls per schema that parsed first time, needed the
+  repair pass, or failed, so the share of calls wasted on parsing shows up.
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from termcolor import cprint
+
+JSON_MODE_TYPES = {"openai", "ollama"}  # Providers whose generate_response forwards response_format
+
+REPAIR_PROMPT = """Your previous reply could not be used: {error}
+
+Previous reply:
+{reply}
+
+Reply again with ONLY the corrected JSON object, in this shape:
+{example}"""
+
+_THINK = re.compile(r"<think>.*?(</think>|$)", re.DOTALL | re.IGNORECASE)
+_FENCE = re.compile(r"```(?:json)?", re.IGNORECASE)
+_COMMENT = re.compile(r"\s#[^\n\"]*(?=\n|$)")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+class StructuredOutputError(ValueError):
+    """Model output that could not be turned into the requested schema"""
+
+
+def _clean(text: str) -> str:
+    text = _THINK.sub("", text or "")
+    text = _FENCE.sub("", text)
+    text = _COMMENT.sub("", text)
+    return _TRAILING_COMMA.sub(r"\1", text)
+
+
+def _pythonish(text: str) -> str:
+    """Python dict syntax (single quotes, True/None) as JSON, only tried when plain JSON fails"""
+    text = re.sub(r"\b(True|False|None)\b", lambda m: _PY_LITERALS[m.group(1)], text)
+    return text.replace("'", '"')
+
+
+def _close_truncated(fragment: str) -> str:
+    """Close the strings, brackets and braces a cut-off object left open"""
+    stack, in_string, escaped = [], False, False
+    for ch in fragment:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+    closed = fragment + ('"' if in_string else "")
+    closed = re.sub(r"[,:]\s*$", "", closed.rstrip())
+    return closed + "".join(reversed(stack))
+
+
+def extract_json(text: str) -> dict:
+    """First JSON object in a model reply, tolerating the usual wrapping and damage"""
+    cleaned = _clean(text)
+    decoder = json.JSONDecoder()
+    start = cleaned.find("{")
+    while start != -1:
+        candidate = cleaned[start:]
+        for attempt in (candidate, _pythonish(candidate)):
+            try:
+                obj, _ = decoder.raw_decode(attempt)
+                if isinstance(obj, dict):
+                    return obj
+            except json.JSONDecodeError:
+                pass
+        start = cleaned.find("{", start + 1)
+
+    first = cleaned.find("{")
+    if first != -1:
+        try:
+            obj = json.loads(_TRAILING_COMMA.sub(r"\1", _close_truncated(cleaned[first:])))
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+    raise StructuredOutputError("no JSON object found in reply")
+
+
+def _confidence(value) -> int:
+    """0-100 from 75, 0.75, "75%" or "75" """
+    if isinstance(value, str):
+        match = re.search(r"\d+(\.\d+)?", value)
+        if not match:
+            raise StructuredOutputError(f"confidence is not a number: {value!r}")
+        value = float(match.group())
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise StructuredOutputError(f"confidence is not a number: {value!r}")
+    if 0 < value <= 1:
+        value *= 100
+    return int(round(min(max(value, 0), 100)))
+
+
+def _choice(value, allowed, name) -> str:
+    word = str(value or "").strip().upper()
+    if word not in allowed:
+        raise StructuredOutputError(f"{name} must be one of {', '.join(sorted(allowed))}, got {value!r}")
+    return word
+
+
+@dataclass
+class TradeDecision:
+    """BUY / SELL / NOTHING for one token"""
+    action: str
+    confidence: int
+    reasoning: str = ""
+
+    EXAMPLE = '{"action": "BUY" | "SELL" | "NOTHING", "confidence": 0-100, "reasoning": "..."}'
+
+    @classmethod
+    def from_json(cls, data: dict) -> "TradeDecision":
+        return cls(
+            action=_choice(data.get("action"), {"BUY", "SELL", "NOTHING"}, "action"),
+            confidence=_confidence(data.get("confidence", 0)),
+            reasoning=str(data.get("reasoning", "")),
+        )
+
+
+@dataclass
+class SignalVerdicts:
+    """EXECUTE / REJECT for each strategy signal, in the order they were given"""
+    decisions: List[str]
+    confidence: List[int] = field(default_factory=list)
+    reasoning: str = ""
+
+    EXAMPLE = '{"decisions": ["EXECUTE" | "REJECT", ...one per signal], "confidence": [0-100, ...], "reasoning": "..."}'
+
+    @classmethod
+    def from_json(cls, data: dict, expected: Optional[int] = None) -> "SignalVerdicts":
+        decisions = data.get("decisions")
+        if not isinstance(decisions, list):
+            raise StructuredOutputError("decisions must be a list")
+        if expected is not None and len(decisions) != expected:
+            raise StructuredOutputError(f"expected {expected} decisions, got {len(decisions)}")
+        confidence = data.get("confidence") or []
+        if not isinstance(confidence, list):
+            confidence = [confidence] * len(decisions)
+        return cls(
+            decisions=[_choice(d, {"EXECUTE", "REJECT"}, "decision") for d in decisions],
+            confidence=[_confidence(c) for c in confidence],
+            reasoning=str(data.get("reasoning", "")),
+        )
+
+
+@dataclass
+class Allocation:
+    """USD amount per token address"""
+    amounts: Dict[str, float]
+
+    EXAMPLE = '{"<token_address>": usd_amount, ..., "<usdc_address>": remaining_cash}'
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Allocation":
+        amounts = {}
+        for token, amount in data.items():
+            if isinstance(amount, str):
+                amount = amount.replace("$", "").replace(",", "").strip()
+            try:
+                amount = float(amount)
+            except (TypeError, ValueError):
+                raise StructuredOutputError(f"amount for {token} is not a number: {amount!r}")
+            if amount < 0:
+                raise StructuredOutputError(f"negative allocation for {token}: {amount}")
+            amounts[str(token).strip()] = amount
+        if not amounts:
+            raise StructuredOutputError("allocation is empty")
+        return cls(amounts)
+
+
+class ParseMetrics:
+    """Per-schema count of first-try parses, repairs and failures"""
+
+    def __init__(self):
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, schema: str, outcome: str) -> None:
+        with self._lock:
+            counts = self.counts.setdefault(schema, {"ok": 0, "repaired": 0, "failed": 0})
+            counts[outcome] += 1
+
+    def wasted_share(self, schema: Optional[str] = None) -> float:
+        """Share of calls that needed a repair request or produced nothing usable"""
+        with self._lock:
+            if schema is None:
+                rows = list(self.counts.values())
+            else:
+                rows = [self.counts[schema]] if schema in self.counts else []
+            calls = sum(sum(c.values()) for c in rows)
+            wasted = sum(c["repaired"] + c["failed"] for c in rows)
+        return wasted / calls if calls else 0.0
+
+    def report(self) -> None:
+        cprint("\n📊 Structured output parsing", "white", "on_blue")
+        with self._lock:
+            rows = {name: dict(counts) for name, counts in self.counts.items()}
+        for name, c in rows.items():
+            print(
+                f"  {name:16} ok {c['ok']:4} | repaired {c['repaired']:3} | failed {c['failed']:3}"
+                f" | wasted {self.wasted_share(name):4.0%}"
+            )
+
+
+def format_instructions(schema) -> str:
+    return f"Respond with ONLY a JSON object, no other text, in this shape:\n{schema.EXAMPLE}"
+
+
+def _json_mode_kwargs(model) -> dict:
+    model_type = getattr(model, "model_type", None)
+    if model_type in JSON_MODE_TYPES and not str(getattr(model, "model_name", "")).startswith("o1"):
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
+
+def parse_structured(text: str, schema, **context):
+    """Validate a reply against a schema, raises StructuredOutputError"""
+    return schema.from_json(extract_json(text), **context)
+
+
+def generate_structured(model, system_prompt: str, user_content: str, schema, temperature: float = 0.7,
+                        max_tokens: int = 1024, **context):
+    """Ask for a JSON reply and return it as a schema instance, with one repair pass"""
+    name = schema.__name__
+    kwargs = _json_mode_kwargs(model)
+    prompt = f"{user_content}\n\n{format_instructions(schema)}"
+
+    reply = model.generate_response(system_prompt, prompt, temperature=temperature,
+                                    max_tokens=max_tokens, **kwargs).content
+    try:
+        result = parse_structured(reply, schema, **context)
+        parse_metrics.record(name, "ok")
+        return result
+    except StructuredOutputError as e:
+        error = str(e)
+        cprint(f"🔧 {name} reply failed validation ({error}), asking for a repair", "yellow")
+
+    repair = REPAIR_PROMPT.format(error=error, reply=reply[-2000:], example=schema.EXAMPLE)
+    reply = model.generate_response(system_prompt, repair, temperature=0,
+                                    max_tokens=max_tokens, **kwargs).content
+    try:
+        result = parse_structured(reply, schema, **context)
+    except StructuredOutputError as e:
+        parse_metrics.record(name, "failed")
+        raise StructuredOutputError(f"{name}: {str(e)} (after repair)") from e
+    parse_metrics.record(name, "repaired")
+    return result
+
+
+# Shared counters across agents
+parse_metrics = ParseMetrics()
@@ -16,7 +16,6 @@ import json
 import base64
 import math
 import numpy as np
-import pandas_ta as ta
 from src.config import *
 from datetime import datetime, timedelta
 from termcolor import colored, cprint
@@ -26,6 +25,13 @@ from solders.keypair import Keypair
 from solders.transaction import VersionedTransaction
 from solana.rpc.api import Client
 from solana.rpc.types import TxOpts, TokenAccountOpts
+from src.data.rate_limiter import TokenBucket
+from src.data.candle_store import candle_store, records_from_columns
+from src.data.indicators import coingecko_indicators
+from src.data.portfolio_snapshot import PortfolioSnapshot, SnapshotCache
+from src.data.price_oracle import PriceOracle
+from src.http_client import http_get, http_post, get_solana_client, get_keypair
+from src.trading.swap_executor import SwapExecutor
 
 # Load environment variables
 load_dotenv()
@@ -36,12 +42,18 @@ RPC_ENDPOINT = os.getenv("RPC_ENDPOINT")
 if not RPC_ENDPOINT:
     raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
 
-# Initialize Solana client
-solana_client = Client(RPC_ENDPOINT)
+# Shared Solana client (pooled connection, built once per process)
+solana_client = get_solana_client(RPC_ENDPOINT)
+
+# Pipelined chunk executor used by chunk_kill and ai_entry (see .fills for the last run)
+swap_executor = SwapExecutor(client=solana_client)
 
 # CoinGecko API base URL
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 
+# Shared CoinGecko quota - every CoinGecko call in the process waits on this bucket
+coingecko_limiter = TokenBucket.per_minute(COINGECKO_CALLS_PER_MINUTE)
+
 # Create temp directory and register cleanup
 os.makedirs("temp_data", exist_ok=True)
 
@@ -72,18 +84,52 @@ def find_urls(string):
 
 # Fetch token price using CoinGecko API
 def token_price(token_id):
-    """Fetch the current price of a token using CoinGecko API."""
-    url = f"{COINGECKO_BASE_URL}/simple/price"
-    params = {"ids": token_id, "vs_currencies": "usd"}
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        price_data = response.json()
-        return price_data.get(token_id, {}).get("usd", None)
-    else:
-        print(
-            f"❌ Failed to fetch price for {token_id}. Status code: {response.status_code}"
+    """Fetch the current price of a token through the shared price oracle."""
+    price = price_oracle.price(token_id)
+    if price is None:
+        print(f"❌ Failed to fetch price for {token_id}")
+    return price
+
+
+# Fetch many token prices in one go using CoinGecko API
+def _fetch_token_prices(mints):
+    """Fetch USD prices for many SPL mints with one CoinGecko request per batch."""
+    mints = list(dict.fromkeys(mints))
+    prices = {}
+    headers = {
+        "accept": "application/json",
+        "x-cg-demo-api-key": COINGECKO_API_KEY,
+    }
+
+    for i in range(0, len(mints), COINGECKO_PRICE_BATCH_SIZE):
+        batch = mints[i:i + COINGECKO_PRICE_BATCH_SIZE]
+        params = {"contract_addresses": ",".join(batch), "vs_currencies": "usd"}
+        coingecko_limiter.acquire()
+        response = http_get(
+            f"{COINGECKO_BASE_URL}/simple/token_price/solana", params=params, headers=headers
         )
-        return None
+        if response.status_code != 200:
+            print(
+                f"❌ Failed to fetch prices for {len(batch)} tokens. Status code: {response.status_code}"
+            )
+            continue
+
+        # CoinGecko may echo addresses lowercased, so match case-insensitively
+        price_data = {k.lower(): v for k, v in response.json().items()}
+        for mint in batch:
+            price = price_data.get(mint.lower(), {}).get("usd")
+            if price is not None:
+                prices[mint] = float(price)
+
+    return prices
+
+
+price_oracle = PriceOracle(_fetch_token_prices, ttl=PRICE_CACHE_TTL, max_stale=PRICE_MAX_STALE)
+
+
+def token_prices(mints):
+    """Fetch USD prices for many mints through the shared price oracle."""
+    return price_oracle.prices(mints)
 
 
 def token_security_info(address):
@@ -95,7 +141,7 @@ def token_security_info(address):
         "params": [address],
     }
 
-    response = requests.post(RPC_ENDPOINT, json=payload)
+    response = http_post(RPC_ENDPOINT, json=payload)
 
     if response.status_code == 200:
         security_data = response.json().get("result", {})
@@ -113,7 +159,7 @@ def token_creation_info(address):
         "params": [address],
     }
 
-    response = requests.post(RPC_ENDPOINT, json=payload)
+    response = http_post(RPC_ENDPOINT, json=payload)
 
     if response.status_code == 200:
         creation_data = response.json().get("result", {})
@@ -140,7 +186,7 @@ def token_overview(address):
             "method": "getTokenSecurity",
             "params": [address],
         }
-        security_response = requests.post(RPC_ENDPOINT, json=payload_security)
+        security_response = http_post(RPC_ENDPOINT, json=payload_security)
         if security_response.status_code == 200:
             security_data = security_response.json().get('result', {})
             result['security'] = security_data
@@ -152,7 +198,7 @@ def token_overview(address):
             "method": "getTokenMint",
             "params": [address],
         }
-        creation_response = requests.post(RPC_ENDPOINT, json=payload_creation)
+        creation_response = http_post(RPC_ENDPOINT, json=payload_creation)
         if creation_response.status_code == 200:
             creation_data = creation_response.json().get('result', {})
             result['creation'] = creation_data
@@ -188,86 +234,21 @@ def token_overview(address):
 
 # Market Functions
 def market_buy(token, amount, slippage):
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
-        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
-    # print('key success')
-
-    QUOTE_TOKEN = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # usdc
-
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    # print('http client success')
-    if not http_client:
-        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
-
-    quote = requests.get(
-        f"https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={slippage}"
-    ).json()
-    # print(quote)
-
-    txRes = requests.post(
-        "https://quote-api.jup.ag/v6/swap",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(
-            {
-                "quoteResponse": quote,
-                "userPublicKey": str(KEY.pubkey()),
-                "prioritizationFeeLamports": PRIORITY_FEE,  # or replace 'auto' with your specific lamport value
-            }
-        ),
-    ).json()
-    # print(txRes)
-    swapTx = base64.b64decode(txRes["swapTransaction"])
-    # print(swapTx)
-    tx1 = VersionedTransaction.from_bytes(swapTx)
-    tx = VersionedTransaction(tx1.message, [KEY])
-    txId = http_client.send_raw_transaction(
-        bytes(tx), TxOpts(skip_preflight=True)
-    ).value
-    print(f"https://solscan.io/tx/{str(txId)}")
+    # One-chunk pipeline: waits out risk checks and confirms before returning
+    _settle(swap_executor.buy(token, [amount], slippage))
 
 
 def market_sell(QUOTE_TOKEN, amount, slippage):
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
-        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
-
-    # token would be usdc for sell orders cause we are selling
-    token = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC
-
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    if not http_client:
-        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
-    print("http client success")
-
-    quote = requests.get(
-        f"https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={slippage}"
-    ).json()
-    # print(quote)
-    txRes = requests.post(
-        "https://quote-api.jup.ag/v6/swap",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(
-            {
-                "quoteResponse": quote,
-                "userPublicKey": str(KEY.pubkey()),
-                "prioritizationFeeLamports": PRIORITY_FEE,
-            }
-        ),
-    ).json()
-    # print(txRes)
-    swapTx = base64.b64decode(txRes["swapTransaction"])
-    # print(swapTx)
-    tx1 = VersionedTransaction.from_bytes(swapTx)
-    # print(tx1)
-    tx = VersionedTransaction(tx1.message, [KEY])
-    # print(tx)
-    txId = http_client.send_raw_transaction(
-        bytes(tx), TxOpts(skip_preflight=True)
-    ).value
-    print(f"https://solscan.io/tx/{str(txId)}")
+    _settle(swap_executor.sell(QUOTE_TOKEN, [amount], slippage))
 
 
+def _settle(fills):
+    """Drop the cached snapshot once a market order has settled, and raise if it never went out"""
+    # Invalidating before confirmation would let the next read re-cache the pre-fill balance
+    invalidate_portfolio_snapshot()
+    failed = [fill for fill in fills if fill.status == "error"]
+    if failed:
+        raise RuntimeError(failed[0].error)
 
 
 def round_down(value, decimals):
@@ -285,89 +266,155 @@ def get_time_range(days_back):
     return time_from, time_to
 
 
-def get_data(address, days_back=DAYSBACK_4_DATA, timeframe=timeframe):
-    # Check temp data first
-    temp_file = f"moondev/temp_data/{address}_latest.csv"
-    if os.path.exists(temp_file):
-        print(f"📂 Moon Dev found cached data for {address[:4]}")
-        return pd.read_csv(temp_file)
-
-    # Map timeframe to CoinGecko's interval
-    interval_map = {"1h": "hourly", "1d": "daily"}
-    interval = interval_map.get(timeframe, "daily")
-
-    # Construct the URL for historical market data
-    url = f"{COINGECKO_BASE_URL}/coins/solana/contract/{address}/market_chart?vs_currency=usd&days={days_back}&interval={interval}"
+def _fetch_coingecko_prices(address, days, interval):
+    """Fetch raw [timestamp_ms, price] points from CoinGecko, None on failure"""
+    url = f"{COINGECKO_BASE_URL}/coins/solana/contract/{address}/market_chart?vs_currency=usd&days={days}&interval={interval}"
 
     headers = {
         "accept": "application/json",
         "x-cg-demo-api-key": COINGECKO_API_KEY,
     }
 
-    # Fetch historical market data
-    response = requests.get(url, headers=headers)
+    coingecko_limiter.acquire()
+    response = http_get(url, headers=headers)
+
+    if response.status_code != 200:
+        print(
+            f"❌ Failed to fetch market data for {address}. Status code: {response.status_code}"
+        )
+        if response.status_code == 401:
+            print("🔑 Check your CoinGecko API key in the .env file!")
+        return None
+
+    return response.json().get("prices", [])
 
-    if response.status_code == 200:
-        market_data = response.json()
-        prices = market_data.get("prices", [])
-
-        # Create DataFrame from prices
-        df = pd.DataFrame(prices, columns=["timestamp", "price"])
-        df["Datetime (UTC)"] = pd.to_datetime(df["timestamp"], unit="ms")
-        df = df.drop("timestamp", axis=1)
-
-        # Calculate OHLCV data (if not provided by CoinGecko)
-        df["Open"] = df["price"].shift(1)  # Open = Previous Close
-        df["High"] = df["price"].rolling(window=len(df), min_periods=1).max()
-        df["Low"] = df["price"].rolling(window=len(df), min_periods=1).min()
-        df["Close"] = df["price"]
-        df["Volume"] = 0  # CoinGecko doesn't provide volume data for contract addresses
-
-        # Remove any rows with dates far in the future
-        current_date = datetime.now()
-        df = df[df["Datetime (UTC)"] <= current_date]
-
-        # Pad if needed
-        if len(df) < 40:
-            print(
-                f"🌙 MoonDev Alert: Padding data to ensure minimum 40 rows for analysis! 🚀"
-            )
-            rows_to_add = 40 - len(df)
-            first_row_replicated = pd.concat(
-                [df.iloc[0:1]] * rows_to_add, ignore_index=True
-            )
-            df = pd.concat([first_row_replicated, df], ignore_index=True)
 
-        print(f"📊 MoonDev's Data Analysis Ready! Processing {len(df)} candles... 🎯")
+COINGECKO_INTERVAL_MS = {"hourly": 3600 * 1000, "daily": 86400 * 1000}
+COINGECKO_HOURLY_MAX_DAYS = 90  # CoinGecko only serves hourly points for windows up to 90 days
 
-        # Always save to temp for current run
-        os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-        df.to_csv(temp_file, index=False)
-        print(f"🔄 Moon Dev cached data for {address[:4]}")
 
-        # Calculate technical indicators
-        df["MA20"] = ta.sma(df["Close"], length=20)
-        df["RSI"] = ta.rsi(df["Close"], length=14)
-        df["MA40"] = ta.sma(df["Close"], length=40)
-        print(f"🔄 Moon Dev cached data for {address[:4]}")
+def _coingecko_interval(timeframe, days_back):
+    """CoinGecko interval for a timeframe ('15m', '1H', '1d', ...) and window length"""
+    unit = str(timeframe).strip()[-1:]
+    if unit in ("d", "D", "w", "W", "M"):  # '1M' is a month, '1m' a minute
+        return "daily"
+    return "hourly" if days_back < COINGECKO_HOURLY_MAX_DAYS else "daily"
 
-        # Calculate technical indicators
-        df["MA20"] = ta.sma(df["Close"], length=20)
-        df["RSI"] = ta.rsi(df["Close"], length=14)
-        df["MA40"] = ta.sma(df["Close"], length=40)
 
-        df["Price_above_MA20"] = df["Close"] > df["MA20"]
-        df["Price_above_MA40"] = df["Close"] > df["MA40"]
-        df["MA20_above_MA40"] = df["MA20"] > df["MA40"]
+def _sync_candle_store(address, days_back, interval):
+    """Bring the local candle store up to date, fetching only missing bars
 
-        return df
+    Returns (synced, live): whether the fetch worked, and the newest
+    (timestamp_ms, price) point if its bar hasn't closed yet. The live point
+    is never stored.
+    """
+    now_ms = int(datetime.now().timestamp() * 1000)
+    bar_ms = COINGECKO_INTERVAL_MS[interval]
+    window_start_ms = now_ms - int(days_back * 86400 * 1000)
+    first_ts = candle_store.first_timestamp(address, interval)
+    last_ts = candle_store.last_timestamp(address, interval)
+
+    # Tokens younger than the window never fill it, so don't refetch for bars that don't exist
+    history_start = candle_store.history_start(address, interval)
+    covered_from = window_start_ms if history_start is None else max(window_start_ms, history_start)
+
+    if last_ts is None or first_ts > covered_from:
+        # Cold store or window reaches further back than we have - full fetch
+        days = max(1, math.ceil(days_back))
+        print(f"🌑 Moon Dev fetching full {days_back} day history for {address[:4]}")
+    else:
+        # Warm store - only ask for the gap since the last stored bar
+        gap_days = (now_ms - last_ts) / (86400 * 1000)
+        days = max(1, math.ceil(gap_days))
+        print(f"🌓 Moon Dev fetching {days} day delta for {address[:4]}")
+
+    prices = _fetch_coingecko_prices(address, days, interval)
+    if prices is None:
+        return False, None
+    if not prices:
+        return True, None
+
+    points = np.asarray(prices, dtype="float64")
+    # Snap points to the bar grid and store closed bars only - the last point is the live price
+    t = points[:, 0].astype("int64") // bar_ms * bar_ms
+    price = points[:, 1]
+    closed = t < now_ms // bar_ms * bar_ms
+    live = None if closed[-1] else (int(points[-1, 0]), float(points[-1, 1]))
+    t, price = t[closed], price[closed]
+    if last_ts is None or first_ts > covered_from:
+        if len(t) and t[0] > window_start_ms + bar_ms:
+            candle_store.set_history_start(address, interval, t[0])
     else:
+        fresh = t > last_ts
+        t, price = t[fresh], price[fresh]
+
+    added = candle_store.write(
+        address, interval, records_from_columns(t, price, price, price, price)
+    )
+    print(f"💾 Moon Dev stored {added} new bars for {address[:4]}")
+    return True, live
+
+
+def get_data(address, days_back=DAYSBACK_4_DATA, timeframe=timeframe):
+    # Map timeframe to CoinGecko's interval
+    interval = _coingecko_interval(timeframe, days_back)
+
+    # Update the local candle store, then read the requested window from it
+    synced, live = _sync_candle_store(address, days_back, interval)
+    now_ms = int(datetime.now().timestamp() * 1000)
+    bar_ms = COINGECKO_INTERVAL_MS[interval]
+    # A window shorter than one bar still gets the last closed bar
+    window_start_ms = min(now_ms - int(days_back * 86400 * 1000), now_ms // bar_ms * bar_ms - bar_ms)
+    stored = candle_store.read(address, interval, start_ms=window_start_ms)
+    t = np.asarray(stored["t"])
+    price = np.asarray(stored["close"])
+    if live is not None:
+        # The current price goes on the end of the frame but never into the store
+        t, price = np.append(t, live[0]), np.append(price, live[1])
+
+    if len(t) == 0:
+        if synced:
+            print(f"❌ No market data available for {address}")
+        return pd.DataFrame()
+
+    # Create DataFrame from stored prices
+    df = pd.DataFrame({
+        "price": price,
+        "Datetime (UTC)": pd.to_datetime(t, unit="ms"),
+    })
+
+    # Calculate OHLCV data (if not provided by CoinGecko)
+    df["Open"] = df["price"].shift(1)  # Open = Previous Close
+    df["High"] = df["price"].rolling(window=len(df), min_periods=1).max()
+    df["Low"] = df["price"].rolling(window=len(df), min_periods=1).min()
+    df["Close"] = df["price"]
+    df["Volume"] = 0  # CoinGecko doesn't provide volume data for contract addresses
+
+    # Remove any rows with dates far in the future
+    current_date = datetime.now()
+    df = df[df["Datetime (UTC)"] <= current_date]
+
+    # Pad if needed
+    if len(df) < 40:
         print(
-            f"❌ Failed to fetch market data for {address}. Status code: {response.status_code}"
+            f"🌙 MoonDev Alert: Padding data to ensure minimum 40 rows for analysis! 🚀"
         )
-        if response.status_code == 401:
-            print("🔑 Check your CoinGecko API key in the .env file!")
-        return pd.DataFrame()
+        rows_to_add = 40 - len(df)
+        first_row_replicated = pd.concat(
+            [df.iloc[0:1]] * rows_to_add, ignore_index=True
+        )
+        df = pd.concat([first_row_replicated, df], ignore_index=True)
+
+    print(f"📊 MoonDev's Data Analysis Ready! Processing {len(df)} candles... 🎯")
+
+    # Calculate technical indicators
+    df = coingecko_indicators().apply(df, column="Close")
+
+    df["Price_above_MA20"] = df["Close"] > df["MA20"]
+    df["Price_above_MA40"] = df["Close"] > df["MA40"]
+    df["MA20_above_MA40"] = df["MA20"] > df["MA40"]
+
+    return df
 
 
 # Fetch wallet balances using Solana RPC
@@ -422,25 +469,44 @@ def fetch_wallet_balances(wallet_address):
         return pd.DataFrame()
 
 
-# Fetch wallet holdings with USD values
-def fetch_wallet_holdings_og(wallet_address):
-    """Fetch wallet holdings with USD values using RPC and CoinGecko."""
+# Build a portfolio snapshot: one wallet scan plus one batched price pass
+def load_portfolio_snapshot(wallet_address):
+    """Load every SPL balance and its USD price for a wallet in one pass."""
     balances = fetch_wallet_balances(wallet_address)
-    if balances.empty:
-        return pd.DataFrame()
+    holdings = {}
+    if not balances.empty:
+        # Several token accounts can hold the same mint
+        holdings = balances.groupby("Mint Address")["Balance"].sum().to_dict()
+
+    prices = token_prices(holdings.keys()) if holdings else {}
+    return PortfolioSnapshot(
+        wallet=wallet_address,
+        timestamp=datetime.now(),
+        balances=holdings,
+        prices=prices,
+    )
 
-    # Filter out Token Program address
-    balances = balances[
-        balances['Mint Address'] != 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA'
-    ]
 
-    # Add USD value for each token
-    balances["USD Value"] = balances.apply(
-        lambda row: row["Balance"] * (token_price(row["Mint Address"]) or 0), 
-        axis=1
-    )
+_snapshot_cache = SnapshotCache(load_portfolio_snapshot, ttl=PORTFOLIO_SNAPSHOT_TTL)
+
+
+def get_portfolio_snapshot(wallet_address=None, max_age=None):
+    """Shared wallet snapshot, reloaded once it is older than max_age seconds."""
+    return _snapshot_cache.get(wallet_address or address, max_age=max_age)
 
-    return balances
+
+def invalidate_portfolio_snapshot(wallet_address=None):
+    """Force the next snapshot read to hit the chain, e.g. after a fill."""
+    _snapshot_cache.invalidate(wallet_address)
+
+
+# Fetch wallet holdings with USD values
+def fetch_wallet_holdings_og(wallet_address):
+    """Fetch wallet holdings with USD values from the shared portfolio snapshot."""
+    holdings = get_portfolio_snapshot(wallet_address).to_frame()
+    if holdings.empty:
+        return pd.DataFrame()
+    return holdings
 
 
 # Get position balance for a specific token
@@ -561,13 +627,13 @@ def close_all_positions():
 
 # Fetch wallet token single
 def fetch_wallet_token_single(wallet_address, token_mint_address):
-    """Fetch the balance of a specific token for a wallet using RPC."""
-    balances = fetch_wallet_balances(wallet_address)
-    if balances.empty:
+    """Fetch the balance and USD value of a specific token from the portfolio snapshot."""
+    holdings = fetch_wallet_holdings_og(wallet_address)
+    if holdings.empty:
         return pd.DataFrame()
 
     # Filter for the specific token
-    token_balance = balances[balances["Mint Address"] == token_mint_address]
+    token_balance = holdings[holdings["Mint Address"] == token_mint_address]
     return token_balance
 
 
@@ -586,16 +652,14 @@ def chunk_kill(token_mint_address, max_usd_order_size, slippage):
     cprint(f"\n🔪 Moon Dev's AI Agent initiating position exit...", "white", "on_cyan")
 
     try:
-        # Get current position using address from config
-        df = fetch_wallet_token_single(address, token_mint_address)
-        if df.empty:
+        # Get current position from a fresh wallet snapshot
+        snapshot = get_portfolio_snapshot(max_age=0)
+        token_amount = snapshot.balance(token_mint_address)
+        current_usd_value = snapshot.usd_value(token_mint_address)
+        if token_amount <= 0:
             cprint("❌ No position found to exit", "white", "on_red")
             return
 
-        # Get current token amount and value
-        token_amount = float(df["Balance"].iloc[0])
-        current_usd_value = float(df["USD Value"].iloc[0])
-
         # Get token decimals
         decimals = get_decimals(token_mint_address)
 
@@ -614,27 +678,21 @@ def chunk_kill(token_mint_address, max_usd_order_size, slippage):
                 "on_cyan",
             )
 
-            # Execute sell orders in chunks
-            for i in range(3):
-                try:
-                    cprint(f"\n💫 Executing sell chunk {i+1}/3...", "white", "on_cyan")
-                    sell_size = int(chunk_size * 10**decimals)
-                    market_sell(token_mint_address, sell_size, slippage)
-                    cprint(f"✅ Sell chunk {i+1}/3 complete", "white", "on_green")
-                    time.sleep(2)  # Small delay between chunks
-                except Exception as e:
-                    cprint(f"❌ Error in sell chunk: {str(e)}", "white", "on_red")
-
-            # Check remaining position
-            time.sleep(5)  # Wait for blockchain to update
-            df = fetch_wallet_token_single(address, token_mint_address)
-            if df.empty:
+            # Quote, sign and send all chunks as a pipeline, then confirm together
+            sell_size = int(chunk_size * 10**decimals)
+            fills = swap_executor.sell(token_mint_address, [sell_size] * 3, slippage)
+            if not any(fill.confirmed for fill in fills):
+                cprint("❌ No sell chunks confirmed this round", "white", "on_red")
+
+            # Confirmed fills are on chain, so the next snapshot sees the new balance
+            invalidate_portfolio_snapshot()
+            snapshot = get_portfolio_snapshot(max_age=0)
+            token_amount = snapshot.balance(token_mint_address)
+            current_usd_value = snapshot.usd_value(token_mint_address)
+            if token_amount <= 0:
                 cprint("\n✨ Position successfully closed!", "white", "on_green")
                 return
 
-            # Update position size for next iteration
-            token_amount = float(df["Balance"].iloc[0])
-            current_usd_value = float(df["USD Value"].iloc[0])
             cprint(
                 f"\n📊 Remaining position: {token_amount:.2f} tokens (${current_usd_value:.2f})",
                 "white",
@@ -647,7 +705,6 @@ def chunk_kill(token_mint_address, max_usd_order_size, slippage):
                     "white",
                     "on_cyan",
                 )
-                time.sleep(2)
 
         cprint("\n✨ Position successfully closed!", "white", "on_green")
 
@@ -947,8 +1004,12 @@ def ai_entry(symbol, amount):
     # amount passed in is the target allocation (up to 30% of usd_size)
     target_size = amount  # This could be up to $3 (30% of $10)
 
-    pos = get_position(symbol)
+    snapshot = get_portfolio_snapshot()
+    pos = snapshot.balance(symbol)
     price = token_price(symbol)
+    if not price:
+        cprint(f"❌ No price for {symbol[:8]}, skipping entry", "white", "on_red")
+        return
     pos_usd = pos * price
 
     cprint(
@@ -983,6 +1044,7 @@ def ai_entry(symbol, amount):
         "on_blue",
     )
 
+    retried = False
     while pos_usd < (target_size * 0.97):
         cprint(f"🤖 AI Agent executing entry for {symbol[:8]}...", "white", "on_blue")
         print(
@@ -990,80 +1052,50 @@ def ai_entry(symbol, amount):
         )
 
         try:
-            for i in range(orders_per_open):
-                market_buy(symbol, chunk_size, slippage)
-                cprint(
-                    f"🚀 AI Agent placed order {i+1}/{orders_per_open} for {symbol[:8]}",
-                    "white",
-                    "on_blue",
-                )
-                time.sleep(1)
-
-            time.sleep(tx_sleep)
-            # Update position info
-            pos = get_position(symbol)
-            price = token_price(symbol)
-            pos_usd = pos * price
-
-            # Break if we're at or above target
-            if pos_usd >= (target_size * 0.97):
-                break
-
-            # Recalculate needed size
-            size_needed = target_size - pos_usd
-            if size_needed <= 0:
-                break
-
-            # Determine next chunk size
-            if size_needed > max_usd_order_size:
-                chunk_size = max_usd_order_size
-            else:
-                chunk_size = size_needed
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
+            # Quote, sign and send every chunk as a pipeline, then confirm together
+            fills = swap_executor.buy(symbol, [chunk_size] * orders_per_open, slippage)
+            if not any(fill.confirmed for fill in fills):
+                raise RuntimeError("no entry chunks confirmed")
+            retried = False
 
         except Exception as e:
-            try:
-                cprint(
-                    "🔄 AI Agent retrying order in 30 seconds...", "white", "on_blue"
-                )
-                time.sleep(30)
-
-                for i in range(orders_per_open):
-                    market_buy(symbol, chunk_size, slippage)
-                    cprint(
-                        f"🚀 AI Agent retry order {i+1}/{orders_per_open} for {symbol[:8]}",
-                        "white",
-                        "on_blue",
-                    )
-                    time.sleep(1)
-
-                time.sleep(tx_sleep)
-                pos = get_position(symbol)
-                price = token_price(symbol)
-                pos_usd = pos * price
-
-                if pos_usd >= (target_size * 0.97):
-                    break
-
-                size_needed = target_size - pos_usd
-                if size_needed <= 0:
-                    break
-
-                if size_needed > max_usd_order_size:
-                    chunk_size = max_usd_order_size
-                else:
-                    chunk_size = size_needed
-                chunk_size = int(chunk_size * 10**6)
-                chunk_size = str(chunk_size)
-
-            except:
+            if retried:
                 cprint(
                     "❌ AI Agent encountered critical error, manual intervention needed",
                     "white",
                     "on_red",
                 )
                 return
+            retried = True
+            # Chunks that timed out can still land until their blockhash expires, so
+            # wait, then size the retry from the balance on chain instead of resending it all
+            cprint(f"🔄 AI Agent retrying the shortfall in 30 seconds ({str(e)})...", "white", "on_blue")
+            time.sleep(30)
+
+        # Update position info from a fresh snapshot
+        invalidate_portfolio_snapshot()
+        pos = get_portfolio_snapshot(max_age=0).balance(symbol)
+        price = token_price(symbol)
+        if not price:
+            cprint(f"❌ Lost the price for {symbol[:8]}, stopping entry", "white", "on_red")
+            return
+        pos_usd = pos * price
+
+        # Break if we're at or above target
+        if pos_usd >= (target_size * 0.97):
+            break
+
+        # Recalculate needed size
+        size_needed = target_size - pos_usd
+        if size_needed <= 0:
+            break
+
+        # Determine next chunk size
+        if size_needed > max_usd_order_size:
+            chunk_size = max_usd_order_size
+        else:
+            chunk_size = size_needed
+        chunk_size = int(chunk_size * 10**6)
 
     cprint("✨ AI Agent completed position entry", "white", "on_blue")
 
@@ -1072,16 +1104,7 @@ def ai_entry(symbol, amount):
 def get_token_balance_usd(token_mint_address):
     """Get USD value of token position"""
     try:
-        df = fetch_wallet_token_single(address, token_mint_address)
-
-        # Get price and calculate USD value
-        price = token_price(token_mint_address)
-        if not price:
-            return 0.0
-
-        # Get the USD Value from the dataframe
-        usd_value = df["USD Value"].iloc[0]
-        return float(usd_value)
+        return float(get_portfolio_snapshot().usd_value(token_mint_address))
 
     except Exception as e:
         print(f"❌ Error getting token balance: {str(e)}")
@@ -10,7 +10,12 @@ import requests
 from datetime import datetime, timedelta
 import numpy as np
 import time
-import pandas_ta as ta  # For technical indicators
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.data.indicators import hyperliquid_indicators, IndicatorStream
+from src.data.candle_store import candle_store, records_from_columns
+from src.data.rate_limiter import TokenBucket
+from src.http_client import http_post
 import traceback
 
 # Constants
@@ -18,10 +23,25 @@ BATCH_SIZE = 5000  # MAX IS 5000 FOR HYPERLIQUID
 MAX_RETRIES = 3
 MAX_ROWS = 5000
 BASE_URL = 'https://api.hyperliquid.xyz/info'
+BACKFILL_WORKERS = 4
+REQUESTS_PER_MINUTE = 60  # candleSnapshot is a weighted call, stay well under the info limit
+INTERVAL_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '8h': 28_800_000, '12h': 43_200_000,
+    '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000,
+}
+
+# Shared across backfill workers so parallel windows respect one rate limit
+hyperliquid_limiter = TokenBucket.per_minute(REQUESTS_PER_MINUTE, burst=BACKFILL_WORKERS)
 
 # Global variable to store timestamp offset
 timestamp_offset = None
 
+# Streaming mode keeps one indicator stream per (symbol, timeframe), saved here
+STREAM_STATE_DIR = Path(__file__).parent / "data" / "indicator_state"
+STREAM_OVERLAP_BARS = 3  # candles refetched before the last one so a resumed stream never misses a candle
+_streams = {}
+
 def adjust_timestamp(dt):
     """Adjust API timestamps by subtracting the timestamp offset."""
     if timestamp_offset is not None:
@@ -69,14 +89,9 @@ def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
                         timestamp_offset = latest_api_timestamp - expected_latest_timestamp
                         print(f"⏱️ Calculated timestamp offset: {timestamp_offset}")
 
-                    # Adjust timestamps
-                    for candle in snapshot_data:
-                        dt = datetime.utcfromtimestamp(candle['t'] / 1000)
-                        adjusted_dt = adjust_timestamp(dt)
-                        candle['t'] = int(adjusted_dt.timestamp() * 1000)
-
-                    first_time = datetime.utcfromtimestamp(snapshot_data[0]['t'] / 1000)
-                    last_time = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
+                    # Timestamps stay raw here, _process_data_to_df applies the offset in one array op
+                    first_time = adjust_timestamp(datetime.utcfromtimestamp(snapshot_data[0]['t'] / 1000))
+                    last_time = adjust_timestamp(datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000))
                     print(f'✨ Received {len(snapshot_data)} candles')
                     print(f'📈 First: {first_time}')
                     print(f'📉 Last: {last_time}')
@@ -89,27 +104,37 @@ def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
             time.sleep(1)
     return None
 
+def _timestamp_offset_ms():
+    """Current timestamp offset as integer milliseconds"""
+    if timestamp_offset is None:
+        return 0
+    return int(timestamp_offset.total_seconds() * 1000)
+
+def _snapshot_arrays(snapshot_data):
+    """Raw candle dicts -> (int64 exchange timestamps, float64 OHLCV block)"""
+    raw = pd.DataFrame.from_records(snapshot_data, columns=['t', 'o', 'h', 'l', 'c', 'v'])
+    # API prices come back as strings, one C-level cast converts the whole block
+    return raw['t'].to_numpy(dtype=np.int64), raw[['o', 'h', 'l', 'c', 'v']].to_numpy(dtype=np.float64)
+
 def _process_data_to_df(snapshot_data):
-    """Convert raw API data to DataFrame"""
+    """Convert raw API data to DataFrame
+
+    Vectorized: the candle dicts are packed into NumPy arrays in one shot, the
+    timestamp offset is subtracted as an int64 array op and the frame is built
+    straight from those arrays, with no per-row Python objects.
+    """
     if snapshot_data:
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        data = []
-        for snapshot in snapshot_data:
-            timestamp = datetime.utcfromtimestamp(snapshot['t'] / 1000)
-            # Convert all numeric values to float
-            data.append([
-                timestamp,
-                float(snapshot['o']),
-                float(snapshot['h']),
-                float(snapshot['l']),
-                float(snapshot['c']),
-                float(snapshot['v'])
-            ])
-        df = pd.DataFrame(data, columns=columns)
-        
-        # Ensure numeric columns are float64
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].astype('float64')
+        t, ohlcv = _snapshot_arrays(snapshot_data)
+        t = t - _timestamp_offset_ms()
+
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(t, unit='ms'),
+            'open': ohlcv[:, 0],
+            'high': ohlcv[:, 1],
+            'low': ohlcv[:, 2],
+            'close': ohlcv[:, 3],
+            'volume': ohlcv[:, 4],
+        })
         
         print("\n📊 OHLCV Data Types:")
         print(df.dtypes)
@@ -129,18 +154,8 @@ def add_technical_indicators(df):
         numeric_cols = ['open', 'high', 'low', 'close', 'volume']
         df[numeric_cols] = df[numeric_cols].astype('float64')
         
-        # Add basic indicators
-        df['sma_20'] = ta.sma(df['close'], length=20)
-        df['sma_50'] = ta.sma(df['close'], length=50)
-        df['rsi'] = ta.rsi(df['close'], length=14)
-        
-        # Add MACD
-        macd = ta.macd(df['close'])
-        df = pd.concat([df, macd], axis=1)
-        
-        # Add Bollinger Bands
-        bbands = ta.bbands(df['close'])
-        df = pd.concat([df, bbands], axis=1)
+        # SMA 20/50, RSI, MACD and Bollinger Bands in one vectorized pass
+        df = hyperliquid_indicators().apply(df, column='close')
         
         print("✅ Technical indicators added successfully")
         return df
@@ -150,225 +165,66 @@ def add_technical_indicators(df):
         traceback.print_exc()
         return df
 
-def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
-    """
-    🌙 Moon Dev's Hyperliquid Data Fetcher
-    
-    Args:
-        symbol (str): Trading pair symbol (e.g., 'BTC', 'ETH')
-        timeframe (str): Candle timeframe (default: '15m')
-        bars (int): Number of bars to fetch (default: 100, max: 5000)
-        add_indicators (bool): Whether to add technical indicators
-    
-    Returns:
-        pd.DataFrame: OHLCV data with columns [timestamp, open, high, low, close, volume]
-                     and technical indicators if requested
-    """
-    print("\n🌙 Moon Dev's Hyperliquid Data Fetcher")
-    print(f"🎯 Symbol: {symbol}")
-    print(f"⏰ Timeframe: {timeframe}")
-    print(f"📊 Requested bars: {min(bars, MAX_ROWS)}")
+def _stream_path(symbol, timeframe):
+    return STREAM_STATE_DIR / f"{symbol}_{timeframe}.json"
 
-    # Ensure we don't exceed max rows
-    bars = min(bars, MAX_ROWS)
-    
-    # Calculate time window
+def _get_stream(symbol, timeframe, bars):
+    """In-memory stream for symbol/timeframe, resumed from disk on first use"""
+    global timestamp_offset
+    key = (symbol, timeframe)
+    stream = _streams.get(key)
+    if stream is None:
+        stream = IndicatorStream(hyperliquid_indicators(), history=bars)
+        try:
+            if stream.load(_stream_path(symbol, timeframe)):
+                print(f"♻️ Resumed {symbol} {timeframe} indicator state ({len(stream.rows)} candles)")
+        except (ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring saved indicator state for {symbol} {timeframe}: {str(e)}")
+            stream = IndicatorStream(hyperliquid_indicators(), history=bars)
+        _streams[key] = stream
+
+    # Reuse the offset the saved candles were stamped with so timestamps line up
+    if timestamp_offset is None and 'timestamp_offset' in stream.meta:
+        timestamp_offset = timedelta(seconds=stream.meta['timestamp_offset'])
+    if bars > stream.history:
+        stream.history = bars
+        stream.last_timestamp = None  # need a longer window, so prime again
+    return stream
+
+def _get_streaming_data(symbol, timeframe, bars):
+    """Advance the symbol/timeframe stream by its newly closed candles"""
+    stream = _get_stream(symbol, timeframe, bars)
     end_time = datetime.utcnow()
-    # Add extra time to ensure we get enough bars
-    start_time = end_time - timedelta(days=60)
 
-    data = _get_ohlcv(symbol, timeframe, start_time, end_time, batch_size=bars)
-    
-    if not data:
-        print("❌ No data available.")
-        return pd.DataFrame()
-
-    df = _process_data_to_df(data)
-
-    if not df.empty:
-        # Get the most recent bars
-        df = df.sort_values('timestamp', ascending=False).head(bars).sort_values('timestamp')
-        df = df.reset_index(drop=True)
-        
-        # Add technical indicators if requested
-        if add_indicators:
-            df = add_technical_indicators(df)
-
-        print("\n📊 Data summary:")
-        print(f"📈 Total candles: {len(df)}")
-        print(f"📅 Range: {df['timestamp'].min()} to {df['timestamp'].max()}")
-        print("✨ Thanks for using Moon Dev's Data Fetcher! ✨")
-
-    return df
-
-def get_market_info():
-    """Get current market info for all coins on Hyperliquid"""
-    try:
-        response = requests.post(
-            BASE_URL,
-            headers={'Content-Type': 'application/json'},
-            json={"type": "allMids"}
+    if stream.last_timestamp is not None:
+        # Only the candles since our last closed one (back in exchange time), plus a few bars of overlap
+        last_exchange_ms = stream.last_timestamp + _timestamp_offset_ms()
+        start_time = datetime.utcfromtimestamp(
+            (last_exchange_ms - STREAM_OVERLAP_BARS * INTERVAL_MS[timeframe]) / 1000
         )
-        
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception as e:
-        print(f"❌ Error getting market info: {str(e)}")
-        return None 
-'''
-nice functions from hyper liquid i can use
-
-🌙 Moon Dev's Hyperliquid Functions
-Built with love by Moon Dev 🚀
-'''
-
-import pandas as pd
-import requests
-from datetime import datetime, timedelta
-import numpy as np
-import time
-import pandas_ta as ta  # For technical indicators
-import traceback
-
-# Constants
-BATCH_SIZE = 5000  # MAX IS 5000 FOR HYPERLIQUID
-MAX_RETRIES = 3
-MAX_ROWS = 5000
-BASE_URL = 'https://api.hyperliquid.xyz/info'
+        data = _get_ohlcv(symbol, timeframe, start_time, end_time)
+        closed = _process_data_to_df(data).iloc[:-1]  # newest candle is still forming
+        if not closed.empty and closed['timestamp'].iloc[0] <= datetime.utcfromtimestamp(stream.last_timestamp / 1000):
+            added = stream.update(closed)
+            print(f"⚡ Streamed {added} new closed candles into {symbol} {timeframe} indicators")
+        else:
+            print(f"⚠️ Gap since last {symbol} {timeframe} candle, re-priming indicators")
+            stream.last_timestamp = None
 
-# Global variable to store timestamp offset
-timestamp_offset = None
+    if stream.last_timestamp is None:
+        start_time = end_time - timedelta(days=60)
+        data = _get_ohlcv(symbol, timeframe, start_time, end_time, batch_size=min(bars + 1, BATCH_SIZE))
+        df = _process_data_to_df(data)
+        if df.empty:
+            return df
+        stream.prime(df.sort_values('timestamp').iloc[:-1])
 
-def adjust_timestamp(dt):
-    """Adjust API timestamps by subtracting the timestamp offset."""
     if timestamp_offset is not None:
-        corrected_dt = dt - timestamp_offset
-        return corrected_dt
-    return dt
-
-def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
-    """Internal function to fetch OHLCV data from Hyperliquid"""
-    global timestamp_offset
-    print(f'\n🔍 Requesting data for {symbol}:')
-    print(f'📊 Batch Size: {batch_size}')
-    print(f'🚀 Start: {start_time.strftime("%Y-%m-%d %H:%M:%S")} UTC')
-    print(f'🎯 End: {end_time.strftime("%Y-%m-%d %H:%M:%S")} UTC')
-
-    start_ts = int(start_time.timestamp() * 1000)
-    end_ts = int(end_time.timestamp() * 1000)
-
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.post(
-                BASE_URL,
-                headers={'Content-Type': 'application/json'},
-                json={
-                    "type": "candleSnapshot",
-                    "req": {
-                        "coin": symbol,
-                        "interval": interval,
-                        "startTime": start_ts,
-                        "endTime": end_ts,
-                        "limit": batch_size
-                    }
-                },
-                timeout=10
-            )
+        stream.meta['timestamp_offset'] = timestamp_offset.total_seconds()
+    stream.save(_stream_path(symbol, timeframe))
+    return stream.frame().tail(bars).reset_index(drop=True)
 
-            if response.status_code == 200:
-                snapshot_data = response.json()
-                if snapshot_data:
-                    # Handle timestamp offset
-                    if timestamp_offset is None:
-                        latest_api_timestamp = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
-                        system_current_date = datetime.utcnow()
-                        expected_latest_timestamp = system_current_date
-                        timestamp_offset = latest_api_timestamp - expected_latest_timestamp
-                        print(f"⏱️ Calculated timestamp offset: {timestamp_offset}")
-
-                    # Adjust timestamps
-                    for candle in snapshot_data:
-                        dt = datetime.utcfromtimestamp(candle['t'] / 1000)
-                        adjusted_dt = adjust_timestamp(dt)
-                        candle['t'] = int(adjusted_dt.timestamp() * 1000)
-
-                    first_time = datetime.utcfromtimestamp(snapshot_data[0]['t'] / 1000)
-                    last_time = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
-                    print(f'✨ Received {len(snapshot_data)} candles')
-                    print(f'📈 First: {first_time}')
-                    print(f'📉 Last: {last_time}')
-                    return snapshot_data
-                print('❌ No data returned by API')
-                return None
-            print(f'⚠️ HTTP Error {response.status_code}: {response.text}')
-        except requests.exceptions.RequestException as e:
-            print(f'⚠️ Request failed (attempt {attempt + 1}): {e}')
-            time.sleep(1)
-    return None
-
-def _process_data_to_df(snapshot_data):
-    """Convert raw API data to DataFrame"""
-    if snapshot_data:
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        data = []
-        for snapshot in snapshot_data:
-            timestamp = datetime.utcfromtimestamp(snapshot['t'] / 1000)
-            # Convert all numeric values to float
-            data.append([
-                timestamp,
-                float(snapshot['o']),
-                float(snapshot['h']),
-                float(snapshot['l']),
-                float(snapshot['c']),
-                float(snapshot['v'])
-            ])
-        df = pd.DataFrame(data, columns=columns)
-        
-        # Ensure numeric columns are float64
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].astype('float64')
-        
-        print("\n📊 OHLCV Data Types:")
-        print(df.dtypes)
-        
-        return df
-    return pd.DataFrame()
-
-def add_technical_indicators(df):
-    """Add technical indicators to the dataframe"""
-    if df.empty:
-        return df
-        
-    try:
-        print("\n🔧 Adding technical indicators...")
-        
-        # Ensure numeric columns are float64
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].astype('float64')
-        
-        # Add basic indicators
-        df['sma_20'] = ta.sma(df['close'], length=20)
-        df['sma_50'] = ta.sma(df['close'], length=50)
-        df['rsi'] = ta.rsi(df['close'], length=14)
-        
-        # Add MACD
-        macd = ta.macd(df['close'])
-        df = pd.concat([df, macd], axis=1)
-        
-        # Add Bollinger Bands
-        bbands = ta.bbands(df['close'])
-        df = pd.concat([df, bbands], axis=1)
-        
-        print("✅ Technical indicators added successfully")
-        return df
-        
-    except Exception as e:
-        print(f"❌ Error adding technical indicators: {str(e)}")
-        traceback.print_exc()
-        return df
-
-def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
+def get_data(symbol, timeframe='15m', bars=100, add_indicators=True, streaming=False):
     """
     🌙 Moon Dev's Hyperliquid Data Fetcher
     
@@ -377,6 +233,9 @@ def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
         timeframe (str): Candle timeframe (default: '15m')
         bars (int): Number of bars to fetch (default: 100, max: 5000)
         add_indicators (bool): Whether to add technical indicators
+        streaming (bool): Keep indicator state between calls and only process
+                          newly closed candles. Returns closed candles with
+                          indicators, and resumes from disk after a restart.
     
     Returns:
         pd.DataFrame: OHLCV data with columns [timestamp, open, high, low, close, volume]
@@ -389,6 +248,9 @@ def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
 
     # Ensure we don't exceed max rows
     bars = min(bars, MAX_ROWS)
+
+    if streaming:
+        return _get_streaming_data(symbol, timeframe, bars)
     
     # Calculate time window
     end_time = datetime.utcnow()
@@ -419,6 +281,118 @@ def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
 
     return df
 
+def _fetch_candle_window(symbol, interval, start_ms, end_ms):
+    """One rate-limited candleSnapshot request, raw exchange timestamps"""
+    # http_post owns the retries (MAX_RETRIES attempts in total), each one through the limiter
+    response = http_post(
+        BASE_URL,
+        json={
+            "type": "candleSnapshot",
+            "req": {"coin": symbol, "interval": interval, "startTime": start_ms, "endTime": end_ms},
+        },
+        max_retries=MAX_RETRIES - 1,
+        limiter=hyperliquid_limiter,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"candleSnapshot failed for {symbol} {interval} window starting {start_ms} (HTTP {response.status_code})"
+        )
+    return response.json() or []
+
+def _backfill_windows(start_ms, end_ms, interval_ms, window_bars=BATCH_SIZE):
+    """Split [start_ms, end_ms] into request windows of at most window_bars candles"""
+    span = interval_ms * window_bars
+    return [(lo, min(lo + span - 1, end_ms)) for lo in range(start_ms, end_ms + 1, span)]
+
+def _missing_ranges(t, start_ms, end_ms, interval_ms, refresh_last):
+    """[lo, hi] ranges of [start_ms, end_ms] with no stored candle, found from the interval spacing"""
+    if len(t) == 0:
+        return [(start_ms, end_ms)]
+    ranges = []
+    if start_ms < t[0]:
+        ranges.append((start_ms, int(t[0]) - 1))
+    # Any step wider than one interval is a hole, e.g. a window that failed on an earlier run
+    holes = np.flatnonzero(np.diff(t) > interval_ms)
+    ranges.extend((int(t[i]) + interval_ms, int(t[i + 1]) - 1) for i in holes)
+    # The newest stored candle may have been stored while it was still forming
+    tail_start = int(t[-1]) if refresh_last else int(t[-1]) + interval_ms
+    if tail_start <= end_ms:
+        ranges.append((tail_start, end_ms))
+    return ranges
+
+def backfill_candles(symbol, timeframe, start_time, end_time=None, max_workers=BACKFILL_WORKERS, store=candle_store):
+    """
+    🌙 Moon Dev's Hyperliquid Backfill
+
+    Fetches [start_time, end_time] (UTC datetimes) in parallel windows of
+    BATCH_SIZE candles and merges them into the local candle store under
+    (symbol, timeframe). Ranges already in the store are skipped, except the
+    newest stored candle which is refreshed in case it was still forming.
+    Holes in the stored range (windows that failed before) are fetched again.
+    Hyperliquid only serves the most recent candles, so once a request comes
+    back short of its start, that floor is recorded and never asked for again.
+
+    Returns:
+        int: Number of new candles written
+    """
+    if timeframe not in INTERVAL_MS:
+        raise ValueError(f"Unsupported Hyperliquid timeframe: {timeframe}")
+    interval_ms = INTERVAL_MS[timeframe]
+    start_ms = int(pd.Timestamp(start_time).value // 1_000_000) // interval_ms * interval_ms
+    end_ms = int(pd.Timestamp(end_time or datetime.utcnow()).value // 1_000_000)
+
+    # Only ask for what the store doesn't already cover, and nothing below the known floor
+    floor = store.history_start(symbol, timeframe)
+    fetch_from = start_ms if floor is None else max(start_ms, floor)
+    stored = np.asarray(store.read(symbol, timeframe, fetch_from, end_ms)['t'])
+    refresh_last = len(stored) > 0 and int(stored[-1]) == store.last_timestamp(symbol, timeframe)
+    ranges = _missing_ranges(stored, fetch_from, end_ms, interval_ms, refresh_last)
+    head_requested = len(stored) == 0 or fetch_from < stored[0]
+    windows = [w for lo, hi in ranges for w in _backfill_windows(lo, hi, interval_ms)]
+    if not windows:
+        return 0
+
+    print(f"\n🌊 Backfilling {symbol} {timeframe}: {len(windows)} windows on {max_workers} workers")
+    start = time.perf_counter()
+    candles = []
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_fetch_candle_window, symbol, timeframe, lo, hi): (lo, hi) for lo, hi in windows}
+        for future in as_completed(futures):
+            try:
+                candles.extend(future.result())
+            except Exception as e:
+                failed += 1
+                print(f"❌ {str(e)}")
+    if failed:
+        print(f"⚠️ {failed}/{len(windows)} windows failed, the next backfill fetches the gaps again")
+
+    t, ohlcv = _snapshot_arrays(candles) if candles else (np.empty(0, dtype=np.int64), None)
+    if head_requested and not failed:
+        # Nothing returned near fetch_from means the exchange's history starts later
+        head = t if len(stored) == 0 else t[t < stored[0]]
+        earliest = int(head.min()) if len(head) else (int(stored[0]) if len(stored) else None)
+        if earliest is not None and earliest > fetch_from + interval_ms:
+            store.set_history_start(symbol, timeframe, earliest)
+            print(f"📌 Hyperliquid has no {symbol} {timeframe} candles before {pd.Timestamp(earliest, unit='ms')}")
+
+    if not candles:
+        print("❌ No candles returned by backfill")
+        return 0
+
+    # store.write sorts and de-duplicates on timestamp (windows can overlap at the edges)
+    records = records_from_columns(t, *ohlcv.T)
+    added = store.write(symbol, timeframe, records)
+    print(f"💾 Stored {added} new {symbol} {timeframe} candles in {time.perf_counter() - start:.1f}s")
+    return added
+
+def get_history(symbol, timeframe, start_time, end_time=None, store=candle_store):
+    """Backfill if needed, then return [start_time, end_time] from the candle store"""
+    backfill_candles(symbol, timeframe, start_time, end_time, store=store)
+    start_ms = int(pd.Timestamp(start_time).value // 1_000_000)
+    end_ms = None if end_time is None else int(pd.Timestamp(end_time).value // 1_000_000)
+    return store.to_frame(symbol, timeframe, start_ms, end_ms).drop(columns=['t'])
+
 def get_market_info():
     """Get current market info for all coins on Hyperliquid"""
     try:
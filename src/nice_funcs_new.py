@@ -26,6 +26,7 @@ from solders.transaction import VersionedTransaction
 from solana.rpc.api import Client
 import base64
 from solana.rpc.types import TxOpts, TokenAccountOpts
+from src.http_client import http_get, http_post, get_solana_client, get_keypair
 
 # Load environment variables
 load_dotenv()
@@ -36,8 +37,8 @@ RPC_ENDPOINT = os.getenv("RPC_ENDPOINT")
 if not RPC_ENDPOINT:
     raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
 
-# Initialize Solana client
-solana_client = Client(RPC_ENDPOINT)
+# Shared Solana client (pooled connection, built once per process)
+solana_client = get_solana_client(RPC_ENDPOINT)
 
 # CoinGecko API base URL
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
@@ -79,7 +80,7 @@ def token_price(token_id):
     """Fetch the current price of a token using CoinGecko API."""
     url = f"{COINGECKO_BASE_URL}/simple/price"
     params = {"ids": token_id, "vs_currencies": "usd"}
-    response = requests.get(url, params=params)
+    response = http_get(url, params=params)
     if response.status_code == 200:
         price_data = response.json()
         return price_data.get(token_id, {}).get("usd", None)
@@ -95,7 +96,7 @@ def token_security_info(address):
         "method": "getTokenSecurity",
         "params": [address],
     }
-    response = requests.post(RPC_ENDPOINT, json=payload)
+    response = http_post(RPC_ENDPOINT, json=payload)
     if response.status_code == 200:
         security_data = response.json().get("result", {})
         print_pretty_json(security_data)
@@ -110,7 +111,7 @@ def token_creation_info(address):
         "method": "getTokenMint",
         "params": [address],
     }
-    response = requests.post(RPC_ENDPOINT, json=payload)
+    response = http_post(RPC_ENDPOINT, json=payload)
     if response.status_code == 200:
         creation_data = response.json().get("result", {})
         print_pretty_json(creation_data)
@@ -136,7 +137,7 @@ def token_overview(address):
             "method": "getTokenSecurity",
             "params": [address],
         }
-        security_response = requests.post(RPC_ENDPOINT, json=payload_security)
+        security_response = http_post(RPC_ENDPOINT, json=payload_security)
         if security_response.status_code == 200:
             security_data = security_response.json().get('result', {})
             result['security'] = security_data
@@ -148,7 +149,7 @@ def token_overview(address):
             "method": "getTokenMint",
             "params": [address],
         }
-        creation_response = requests.post(RPC_ENDPOINT, json=payload_creation)
+        creation_response = http_post(RPC_ENDPOINT, json=payload_creation)
         if creation_response.status_code == 200:
             creation_data = creation_response.json().get('result', {})
             result['creation'] = creation_data
@@ -185,21 +186,16 @@ def token_overview(address):
 
 # Market Functions
 def market_buy(token, amount, slippage):
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
-        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
+    KEY = get_keypair()
     
     QUOTE_TOKEN = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    
-    if not http_client:
-        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
+    http_client = solana_client
 
-    quote = requests.get(
+    quote = http_get(
         f"https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={slippage}"
     ).json()
 
-    txRes = requests.post(
+    txRes = http_post(
         "https://quote-api.jup.ag/v6/swap",
         headers={"Content-Type": "application/json"},
         data=json.dumps({
@@ -216,21 +212,16 @@ def market_buy(token, amount, slippage):
     print(f"https://solscan.io/tx/{str(txId)}")
 
 def market_sell(QUOTE_TOKEN, amount, slippage):
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
-        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
+    KEY = get_keypair()
     
     token = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    
-    if not http_client:
-        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
+    http_client = solana_client
 
-    quote = requests.get(
+    quote = http_get(
         f"https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={slippage}"
     ).json()
 
-    txRes = requests.post(
+    txRes = http_post(
         "https://quote-api.jup.ag/v6/swap",
         headers={"Content-Type": "application/json"},
         data=json.dumps({
@@ -0,0 +1,195 @@
+"""
+🌙 Moon Dev's Agent Scheduler
+Per-agent cadences, concurrent runs and risk-first priority
+Built with love by Moon Dev 🚀
+
+Every agent is a job with its own interval. Priority jobs (the risk agent)
+run on a dedicated thread, so they never queue behind a slow LLM call. The
+other jobs run on daemon threads, at most max_workers at a time, so a job
+stuck in an LLM call never blocks shutdown. While a priority job is running, no new
+regular job is started, and long-running jobs can call `yield_to_priority()`
+between steps to pause for it. Each run records its duration and how late it
+started versus its schedule.
+
+A priority job runs while holding `risk_lock`, and every swap takes the same
+lock before it goes out. An order that is already in flight finishes before
+a risk check starts, and no order starts during one. On shutdown the risk
+thread (not a daemon) finishes its current run, and run_forever takes
+`risk_lock` and keeps it, so an order in flight settles and no daemon job
+starts another before the process exits.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict
+from termcolor import cprint
+
+ERROR_RETRY_SECONDS = 60  # Retry a failed job after this long instead of its full interval
+
+# Held by priority jobs while they run and by order execution (re-entrant, so
+# the risk agent can still place its own closing orders)
+risk_lock = threading.RLock()
+
+
+@dataclass
+class JobStats:
+    """Run timings for one job"""
+    runs: int = 0
+    errors: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lateness: float = 0.0
+    max_lateness: float = 0.0
+
+    @property
+    def avg_duration(self) -> float:
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+@dataclass
+class AgentJob:
+    """An agent callable and its cadence"""
+    name: str
+    run: Callable[[], None]
+    interval: float  # seconds
+    priority: bool = False
+    next_run: float = field(default_factory=time.monotonic)
+    running: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+
+
+class AgentScheduler:
+    """Runs agent jobs on their own cadences, priority jobs first"""
+
+    def __init__(self, max_workers=3, tick=1.0):
+        self.max_workers = max_workers
+        self.tick = tick
+        self.jobs: Dict[str, AgentJob] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._priority_idle = threading.Event()
+        self._priority_idle.set()
+        self._priority_running = 0
+
+    def add(self, name, run, interval_minutes, priority=False):
+        """Register a job, first run is immediate"""
+        self.jobs[name] = AgentJob(name, run, interval_minutes * 60, priority)
+
+    def yield_to_priority(self, timeout=None):
+        """Block while a priority job is running (call between steps of long jobs)"""
+        return self._priority_idle.wait(timeout)
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _execute(self, job):
+        """Run one job and record duration, lateness and the next due time"""
+        start = time.monotonic()
+        lateness = max(0.0, start - job.next_run)
+        try:
+            job.run()
+            failed = False
+        except Exception as e:
+            cprint(f"\n❌ Error running {job.name} agent: {str(e)}", "red")
+            failed = True
+        duration = time.monotonic() - start
+
+        with self._lock:
+            stats = job.stats
+            stats.runs += 1
+            stats.errors += failed
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
+            stats.total_duration += duration
+            stats.last_lateness = lateness
+            stats.max_lateness = max(stats.max_lateness, lateness)
+
+            # Fixed rate: keep the cadence anchored to the schedule, but never
+            # burst through missed runs if a job overran its interval
+            now = time.monotonic()
+            if failed:
+                job.next_run = now + min(job.interval, ERROR_RETRY_SECONDS)
+            else:
+                job.next_run = max(job.next_run + job.interval, now)
+            job.running = False
+
+        cprint(f"⏱️ {job.name} finished in {duration:.1f}s (started {lateness:.1f}s late)", "cyan")
+        self._wake.set()
+
+    def _priority_loop(self, job):
+        """Dedicated thread for a priority job, so it keeps its interval"""
+        while not self._stop.is_set():
+            delay = job.next_run - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            with self._lock:
+                job.running = True
+                self._priority_running += 1
+                self._priority_idle.clear()
+            try:
+                with risk_lock:
+                    self._execute(job)
+            finally:
+                with self._lock:
+                    self._priority_running -= 1
+                    if self._priority_running == 0:
+                        self._priority_idle.set()
+                self._wake.set()
+
+    def _priority_due(self, now):
+        return any(job.priority and job.next_run <= now for job in self.jobs.values())
+
+    def run_forever(self):
+        """Start priority threads, then dispatch regular jobs until stop() or Ctrl+C
+
+        Once this returns no further orders can go out in this process.
+        """
+        priority_threads = [
+            threading.Thread(target=self._priority_loop, args=(job,), name=f"agent-{job.name}")
+            for job in self.jobs.values() if job.priority
+        ]
+        for thread in priority_threads:
+            thread.start()
+
+        regular = [job for job in self.jobs.values() if not job.priority]
+        try:
+            while not self._stop.is_set():
+                self._wake.clear()
+                now = time.monotonic()
+                # Priority work preempts: nothing new starts while risk is due or running
+                if self._priority_idle.is_set() and not self._priority_due(now):
+                    with self._lock:
+                        free = max(1, self.max_workers) - sum(job.running for job in regular)
+                        due = [job for job in regular if not job.running and job.next_run <= now][:max(free, 0)]
+                        for job in due:
+                            job.running = True
+                    for job in due:
+                        # Daemon, so a job stuck in an LLM call can't hold up exit
+                        threading.Thread(target=self._execute, args=(job,), name=f"agent-{job.name}", daemon=True).start()
+
+                upcoming = [job.next_run for job in regular if not job.running]
+                delay = min(upcoming) - time.monotonic() if upcoming else self.tick
+                self._wake.wait(self.tick if delay <= 0 else min(delay, self.tick))
+        finally:
+            self._stop.set()
+            # Let a running risk check finish instead of killing it mid-order
+            for thread in priority_threads:
+                thread.join()
+            # Wait for any order in flight, then hold the lock so none starts before exit
+            risk_lock.acquire()
+
+    def report(self):
+        """Per-agent timing table"""
+        cprint("\n📊 Agent scheduler timings", "white", "on_blue")
+        for job in self.jobs.values():
+            s = job.stats
+            flag = "🛡️" if job.priority else "  "
+            print(
+                f"  {flag} {job.name:10} runs {s.runs:4} | errors {s.errors:3} | avg {s.avg_duration:6.1f}s"
+                f" | max {s.max_duration:6.1f}s | late {s.last_lateness:5.1f}s (max {s.max_lateness:5.1f}s)"
+            )
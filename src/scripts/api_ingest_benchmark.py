@@ -0,0 +1,96 @@
+'''
+🌙 Moon Dev's API Ingest Benchmark
+Compares the old save-then-read CSV path with streaming ingestion
+
+For every endpoint, each measurement runs in a fresh interpreter so peak RSS
+belongs to that one download:
+- before: response.content written to disk, then pd.read_csv on the file
+- after: MoonDevAPI streaming parse into a cold cache (background cache write)
+- arrow: the same as after, returned as a pyarrow Table (skipped without pyarrow)
+
+Times include the download, so run it a few times and compare medians.
+Run from the project root: python src/scripts/api_ingest_benchmark.py [endpoints...]
+'''
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RUNS = 3  # Fresh interpreters per measurement
+DEFAULT_ENDPOINTS = ["liq_data.csv", "funding.csv", "oi.csv", "oi_total.csv", "new_token_addresses.csv"]
+LIMITS = {"liq_data.csv": 10000}  # Same limit the agents use
+
+SETUP = """
+import resource, tempfile, time
+from pathlib import Path
+from src.agents.api import MoonDevAPI
+api = MoonDevAPI()
+api.base_dir = Path(tempfile.mkdtemp())  # Cold cache for every run
+filename, limit = {filename!r}, {limit!r}
+url = f"{{api.base_url}}/files/{{filename}}" + (f"?limit={{limit}}" if limit else "")
+"""
+
+BEFORE_SNIPPET = SETUP + """
+import pandas as pd
+start = time.perf_counter()
+response = api.session.get(url, headers=api.headers)
+response.raise_for_status()
+path = api.base_dir / filename
+path.write_bytes(response.content)
+rows = len(pd.read_csv(path))
+"""
+
+AFTER_SNIPPET = SETUP + """
+start = time.perf_counter()
+data = api._fetch_csv(filename, limit=limit, as_arrow={as_arrow!r})
+rows = data.num_rows if {as_arrow!r} else len(data)
+"""
+
+REPORT = """
+elapsed = time.perf_counter() - start
+print(rows, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def run_snippet(snippet):
+    """Run code in a fresh interpreter and return the last line it printed"""
+    result = subprocess.run(
+        [sys.executable, "-c", snippet + REPORT], cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output")
+    return lines[-1]
+
+def measure(label, snippet):
+    times, rss = [], []
+    rows = 0
+    for _ in range(RUNS):
+        rows, elapsed, maxrss = run_snippet(snippet).split()
+        times.append(float(elapsed))
+        rss.append(int(maxrss) / 1024)  # ru_maxrss is KB on Linux
+    print(
+        f"  {label:7} rows {int(rows):8} | median {statistics.median(times) * 1000:8.1f} ms"
+        f" | peak RSS {statistics.median(rss):7.1f} MB"
+    )
+
+def benchmark(filename):
+    print(f"📊 {filename}")
+    params = dict(filename=filename, limit=LIMITS.get(filename))
+    measure("before", BEFORE_SNIPPET.format(**params))
+    measure("after", AFTER_SNIPPET.format(as_arrow=False, **params))
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("  arrow   skipped, pyarrow not installed")
+        return
+    measure("arrow", AFTER_SNIPPET.format(as_arrow=True, **params))
+
+if __name__ == "__main__":
+    print(f"🌙 Moon Dev's API ingest benchmark ({RUNS} fresh interpreters each)")
+    for filename in sys.argv[1:] or DEFAULT_ENDPOINTS:
+        try:
+            benchmark(filename)
+        except Exception as e:
+            print(f"❌ {filename} error: {str(e)}")
@@ -0,0 +1,81 @@
+'''
+🌙 Moon Dev's Model Startup Benchmark
+Measures agent cold start cost from the model layer
+
+Each measurement runs in a fresh interpreter, so nothing is already imported:
+- import: `from src.models import model_factory`
+- first get_model: import of the provider SDK plus client construction
+- cached get_model: the same call again
+
+Run from the project root: python src/scripts/model_startup_benchmark.py [model types...]
+'''
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RUNS = 5  # Fresh interpreters per measurement
+DEFAULT_TYPES = ["ollama", "openai", "claude", "groq", "gemini", "deepseek"]
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+from src.models import model_factory
+print(time.perf_counter() - start)
+"""
+
+GET_MODEL_SNIPPET = """
+import time
+from src.models import model_factory
+if not model_factory.is_configured({model_type!r}):
+    print("skip")
+    raise SystemExit
+start = time.perf_counter()
+model = model_factory.get_model({model_type!r})
+first = time.perf_counter() - start
+start = time.perf_counter()
+model_factory.get_model({model_type!r})
+print(first if model else "failed", time.perf_counter() - start)
+"""
+
+def run_snippet(snippet):
+    """Run code in a fresh interpreter and return the last line it printed"""
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output")
+    return lines[-1]
+
+def benchmark_import():
+    times = [float(run_snippet(IMPORT_SNIPPET)) for _ in range(RUNS)]
+    print(f"📦 import src.models: median {statistics.median(times) * 1000:7.1f} ms | max {max(times) * 1000:7.1f} ms")
+
+def benchmark_get_model(model_type):
+    firsts, cached = [], []
+    for _ in range(RUNS):
+        out = run_snippet(GET_MODEL_SNIPPET.format(model_type=model_type)).split()
+        if out[0] == "skip":
+            print(f"⏭️ {model_type:8} not configured")
+            return
+        if out[0] == "failed":
+            print(f"❌ {model_type:8} failed to initialize")
+            return
+        firsts.append(float(out[0]))
+        cached.append(float(out[1]))
+    print(
+        f"🤖 {model_type:8} first get_model: median {statistics.median(firsts) * 1000:7.1f} ms"
+        f" | cached {statistics.median(cached) * 1000:6.3f} ms"
+    )
+
+if __name__ == "__main__":
+    print(f"🌙 Moon Dev's model startup benchmark ({RUNS} fresh interpreters each)")
+    benchmark_import()
+    for model_type in sys.argv[1:] or DEFAULT_TYPES:
+        try:
+            benchmark_get_model(model_type)
+        except Exception as e:
+            print(f"❌ {model_type:8} error: {str(e)}")
@@ -1,4 +1,5 @@
 from src.strategies.base_strategy import BaseStrategy
+from src.data.indicators import IndicatorEngine, SMA
 from pycoingecko import CoinGeckoAPI
 import pandas as pd
 import time
@@ -46,9 +47,11 @@ class RealExampleStrategy(BaseStrategy):
         """
         Calculate the short and long period moving averages.
         """
-        df['short_ma'] = df['close'].rolling(window=self.short_ma_period).mean()
-        df['long_ma'] = df['close'].rolling(window=self.long_ma_period).mean()
-        return df
+        engine = IndicatorEngine([
+            SMA(self.short_ma_period, name='short_ma'),
+            SMA(self.long_ma_period, name='long_ma'),
+        ])
+        return engine.apply(df, column='close')
     
     def generate_signals(self) -> dict:
         """
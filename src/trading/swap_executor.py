@@ -0,0 +1,222 @@
+"""
+🌙 Moon Dev's Swap Executor
+Pipelined Jupiter execution for chunked entries and exits
+Built with love by Moon Dev 🚀
+
+Every chunk runs quote -> swap build -> sign -> send on its own worker, so
+chunk 2 is quoting while chunk 1 is being submitted. Once everything is
+sent, all signatures are confirmed together by polling
+getSignatureStatuses instead of sleeping for a fixed time.
+
+Equal chunks can come back from Jupiter as byte-identical transactions under
+the same blockhash, which the cluster drops as duplicates. A chunk whose
+signature was already sent in the batch is re-signed under a newer blockhash.
+"""
+
+import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+from solana.rpc.types import TxOpts
+from termcolor import cprint
+from src.config import PRIORITY_FEE, SWAP_CONFIRM_TIMEOUT, SWAP_CONFIRM_POLL_SECONDS, SWAP_PIPELINE_WORKERS
+from src.http_client import http_get, http_post, get_solana_client, get_keypair
+from src.scheduler import risk_lock
+
+JUPITER_QUOTE_URL = "https://quote-api.jup.ag/v6/quote"
+JUPITER_SWAP_URL = "https://quote-api.jup.ag/v6/swap"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def get_quote(input_mint, output_mint, amount, slippage):
+    """Jupiter quote for swapping amount (base units) of input_mint"""
+    quote = http_get(
+        JUPITER_QUOTE_URL,
+        params={
+            "inputMint": input_mint,
+            "outputMint": output_mint,
+            "amount": int(amount),
+            "slippageBps": slippage,
+        },
+    ).json()
+    if "error" in quote:
+        raise ValueError(f"Jupiter quote error: {quote['error']}")
+    return quote
+
+
+def build_signed_swap(quote, keypair=None):
+    """Ask Jupiter for the swap transaction and sign it with our keypair"""
+    keypair = keypair or get_keypair()
+    tx_res = http_post(
+        JUPITER_SWAP_URL,
+        json={
+            "quoteResponse": quote,
+            "userPublicKey": str(keypair.pubkey()),
+            "prioritizationFeeLamports": PRIORITY_FEE,
+        },
+    ).json()
+    if "swapTransaction" not in tx_res:
+        raise ValueError(f"Jupiter swap error: {tx_res.get('error', tx_res)}")
+
+    unsigned = VersionedTransaction.from_bytes(base64.b64decode(tx_res["swapTransaction"]))
+    return VersionedTransaction(unsigned.message, [keypair])
+
+
+def send_transaction(tx, client=None):
+    """Submit a signed transaction, returns its signature"""
+    client = client or get_solana_client()
+    return client.send_raw_transaction(bytes(tx), TxOpts(skip_preflight=True)).value
+
+
+@dataclass
+class ChunkFill:
+    """Outcome and timings of one chunk"""
+    index: int
+    input_mint: str
+    output_mint: str
+    amount: int
+    status: str = "pending"  # pending -> sent -> confirmed | failed | timeout | error
+    signature: Optional[object] = None
+    out_amount: Optional[int] = None
+    error: Optional[str] = None
+    quote_latency: float = 0.0
+    submit_latency: float = 0.0
+    confirm_latency: float = 0.0
+
+    @property
+    def total_latency(self) -> float:
+        return self.quote_latency + self.submit_latency + self.confirm_latency
+
+    @property
+    def confirmed(self) -> bool:
+        return self.status == "confirmed"
+
+
+class SwapExecutor:
+    """Runs a list of chunk swaps as a quote/sign/send pipeline, then confirms them"""
+
+    def __init__(self, client=None, keypair=None, max_workers=SWAP_PIPELINE_WORKERS,
+                 confirm_timeout=SWAP_CONFIRM_TIMEOUT, poll_interval=SWAP_CONFIRM_POLL_SECONDS):
+        self._client = client
+        self._keypair = keypair
+        self.max_workers = max_workers
+        self.confirm_timeout = confirm_timeout
+        self.poll_interval = poll_interval
+        self.fills: List[ChunkFill] = []
+        self._sent = set()
+        self._sent_lock = threading.Lock()
+
+    @property
+    def client(self):
+        return self._client or get_solana_client()
+
+    @property
+    def keypair(self):
+        return self._keypair or get_keypair()
+
+    def buy(self, token, usdc_amounts, slippage):
+        """Buy token with each USDC chunk (base units)"""
+        return self.execute(USDC_MINT, token, usdc_amounts, slippage)
+
+    def sell(self, token, token_amounts, slippage):
+        """Sell each chunk of token (base units) into USDC"""
+        return self.execute(token, USDC_MINT, token_amounts, slippage)
+
+    def execute(self, input_mint, output_mint, amounts, slippage):
+        """Pipeline every chunk, wait for confirmations and return the fills"""
+        fills = [
+            ChunkFill(i, input_mint, output_mint, int(amount))
+            for i, amount in enumerate(amounts)
+            if int(amount) > 0
+        ]
+        self.fills = fills
+        self._sent = set()
+        if not fills:
+            return fills
+
+        # Wait out a running risk check, and hold it off until this order settles
+        with risk_lock:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(fills)))) as pool:
+                list(pool.map(lambda fill: self._submit(fill, slippage), fills))
+
+            self._confirm([fill for fill in fills if fill.status == "sent"])
+        self._report(fills)
+        return fills
+
+    def _submit(self, fill, slippage):
+        """Quote, sign and send one chunk"""
+        try:
+            start = time.perf_counter()
+            quote = get_quote(fill.input_mint, fill.output_mint, fill.amount, slippage)
+            fill.out_amount = int(quote.get("outAmount", 0))
+            fill.quote_latency = time.perf_counter() - start
+
+            start = time.perf_counter()
+            tx = self._distinct(build_signed_swap(quote, self.keypair))
+            fill.signature = send_transaction(tx, self.client)
+            fill.submit_latency = time.perf_counter() - start
+            fill.status = "sent"
+            print(f"https://solscan.io/tx/{str(fill.signature)}")
+        except Exception as e:
+            fill.status = "error"
+            fill.error = str(e)
+            cprint(f"❌ Chunk {fill.index + 1} failed before confirmation: {str(e)}", "white", "on_red")
+
+    def _distinct(self, tx):
+        """Re-sign tx under a newer blockhash until no other chunk in the batch has its signature"""
+        deadline = time.perf_counter() + self.confirm_timeout
+        while True:
+            with self._sent_lock:
+                signature = tx.signatures[0]
+                if signature not in self._sent:
+                    self._sent.add(signature)
+                    return tx
+            if not isinstance(tx.message, MessageV0) or time.perf_counter() > deadline:
+                raise RuntimeError("duplicate chunk transaction, no fresh blockhash to re-sign it")
+
+            message = tx.message
+            blockhash = self.client.get_latest_blockhash().value.blockhash
+            if blockhash == message.recent_blockhash:
+                time.sleep(self.poll_interval)  # Same slot window, wait for the next blockhash
+                continue
+            message = MessageV0(message.header, message.account_keys, blockhash,
+                                message.instructions, message.address_table_lookups)
+            tx = VersionedTransaction(message, [self.keypair])
+
+    def _confirm(self, pending):
+        """Poll signature statuses for all sent chunks until confirmed or timed out"""
+        start = time.perf_counter()
+        while pending and time.perf_counter() - start < self.confirm_timeout:
+            statuses = self.client.get_signature_statuses([fill.signature for fill in pending]).value
+            still_pending = []
+            for fill, status in zip(pending, statuses):
+                confirmation = str(getattr(status, "confirmation_status", "") or "").lower()
+                if status is None or not confirmation or "processed" in confirmation:
+                    still_pending.append(fill)
+                    continue
+                fill.confirm_latency = time.perf_counter() - start
+                if status.err is not None:
+                    fill.status = "failed"
+                    fill.error = str(status.err)
+                else:
+                    fill.status = "confirmed"
+            pending = still_pending
+            if pending:
+                time.sleep(self.poll_interval)
+
+        for fill in pending:
+            fill.status = "timeout"
+            fill.confirm_latency = time.perf_counter() - start
+
+    def _report(self, fills):
+        confirmed = sum(fill.confirmed for fill in fills)
+        cprint(f"📬 {confirmed}/{len(fills)} chunks confirmed", "white", "on_blue")
+        for fill in fills:
+            print(
+                f"  • Chunk {fill.index + 1}: {fill.status:9} | quote {fill.quote_latency:.2f}s"
+                f" | submit {fill.submit_latency:.2f}s | confirm {fill.confirm_latency:.2f}s"
+            )